@@ -3,6 +3,7 @@ This file contains the main class of the project. It processes streams of events
 by invoking the rest of the system components.
 """
 from base.DataFormatter import DataFormatter
+from misc import DefaultConfig
 from parallel.EvaluationManagerFactory import EvaluationManagerFactory
 from parallel.ParallelExecutionParameters import ParallelExecutionParameters
 from stream.Stream import InputStream, OutputStream
@@ -31,14 +32,25 @@ class CEP:
                                                                                        eval_mechanism_params,
                                                                                        parallel_execution_params)
 
-    def run(self, events: InputStream, matches: OutputStream, data_formatter: DataFormatter):
+    def run(self, events: InputStream, matches: OutputStream, data_formatter: DataFormatter,
+            use_thread_safe_streams: bool = DefaultConfig.USE_THREAD_SAFE_STREAMS):
         """
         Applies the evaluation mechanism to detect the predefined patterns in a given stream of events.
         Returns the total time elapsed during evaluation.
+        Thread safety of the input and output streams can only be disabled if no other thread accesses them during
+        the evaluation, e.g., when the input stream is fully populated in advance. The original modes of the streams
+        are restored once the evaluation is over.
         """
-        start = datetime.now()
-        self.__evaluation_manager.eval(events, matches, data_formatter)
-        return (datetime.now() - start).total_seconds()
+        is_events_thread_safe, is_matches_thread_safe = events.is_thread_safe(), matches.is_thread_safe()
+        events.set_thread_safety(use_thread_safe_streams)
+        matches.set_thread_safety(use_thread_safe_streams)
+        try:
+            start = datetime.now()
+            self.__evaluation_manager.eval(events, matches, data_formatter)
+            return (datetime.now() - start).total_seconds()
+        finally:
+            events.set_thread_safety(is_events_thread_safe)
+            matches.set_thread_safety(is_matches_thread_safe)
 
     def get_pattern_match(self):
         """
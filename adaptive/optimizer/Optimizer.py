@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+
+from adaptive.optimizer.TreePlanCache import TreePlanCache
 from base import Pattern
 from misc import DefaultConfig
 from plan import TreePlanBuilder
@@ -11,9 +13,11 @@ class Optimizer(ABC):
     """
     The base class for the optimizers that decide when to invoke plan reconstruction.
     """
-    def __init__(self, tree_plan_builder: TreePlanBuilder, is_adaptivity_enabled: bool):
+    def __init__(self, tree_plan_builder: TreePlanBuilder, is_adaptivity_enabled: bool,
+                 tree_plan_cache: TreePlanCache = None):
         self._tree_plan_builder = tree_plan_builder
         self.__is_adaptivity_enabled = is_adaptivity_enabled
+        self.__tree_plan_cache = tree_plan_cache
 
     @abstractmethod
     def should_optimize(self, new_statistics: dict, pattern: Pattern):
@@ -51,6 +55,18 @@ class Optimizer(ABC):
             initial_tree_plan = self.build_new_plan(initial_statistics, pattern)
         return initial_tree_plan
 
+    def _build_tree_plan(self, new_statistics: dict, pattern: Pattern):
+        """
+        Builds a tree plan using the tree plan builder, unless a plan for similar statistics is found in the cache.
+        """
+        if self.__tree_plan_cache is None:
+            return self._tree_plan_builder.build_tree_plan(pattern, new_statistics)
+        tree_plan = self.__tree_plan_cache.get_tree_plan(pattern, new_statistics, self._tree_plan_builder)
+        if tree_plan is None:
+            tree_plan = self._tree_plan_builder.build_tree_plan(pattern, new_statistics)
+            self.__tree_plan_cache.add_tree_plan(pattern, new_statistics, self._tree_plan_builder, tree_plan)
+        return tree_plan
+
     @staticmethod
     def _build_non_prior_tree_plan_builder(cost_model_type: TreeCostModels, pattern: Pattern):
         """
@@ -75,7 +91,7 @@ class TrivialOptimizer(Optimizer):
         return True
 
     def build_new_plan(self, new_statistics: dict, pattern: Pattern):
-        tree_plan = self._tree_plan_builder.build_tree_plan(pattern, new_statistics)
+        tree_plan = self._build_tree_plan(new_statistics, pattern)
         return tree_plan
 
 
@@ -84,8 +100,8 @@ class StatisticsDeviationAwareOptimizer(Optimizer):
     Represents an optimizer that monitors statistics deviations from their latest observed values.
     """
     def __init__(self, tree_plan_builder: TreePlanBuilder, is_adaptivity_enabled: bool,
-                 type_to_deviation_aware_functions_map: dict):
-        super().__init__(tree_plan_builder, is_adaptivity_enabled)
+                 type_to_deviation_aware_functions_map: dict, tree_plan_cache: TreePlanCache = None):
+        super().__init__(tree_plan_builder, is_adaptivity_enabled, tree_plan_cache)
         self.__prev_statistics = None
         self.__type_to_deviation_aware_tester_map = type_to_deviation_aware_functions_map
 
@@ -98,7 +114,7 @@ class StatisticsDeviationAwareOptimizer(Optimizer):
 
     def build_new_plan(self, new_statistics: dict, pattern: Pattern):
         self.__prev_statistics = new_statistics
-        tree_plan = self._tree_plan_builder.build_tree_plan(pattern, new_statistics)
+        tree_plan = self._build_tree_plan(new_statistics, pattern)
         return tree_plan
 
 
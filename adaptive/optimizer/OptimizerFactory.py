@@ -5,6 +5,7 @@ from misc import DefaultConfig
 from adaptive.statistics.StatisticsTypes import StatisticsTypes
 from adaptive.optimizer import Optimizer
 from adaptive.optimizer.DeviationAwareTesterFactory import DeviationAwareTesterFactory
+from adaptive.optimizer.TreePlanCache import TreePlanCacheParameters, TreePlanCache
 from plan.invariant.InvariantTreePlanBuilder import InvariantTreePlanBuilder
 from plan.TreePlanBuilderFactory import TreePlanBuilderParameters, TreePlanBuilderFactory
 from plan.TreePlanBuilderTypes import TreePlanBuilderTypes
@@ -17,11 +18,16 @@ class OptimizerParameters:
     def __init__(self, opt_type: OptimizerTypes = DefaultConfig.DEFAULT_OPTIMIZER_TYPE,
                  tree_plan_params: TreePlanBuilderParameters = TreePlanBuilderParameters(),
                  statistics_collector_params: StatisticsCollectorParameters = StatisticsCollectorParameters(),
-                 statistics_updates_wait_time: timedelta = DefaultConfig.STATISTICS_UPDATES_WAIT_TIME):
+                 statistics_updates_wait_time: timedelta = DefaultConfig.STATISTICS_UPDATES_WAIT_TIME,
+                 asynchronous_reoptimization: bool = DefaultConfig.ASYNCHRONOUS_REOPTIMIZATION,
+                 tree_plan_cache_params: TreePlanCacheParameters = None):
         self.type = opt_type
         self.tree_plan_params = tree_plan_params
         self.statistics_collector_params = statistics_collector_params
         self.statistics_updates_time_window = statistics_updates_wait_time  # None disabled any adaptive functionality
+        # if enabled, new plans are built by a background worker while the events keep being processed
+        self.asynchronous_reoptimization = asynchronous_reoptimization
+        self.tree_plan_cache_params = tree_plan_cache_params  # None disables the caching of tree plans
 
 
 class TrivialOptimizerParameters(OptimizerParameters):
@@ -30,9 +36,11 @@ class TrivialOptimizerParameters(OptimizerParameters):
     """
     def __init__(self, tree_plan_params: TreePlanBuilderParameters = TreePlanBuilderParameters(),
                  statistics_collector_params: StatisticsCollectorParameters = StatisticsCollectorParameters(),
-                 statistics_updates_wait_time: timedelta = DefaultConfig.STATISTICS_UPDATES_WAIT_TIME):
-        super().__init__(OptimizerTypes.TRIVIAL_OPTIMIZER, tree_plan_params,
-                         statistics_collector_params, statistics_updates_wait_time)
+                 statistics_updates_wait_time: timedelta = DefaultConfig.STATISTICS_UPDATES_WAIT_TIME,
+                 asynchronous_reoptimization: bool = DefaultConfig.ASYNCHRONOUS_REOPTIMIZATION,
+                 tree_plan_cache_params: TreePlanCacheParameters = None):
+        super().__init__(OptimizerTypes.TRIVIAL_OPTIMIZER, tree_plan_params, statistics_collector_params,
+                         statistics_updates_wait_time, asynchronous_reoptimization, tree_plan_cache_params)
 
 
 class StatisticsDeviationAwareOptimizerParameters(OptimizerParameters):
@@ -42,9 +50,12 @@ class StatisticsDeviationAwareOptimizerParameters(OptimizerParameters):
     def __init__(self, tree_plan_params: TreePlanBuilderParameters = TreePlanBuilderParameters(),
                  statistics_collector_params: StatisticsCollectorParameters = StatisticsCollectorParameters(),
                  statistics_updates_wait_time: timedelta = DefaultConfig.STATISTICS_UPDATES_WAIT_TIME,
-                 deviation_threshold: float = DefaultConfig.DEVIATION_OPTIMIZER_THRESHOLD):
+                 deviation_threshold: float = DefaultConfig.DEVIATION_OPTIMIZER_THRESHOLD,
+                 asynchronous_reoptimization: bool = DefaultConfig.ASYNCHRONOUS_REOPTIMIZATION,
+                 tree_plan_cache_params: TreePlanCacheParameters = None):
         super().__init__(OptimizerTypes.STATISTICS_DEVIATION_AWARE_OPTIMIZER, tree_plan_params,
-                         statistics_collector_params, statistics_updates_wait_time)
+                         statistics_collector_params, statistics_updates_wait_time, asynchronous_reoptimization,
+                         tree_plan_cache_params)
         statistics_types = statistics_collector_params.statistics_types
         if isinstance(statistics_types, StatisticsTypes):
             statistics_types = [statistics_types]
@@ -58,9 +69,10 @@ class InvariantsAwareOptimizerParameters(OptimizerParameters):
     """
     def __init__(self, tree_plan_params: TreePlanBuilderParameters = TreePlanBuilderParameters(TreePlanBuilderTypes.INVARIANT_AWARE_GREEDY_LEFT_DEEP_TREE),
                  statistics_collector_params: StatisticsCollectorParameters = StatisticsCollectorParameters(),
-                 statistics_updates_wait_time: timedelta = DefaultConfig.STATISTICS_UPDATES_WAIT_TIME):
+                 statistics_updates_wait_time: timedelta = DefaultConfig.STATISTICS_UPDATES_WAIT_TIME,
+                 asynchronous_reoptimization: bool = DefaultConfig.ASYNCHRONOUS_REOPTIMIZATION):
         super().__init__(OptimizerTypes.INVARIANT_AWARE_OPTIMIZER, tree_plan_params,
-                         statistics_collector_params, statistics_updates_wait_time)
+                         statistics_collector_params, statistics_updates_wait_time, asynchronous_reoptimization)
 
 
 class OptimizerFactory:
@@ -77,8 +89,11 @@ class OptimizerFactory:
     def __create_optimizer(optimizer_parameters: OptimizerParameters):
         tree_plan_builder = TreePlanBuilderFactory.create_tree_plan_builder(optimizer_parameters.tree_plan_params)
         is_adaptivity_enabled = optimizer_parameters.statistics_updates_time_window is not None
+        tree_plan_cache = None
+        if optimizer_parameters.tree_plan_cache_params is not None:
+            tree_plan_cache = TreePlanCache(optimizer_parameters.tree_plan_cache_params)
         if optimizer_parameters.type == OptimizerTypes.TRIVIAL_OPTIMIZER:
-            return Optimizer.TrivialOptimizer(tree_plan_builder, is_adaptivity_enabled)
+            return Optimizer.TrivialOptimizer(tree_plan_builder, is_adaptivity_enabled, tree_plan_cache)
 
         if optimizer_parameters.type == OptimizerTypes.STATISTICS_DEVIATION_AWARE_OPTIMIZER:
             deviation_threshold = optimizer_parameters.deviation_threshold
@@ -89,9 +104,11 @@ class OptimizerFactory:
                 type_to_deviation_aware_tester_map[stat_type] = deviation_aware_tester
 
             return Optimizer.StatisticsDeviationAwareOptimizer(tree_plan_builder, is_adaptivity_enabled,
-                                                               type_to_deviation_aware_tester_map)
+                                                               type_to_deviation_aware_tester_map, tree_plan_cache)
 
         if optimizer_parameters.type == OptimizerTypes.INVARIANT_AWARE_OPTIMIZER:
+            if tree_plan_cache is not None:
+                raise Exception("Tree plan caching is not supported by the invariant-aware optimizer")
             if isinstance(tree_plan_builder, InvariantTreePlanBuilder):
                 return Optimizer.InvariantsAwareOptimizer(tree_plan_builder, is_adaptivity_enabled)
             else:
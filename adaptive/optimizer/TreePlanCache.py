@@ -0,0 +1,257 @@
+import hashlib
+import math
+import os
+import pickle
+from collections import OrderedDict
+from copy import deepcopy
+from datetime import datetime, timedelta
+from enum import Enum
+from functools import partial
+from types import FunctionType, CodeType, MethodType, BuiltinFunctionType, ModuleType
+from typing import Dict
+
+from base.Pattern import Pattern
+from condition.Condition import Condition
+from condition.CompositeCondition import AndCondition
+from misc import DefaultConfig
+from plan.TreePlan import TreePlan
+from plan.TreePlanBuilder import TreePlanBuilder
+
+
+class TreePlanCacheParameters:
+    """
+    Parameters for the creation of a tree plan cache.
+    """
+    def __init__(self, capacity: int = DefaultConfig.TREE_PLAN_CACHE_CAPACITY,
+                 statistics_quantization_base: float = DefaultConfig.TREE_PLAN_CACHE_STATISTICS_QUANTIZATION_BASE,
+                 file_path: str = DefaultConfig.TREE_PLAN_CACHE_FILE_PATH):
+        self.capacity = capacity
+        self.statistics_quantization_base = statistics_quantization_base
+        self.file_path = file_path  # None disables the persistence of the cache
+
+
+class TreePlanCache:
+    """
+    A least-recently-used cache of tree plans, allowing to skip the plan construction when a pattern is planned again
+    for statistics that were already seen. A plan is identified by a fingerprint of the pattern (its structure, time
+    window and condition), a fingerprint of the tree plan builder (its type and parameters) and the statistics. The
+    statistics values are quantized on a logarithmic scale, such that small fluctuations between consecutive statistics
+    measurements hit the same entry.
+    The fingerprints only depend on values that are identical across processes. If a pattern or a builder contains an
+    object that cannot be described this way, its plans are never cached.
+    If a file path is provided, the cache is loaded from this file on creation and stored to it on every update. The
+    conditions of the plans are not stored since they may contain arbitrary functions, and are instead reapplied from
+    the pattern when a loaded plan is first retrieved.
+    """
+    __STATISTICS_PRECISION = 12
+
+    def __init__(self, cache_params: TreePlanCacheParameters):
+        if cache_params.capacity is None or cache_params.capacity <= 0:
+            raise Exception("Invalid tree plan cache capacity: %s" % (cache_params.capacity,))
+        if cache_params.statistics_quantization_base <= 1:
+            raise Exception("Statistics quantization base must be greater than 1")
+        self.__capacity = cache_params.capacity
+        self.__log_quantization_base = math.log(cache_params.statistics_quantization_base)
+        self.__file_path = cache_params.file_path
+        # maps a cache key to a list containing the tree plan and whether its conditions must be reapplied
+        self.__entries = OrderedDict()
+        self.__fingerprints = {}
+        if self.__file_path is not None and os.path.isfile(self.__file_path):
+            self.__load()
+
+    def get_tree_plan(self, pattern: Pattern, statistics: Dict, tree_plan_builder: TreePlanBuilder):
+        """
+        Returns the cached tree plan for the given pattern, statistics and builder, or None if no such plan exists.
+        """
+        key = self.__get_key(pattern, statistics, tree_plan_builder)
+        if key is None:
+            return None
+        entry = self.__entries.get(key)
+        if entry is None:
+            return None
+        self.__entries.move_to_end(key)
+        tree_plan, is_condition_missing = entry
+        if is_condition_missing:
+            tree_plan.root.apply_condition(deepcopy(pattern.condition))
+            entry[1] = False
+        return tree_plan
+
+    def add_tree_plan(self, pattern: Pattern, statistics: Dict, tree_plan_builder: TreePlanBuilder,
+                      tree_plan: TreePlan):
+        """
+        Stores the given tree plan, evicting the least recently used plan if the cache is full.
+        """
+        key = self.__get_key(pattern, statistics, tree_plan_builder)
+        if key is None:
+            return
+        self.__entries[key] = [tree_plan, False]
+        self.__entries.move_to_end(key)
+        if len(self.__entries) > self.__capacity:
+            self.__entries.popitem(last=False)
+        if self.__file_path is not None:
+            self.__store()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __get_key(self, pattern: Pattern, statistics: Dict, tree_plan_builder: TreePlanBuilder):
+        """
+        Creates the cache key for the given pattern, statistics and builder, or returns None if the pattern or the
+        builder cannot be fingerprinted.
+        """
+        pattern_fingerprint = self.__get_fingerprint(pattern, TreePlanCache.__describe_pattern)
+        builder_fingerprint = self.__get_fingerprint(tree_plan_builder, TreePlanCache.__describe_object)
+        if pattern_fingerprint is None or builder_fingerprint is None:
+            return None
+        quantized_statistics = None if statistics is None else \
+            tuple(sorted((statistics_type.name, self.__quantize(value)) for statistics_type, value in statistics.items()))
+        return pattern_fingerprint, builder_fingerprint, quantized_statistics
+
+    def __quantize(self, value):
+        """
+        Maps the given statistics value to the index of its logarithmic bucket. Non-positive values, such as zero
+        arrival rates, are kept as is.
+        """
+        if isinstance(value, (list, tuple)):
+            return tuple(self.__quantize(item) for item in value)
+        if value <= 0:
+            return value
+        # rounding the logarithm first prevents values lying exactly on a bucket boundary from being split
+        return math.floor(round(math.log(value) / self.__log_quantization_base, self.__STATISTICS_PRECISION))
+
+    def __get_fingerprint(self, obj, describe: callable):
+        """
+        Returns a digest of the description of the given pattern or builder, or None if it cannot be described.
+        The fingerprint is calculated once per object, as patterns and builders are not modified after their creation.
+        The object itself is kept alongside it, such that the identifier of a released object is never reused while
+        the cache holds it.
+        """
+        cached_fingerprint = self.__fingerprints.get(id(obj))
+        if cached_fingerprint is not None:
+            return cached_fingerprint[1]
+        try:
+            fingerprint = hashlib.sha256(describe(obj).encode()).hexdigest()
+        except _IndescribableObjectError:
+            fingerprint = None
+        self.__fingerprints[id(obj)] = (obj, fingerprint)
+        return fingerprint
+
+    @staticmethod
+    def __describe_pattern(pattern: Pattern):
+        """
+        Returns a textual description of the structure, the time window and the condition of the given pattern.
+        """
+        return "%s|%s|%s" % (pattern.full_structure, pattern.window.total_seconds(),
+                             TreePlanCache.__describe(pattern.condition))
+
+    @staticmethod
+    def __describe_object(obj, described_objects: set = None):
+        """
+        Returns a textual description of an arbitrary object consisting of its type and the descriptions of its
+        attributes.
+        """
+        if not hasattr(obj, "__dict__"):
+            raise _IndescribableObjectError()
+        if described_objects is None:
+            described_objects = set()
+        if id(obj) in described_objects:
+            # a reference cycle
+            raise _IndescribableObjectError()
+        described_objects.add(id(obj))
+        attributes = ",".join("%s=%s" % (name, TreePlanCache.__describe(value, described_objects))
+                              for name, value in sorted(vars(obj).items())
+                              if name not in ("_statistics_collector", "_statistics_id"))
+        described_objects.remove(id(obj))
+        return "%s.%s(%s)" % (type(obj).__module__, type(obj).__qualname__, attributes)
+
+    @staticmethod
+    def __describe(obj, described_objects: set = None):
+        """
+        Returns a textual description of the given value which does not depend on the memory layout of the process.
+        Functions are described by their bytecode, constants, referenced names and captured values, and other objects
+        by their type and attributes. An exception is raised for values that cannot be described this way.
+        """
+        if obj is None or isinstance(obj, (bool, int, float, complex, str)):
+            return repr(obj)
+        if isinstance(obj, bytes):
+            return "bytes(%s)" % (obj.hex(),)
+        if isinstance(obj, Enum):
+            return str(obj)
+        if isinstance(obj, (datetime, timedelta)):
+            return repr(obj)
+        if isinstance(obj, (list, tuple)):
+            return "[%s]" % (",".join(TreePlanCache.__describe(item, described_objects) for item in obj),)
+        if isinstance(obj, (set, frozenset)):
+            return "{%s}" % (",".join(sorted(TreePlanCache.__describe(item, described_objects) for item in obj)),)
+        if isinstance(obj, dict):
+            return "{%s}" % (",".join(sorted("%s:%s" % (TreePlanCache.__describe(key, described_objects),
+                                                        TreePlanCache.__describe(value, described_objects))
+                                             for key, value in obj.items())),)
+        if isinstance(obj, FunctionType):
+            closure = [] if obj.__closure__ is None else [cell.cell_contents for cell in obj.__closure__]
+            return "function(%s,%s,%s,%s)" % (TreePlanCache.__describe(obj.__code__, described_objects),
+                                              TreePlanCache.__describe(obj.__defaults__, described_objects),
+                                              TreePlanCache.__describe(obj.__kwdefaults__, described_objects),
+                                              TreePlanCache.__describe(closure, described_objects))
+        if isinstance(obj, CodeType):
+            return "code(%s,%s,%s)" % (obj.co_code.hex(), ",".join(obj.co_names),
+                                       TreePlanCache.__describe(obj.co_consts, described_objects))
+        if isinstance(obj, partial):
+            return "partial(%s,%s,%s)" % (TreePlanCache.__describe(obj.func, described_objects),
+                                          TreePlanCache.__describe(obj.args, described_objects),
+                                          TreePlanCache.__describe(obj.keywords, described_objects))
+        if isinstance(obj, MethodType):
+            return "method(%s,%s)" % (TreePlanCache.__describe(obj.__func__, described_objects),
+                                      TreePlanCache.__describe(obj.__self__, described_objects))
+        if isinstance(obj, type):
+            return "%s.%s" % (obj.__module__, obj.__qualname__)
+        if isinstance(obj, BuiltinFunctionType):
+            if obj.__self__ is None or isinstance(obj.__self__, ModuleType):
+                return "%s.%s" % (obj.__module__, obj.__qualname__)
+            return "method(%s,%s)" % (obj.__qualname__, TreePlanCache.__describe(obj.__self__, described_objects))
+        return TreePlanCache.__describe_object(obj, described_objects)
+
+    def __load(self):
+        """
+        Loads the cache contents from the file.
+        """
+        with open(self.__file_path, "rb") as cache_file:
+            entries = _TreePlanUnpickler(cache_file).load()
+        for key, tree_plan in entries:
+            self.__entries[key] = [tree_plan, True]
+        while len(self.__entries) > self.__capacity:
+            self.__entries.popitem(last=False)
+
+    def __store(self):
+        """
+        Stores the cache contents to the file. The file is replaced atomically to never leave a partial cache behind.
+        """
+        temp_file_path = "%s.tmp" % (self.__file_path,)
+        with open(temp_file_path, "wb") as cache_file:
+            _TreePlanPickler(cache_file).dump([(key, tree_plan) for key, (tree_plan, _) in self.__entries.items()])
+        os.replace(temp_file_path, self.__file_path)
+
+
+class _IndescribableObjectError(Exception):
+    """
+    Raised when a value cannot be described independently of the memory layout of the process.
+    """
+    pass
+
+
+class _TreePlanPickler(pickle.Pickler):
+    """
+    Serializes tree plans while omitting the conditions of their nodes.
+    """
+    def persistent_id(self, obj):
+        return "condition" if isinstance(obj, Condition) else None
+
+
+class _TreePlanUnpickler(pickle.Unpickler):
+    """
+    Deserializes tree plans serialized by _TreePlanPickler, replacing the omitted conditions with empty ones.
+    """
+    def persistent_load(self, pid):
+        if pid != "condition":
+            raise pickle.UnpicklingError("Unknown persistent object: %s" % (pid,))
+        return AndCondition()
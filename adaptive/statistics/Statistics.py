@@ -1,18 +1,22 @@
 import copy
+import math
 from abc import ABC
-from datetime import timedelta, datetime
+from collections import deque
+from datetime import timedelta
 from typing import List
-from base.Event import Event
+from base.Event import Event, timedelta_to_nanoseconds
 from base.Pattern import Pattern
+from misc import DefaultConfig
 
 
-class StatisticEventData:
+class StatisticEventsBucket:
     """
-    A container class that contains the event type along with event timestamp
+    A container class that counts the events of each type arriving at the same (possibly rounded) timestamp, given in
+    nanoseconds since the epoch.
     """
-    def __init__(self, timestamp: datetime, event_type: str):
+    def __init__(self, timestamp: int):
         self.timestamp = timestamp
-        self.event_type = event_type
+        self.event_type_to_count = {}
 
 
 class Statistics(ABC):
@@ -32,12 +36,26 @@ class Statistics(ABC):
         """
         raise NotImplementedError()
 
+    def update_time(self, timestamp: int):
+        """
+        Notifies the statistics of the timestamp of the most recent event in the stream, given in nanoseconds since the
+        epoch. Statistics that do not depend on the time ignore this notification.
+        """
+        pass
+
 
 class ArrivalRatesStatistics(Statistics):
     """
     Represents the arrival rates statistics.
+    The arrivals within the time window are kept in a queue of buckets ordered by timestamp, such that the events
+    arriving at the same timestamp share a bucket and expire together. If a bucket size is specified, the timestamps are
+    rounded down to a multiple of it, bounding the number of buckets by the time window divided by the bucket size
+    regardless of the event rate, at the cost of expiring the events up to a single bucket size earlier. Otherwise, a
+    bucket is kept for every distinct timestamp within the time window, hence the memory consumption is only bounded by
+    the number of events arriving within the time window.
     """
-    def __init__(self, arrival_rates_time_window: timedelta, pattern: Pattern, predefined_statistics: List = None):
+    def __init__(self, arrival_rates_time_window: timedelta, pattern: Pattern, predefined_statistics: List = None,
+                 bucket_size: timedelta = DefaultConfig.ARRIVAL_RATES_BUCKET_SIZE):
         primitive_events = pattern.get_primitive_events()
         self.__arrival_rates = [0.0] * len(primitive_events) if not predefined_statistics else predefined_statistics
         self.__event_type_to_indices_map = {}
@@ -46,19 +64,24 @@ class ArrivalRatesStatistics(Statistics):
                 self.__event_type_to_indices_map[arg.type].append(i)
             else:
                 self.__event_type_to_indices_map[arg.type] = [i]
-        self.__events_arrival_time = []
-        self.__arrival_rates_time_window = arrival_rates_time_window
-        self.__last_timestamp = None
+        self.__arrival_buckets = deque()
+        self.__arrival_rates_time_window = timedelta_to_nanoseconds(arrival_rates_time_window)
+        self.__bucket_size = None if bucket_size is None else timedelta_to_nanoseconds(bucket_size)
 
     def update(self, event: Event):
         """
         Increases the arrival rate of the current event type by 1 and decreases the arrival rates of the expired events.
         """
         event_type = event.type
-        event_timestamp = event.timestamp
+        event_timestamp = event.timestamp_ns
 
         if event_type in self.__event_type_to_indices_map:
-            self.__events_arrival_time.append(StatisticEventData(event_timestamp, event_type))
+            bucket_timestamp = event_timestamp if self.__bucket_size is None else \
+                event_timestamp - event_timestamp % self.__bucket_size
+            if len(self.__arrival_buckets) == 0 or self.__arrival_buckets[-1].timestamp != bucket_timestamp:
+                self.__arrival_buckets.append(StatisticEventsBucket(bucket_timestamp))
+            event_type_to_count = self.__arrival_buckets[-1].event_type_to_count
+            event_type_to_count[event_type] = event_type_to_count.get(event_type, 0) + 1
 
             indices = self.__event_type_to_indices_map[event_type]
             for index in indices:
@@ -66,24 +89,16 @@ class ArrivalRatesStatistics(Statistics):
 
         self.__remove_expired_events(event_timestamp)
 
-    def __remove_expired_events(self, last_timestamp: datetime):
+    def __remove_expired_events(self, last_timestamp: int):
         """
         Lowers the arrival rates of the events that left the time window.
         """
-        is_removed_elements = False
-        for i, event_time in enumerate(self.__events_arrival_time):
-            if last_timestamp - event_time.timestamp > self.__arrival_rates_time_window:
-                indices = self.__event_type_to_indices_map[event_time.event_type]
-                for index in indices:
-                    self.__arrival_rates[index] -= 1
-
-            else:
-                is_removed_elements = True
-                self.__events_arrival_time = self.__events_arrival_time[i:]
-                break
-
-        if not is_removed_elements:
-            self.__events_arrival_time = []
+        while len(self.__arrival_buckets) > 0 and \
+                last_timestamp - self.__arrival_buckets[0].timestamp > self.__arrival_rates_time_window:
+            expired_bucket = self.__arrival_buckets.popleft()
+            for event_type, count in expired_bucket.event_type_to_count.items():
+                for index in self.__event_type_to_indices_map[event_type]:
+                    self.__arrival_rates[index] -= count
 
     def get_statistics(self):
         return copy.deepcopy(self.__arrival_rates)
@@ -92,15 +107,22 @@ class ArrivalRatesStatistics(Statistics):
 class SelectivityStatistics(Statistics):
     """
     Represents the selectivity statistics.
-    NOTE: Currently it ignores the time window
+    Each atomic condition of the pattern is assigned an integer ID indexing its evaluation counters, and only one out
+    of every sampling_rate evaluations of a condition is recorded.
+    This class weighs all recorded evaluations equally, ignoring the time window. The subclasses below override the way
+    the evaluations are counted in order to only consider the recent ones.
     """
-    # TODO: support time window for selectivity
-
-    def __init__(self, pattern: Pattern, predefined_statistics: List[List[float]] = None):
+    def __init__(self, pattern: Pattern, predefined_statistics: List[List[float]] = None,
+                 sampling_rate: int = DefaultConfig.SELECTIVITY_SAMPLING_RATE):
+        if sampling_rate < 1:
+            raise Exception("Invalid selectivity sampling rate: %s" % (sampling_rate,))
         self.__args = pattern.get_primitive_events()
         self.__args_len = len(self.__args)
-        self.__atomic_condition_to_total_map = {}
-        self.__atomic_condition_to_success_map = {}
+        self.__sampling_rate = sampling_rate
+        self._atomic_condition_totals = []
+        self._atomic_condition_successes = []
+        self.__atomic_condition_selectivities = []
+        self.__atomic_condition_evaluations_to_skip = []
         self.__indices_to_atomic_condition_map = {}
         self.__relevant_indices = set()
 
@@ -116,19 +138,29 @@ class SelectivityStatistics(Statistics):
         Updates the selectivity of an atomic condition.
         """
         (atomic_condition, is_condition_success) = data
+        atomic_condition_id = atomic_condition.get_statistics_id()
+        if atomic_condition_id is None:
+            return
+        if self.__atomic_condition_evaluations_to_skip[atomic_condition_id] > 0:
+            self.__atomic_condition_evaluations_to_skip[atomic_condition_id] -= 1
+            return
+        self.__atomic_condition_evaluations_to_skip[atomic_condition_id] = self.__sampling_rate - 1
+        self._record_evaluation(atomic_condition_id, is_condition_success)
 
-        if atomic_condition:
-            atomic_condition_id = str(atomic_condition)
-            if atomic_condition_id in self.__atomic_condition_to_total_map:
-                self.__atomic_condition_to_total_map[atomic_condition_id] += 1
-                if is_condition_success:
-                    self.__atomic_condition_to_success_map[atomic_condition_id] += 1
+    def _record_evaluation(self, atomic_condition_id: int, is_condition_success: bool):
+        """
+        Adds a single evaluation of the given atomic condition to its counters.
+        """
+        self._atomic_condition_totals[atomic_condition_id] += 1
+        if is_condition_success:
+            self._atomic_condition_successes[atomic_condition_id] += 1
 
     def get_statistics(self):
         """
         Calculates the value of cell (i, j) in the selectivity matrix by multiplying the atomic selectivities of
         all the conditions between event i and event j.
         If there is no condition between any pair of events then the selectivity is always 1.0
+        An atomic condition with no evaluations counted retains its last known selectivity.
         """
         for i, j in self.__relevant_indices:
             atomic_conditions_id = self.__indices_to_atomic_condition_map[(i, j)]
@@ -136,30 +168,147 @@ class SelectivityStatistics(Statistics):
             # computation of the (i, j), (j, i) entries in the selectivity matrix
             selectivity = 1.0
             for atomic_condition_id in atomic_conditions_id:
-                numerator = self.__atomic_condition_to_success_map[atomic_condition_id]
-                denominator = self.__atomic_condition_to_total_map[atomic_condition_id]
+                numerator = self._atomic_condition_successes[atomic_condition_id]
+                denominator = self._atomic_condition_totals[atomic_condition_id]
                 if denominator != 0.0:
-                    selectivity *= (numerator / denominator)
+                    self.__atomic_condition_selectivities[atomic_condition_id] = numerator / denominator
+                selectivity *= self.__atomic_condition_selectivities[atomic_condition_id]
 
-            self.__selectivity_matrix[j][i] = self.__selectivity_matrix[i][j] = copy.deepcopy(selectivity)
+            self.__selectivity_matrix[j][i] = self.__selectivity_matrix[i][j] = selectivity
 
         return copy.deepcopy(self.__selectivity_matrix)
 
+    def _get_atomic_conditions_number(self):
+        """
+        Returns the number of atomic conditions the selectivity is estimated for.
+        """
+        return len(self._atomic_condition_totals)
+
     def __init_maps(self, pattern: Pattern):
         """
-        Initiates the success counters and total evaluation counters for each pair of event types.
+        Assigns the IDs of the atomic conditions, allocates their success counters and total evaluation counters, and
+        maps each pair of event types to the conditions between them.
         """
+        atomic_conditions = pattern.condition.extract_atomic_conditions()
+        for atomic_condition_id, atomic_condition in enumerate(atomic_conditions):
+            atomic_condition.set_statistics_id(atomic_condition_id)
+        self._atomic_condition_totals = [0.0] * len(atomic_conditions)
+        self._atomic_condition_successes = [0.0] * len(atomic_conditions)
+        self.__atomic_condition_selectivities = [1.0] * len(atomic_conditions)
+        self.__atomic_condition_evaluations_to_skip = [0] * len(atomic_conditions)
+
         for i in range(self.__args_len):
             for j in range(i + 1):
                 conditions = pattern.condition.get_condition_of({self.__args[i].name, self.__args[j].name})
                 atomic_conditions = conditions.extract_atomic_conditions()
                 for atomic_condition in atomic_conditions:
                     if atomic_condition:
-                        atomic_condition_id = str(atomic_condition)
+                        atomic_condition_id = atomic_condition.get_statistics_id()
                         self.__relevant_indices.add((i, j))
-                        self.__atomic_condition_to_total_map[atomic_condition_id] = 0.0
-                        self.__atomic_condition_to_success_map[atomic_condition_id] = 0.0
                         if (i, j) in self.__indices_to_atomic_condition_map:
                             self.__indices_to_atomic_condition_map[(i, j)].append(atomic_condition_id)
                         else:
                             self.__indices_to_atomic_condition_map[(i, j)] = [atomic_condition_id]
+
+
+class SlidingWindowSelectivityStatistics(SelectivityStatistics):
+    """
+    Represents the selectivity statistics over the evaluations performed within the time window.
+    The time window is divided into a fixed number of buckets, each holding the counters of the evaluations performed
+    during its time span. The counters of the entire window are maintained as the sum of the buckets, and a bucket
+    leaving the window is subtracted from it. Hence, the window slides at the granularity of a single bucket.
+    """
+    def __init__(self, time_window: timedelta, pattern: Pattern, predefined_statistics: List[List[float]] = None,
+                 sampling_rate: int = DefaultConfig.SELECTIVITY_SAMPLING_RATE,
+                 buckets_number: int = DefaultConfig.SELECTIVITY_WINDOW_BUCKETS_NUMBER):
+        super().__init__(pattern, predefined_statistics, sampling_rate)
+        if buckets_number < 1:
+            raise Exception("Invalid number of selectivity window buckets: %s" % (buckets_number,))
+        atomic_conditions_number = self._get_atomic_conditions_number()
+        self.__bucket_time_span = timedelta_to_nanoseconds(time_window / buckets_number)
+        self.__bucket_totals = [[0.0] * atomic_conditions_number for _ in range(buckets_number)]
+        self.__bucket_successes = [[0.0] * atomic_conditions_number for _ in range(buckets_number)]
+        self.__current_bucket = 0
+        self.__current_bucket_end = None
+
+    def _record_evaluation(self, atomic_condition_id: int, is_condition_success: bool):
+        super()._record_evaluation(atomic_condition_id, is_condition_success)
+        self.__bucket_totals[self.__current_bucket][atomic_condition_id] += 1
+        if is_condition_success:
+            self.__bucket_successes[self.__current_bucket][atomic_condition_id] += 1
+
+    def update_time(self, timestamp: int):
+        """
+        Advances the window to the given timestamp, expiring the buckets that left it.
+        """
+        if self.__current_bucket_end is None:
+            self.__current_bucket_end = timestamp + self.__bucket_time_span
+            return
+        expired_buckets_number = 0
+        while timestamp >= self.__current_bucket_end and expired_buckets_number < len(self.__bucket_totals):
+            # the next bucket is the oldest one and it is emptied to count the evaluations from now on
+            self.__current_bucket = (self.__current_bucket + 1) % len(self.__bucket_totals)
+            self.__current_bucket_end += self.__bucket_time_span
+            self.__expire_bucket(self.__current_bucket)
+            expired_buckets_number += 1
+        if timestamp >= self.__current_bucket_end:
+            # the window was entirely skipped
+            self.__current_bucket_end = timestamp + self.__bucket_time_span
+
+    def __expire_bucket(self, bucket: int):
+        """
+        Subtracts the counters of the given bucket from the counters of the window and resets them.
+        """
+        bucket_totals, bucket_successes = self.__bucket_totals[bucket], self.__bucket_successes[bucket]
+        for atomic_condition_id in range(len(bucket_totals)):
+            self._atomic_condition_totals[atomic_condition_id] -= bucket_totals[atomic_condition_id]
+            self._atomic_condition_successes[atomic_condition_id] -= bucket_successes[atomic_condition_id]
+            bucket_totals[atomic_condition_id] = bucket_successes[atomic_condition_id] = 0.0
+
+
+class ExponentialDecaySelectivityStatistics(SelectivityStatistics):
+    """
+    Represents the selectivity statistics in which the weight of an evaluation decays exponentially with its age, such
+    that it is divided by e every time window.
+    Instead of decaying all the counters over time, the weight of new evaluations grows exponentially. As the
+    selectivity is a ratio between counters, this is equivalent and only requires rescaling the counters once the
+    weights become too large to be represented.
+    """
+    # the weight of new evaluations above which the counters are rescaled
+    __MAX_EVALUATION_WEIGHT = 1e100
+
+    def __init__(self, time_window: timedelta, pattern: Pattern, predefined_statistics: List[List[float]] = None,
+                 sampling_rate: int = DefaultConfig.SELECTIVITY_SAMPLING_RATE):
+        super().__init__(pattern, predefined_statistics, sampling_rate)
+        self.__time_window = timedelta_to_nanoseconds(time_window)
+        if self.__time_window <= 0:
+            raise Exception("Invalid selectivity decay time window: %s" % (time_window,))
+        self.__reference_timestamp = None
+        self.__evaluation_weight = 1.0
+
+    def _record_evaluation(self, atomic_condition_id: int, is_condition_success: bool):
+        self._atomic_condition_totals[atomic_condition_id] += self.__evaluation_weight
+        if is_condition_success:
+            self._atomic_condition_successes[atomic_condition_id] += self.__evaluation_weight
+
+    def update_time(self, timestamp: int):
+        """
+        Updates the weight of the evaluations performed from now on according to their distance from the reference time.
+        """
+        if self.__reference_timestamp is None:
+            self.__reference_timestamp = timestamp
+            return
+        exponent = (timestamp - self.__reference_timestamp) / self.__time_window
+        self.__evaluation_weight = math.exp(min(exponent, math.log(self.__MAX_EVALUATION_WEIGHT) + 1))
+        if self.__evaluation_weight > self.__MAX_EVALUATION_WEIGHT:
+            self.__rescale(timestamp)
+
+    def __rescale(self, timestamp: int):
+        """
+        Moves the reference time to the given timestamp, dividing the counters by the current evaluation weight.
+        """
+        for atomic_condition_id in range(self._get_atomic_conditions_number()):
+            self._atomic_condition_totals[atomic_condition_id] /= self.__evaluation_weight
+            self._atomic_condition_successes[atomic_condition_id] /= self.__evaluation_weight
+        self.__reference_timestamp = timestamp
+        self.__evaluation_weight = 1.0
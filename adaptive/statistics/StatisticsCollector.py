@@ -10,12 +10,21 @@ class StatisticsCollector:
     def __init__(self, statistics: dict):
         self.__statistics = statistics
 
+    def __deepcopy__(self, memo):
+        """
+        The statistics collector is shared by all copies of the conditions it is attached to, such that the statistics
+        are updated by the conditions of the evaluation tree rather than by their private copies.
+        """
+        return self
+
     def handle_event(self, event: Event):
         """
         Handles events directly from the stream.
-        Currently only arrival rates statistics handles the events
+        Currently only arrival rates statistics handles the events, while the rest are only notified of their time.
         """
         self.update_statistics_by_type(StatisticsTypes.ARRIVAL_RATES, event)
+        for statistics in self.__statistics.values():
+            statistics.update_time(event.timestamp_ns)
 
     def get_statistics(self):
         """
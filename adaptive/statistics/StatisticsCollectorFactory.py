@@ -2,7 +2,7 @@ from typing import List
 from datetime import timedelta
 from base.Pattern import Pattern
 from misc import DefaultConfig
-from adaptive.statistics.StatisticsTypes import StatisticsTypes
+from adaptive.statistics.StatisticsTypes import StatisticsTypes, SelectivityStatisticsTypes
 from adaptive.statistics.StatisticsCollector import StatisticsCollector
 from adaptive.statistics.StatisticsFactory import StatisticsFactory
 
@@ -12,11 +12,20 @@ class StatisticsCollectorParameters:
     Parameters for the statistics collector
     """
     def __init__(self, statistics_time_window: timedelta = DefaultConfig.STATISTICS_TIME_WINDOW,
-                 statistics_types: StatisticsTypes or List[StatisticsTypes] = DefaultConfig.DEFAULT_STATISTICS_TYPE):
+                 statistics_types: StatisticsTypes or List[StatisticsTypes] = DefaultConfig.DEFAULT_STATISTICS_TYPE,
+                 selectivity_sampling_rate: int = DefaultConfig.SELECTIVITY_SAMPLING_RATE,
+                 arrival_rates_bucket_size: timedelta = DefaultConfig.ARRIVAL_RATES_BUCKET_SIZE,
+                 selectivity_statistics_type: SelectivityStatisticsTypes = DefaultConfig.SELECTIVITY_STATISTICS_TYPE):
         if isinstance(statistics_types, StatisticsTypes):
             statistics_types = [statistics_types]
         self.statistics_types = statistics_types
         self.statistics_time_window = statistics_time_window
+        # only one out of every selectivity_sampling_rate evaluations of a condition updates its selectivity
+        self.selectivity_sampling_rate = selectivity_sampling_rate
+        # if specified, the arrival times are rounded down to a multiple of arrival_rates_bucket_size, bounding the memory
+        # of the arrival rates statistics regardless of the event rate
+        self.arrival_rates_bucket_size = arrival_rates_bucket_size
+        self.selectivity_statistics_type = selectivity_statistics_type
 
 
 class StatisticsCollectorFactory:
@@ -41,7 +50,10 @@ class StatisticsCollectorFactory:
         statistics_time_window = statistics_collector_parameters.statistics_time_window
         statistics_dict = {}
         for stat_type in statistics_collector_parameters.statistics_types:
-            stat = StatisticsFactory.create_statistics(pattern, stat_type, statistics_time_window)
+            stat = StatisticsFactory.create_statistics(pattern, stat_type, statistics_time_window,
+                                                       statistics_collector_parameters.selectivity_sampling_rate,
+                                                       statistics_collector_parameters.arrival_rates_bucket_size,
+                                                       statistics_collector_parameters.selectivity_statistics_type)
             statistics_dict[stat_type] = stat
         return StatisticsCollector(statistics_dict)
 
@@ -1,7 +1,9 @@
 from datetime import timedelta
 from base.Pattern import Pattern
-from adaptive.statistics.StatisticsTypes import StatisticsTypes
-from adaptive.statistics.Statistics import SelectivityStatistics, ArrivalRatesStatistics
+from misc import DefaultConfig
+from adaptive.statistics.StatisticsTypes import StatisticsTypes, SelectivityStatisticsTypes
+from adaptive.statistics.Statistics import SelectivityStatistics, ArrivalRatesStatistics, \
+    SlidingWindowSelectivityStatistics, ExponentialDecaySelectivityStatistics
 
 
 class StatisticsFactory:
@@ -10,13 +12,37 @@ class StatisticsFactory:
     """
 
     @staticmethod
-    def create_statistics(pattern: Pattern, stat_type: StatisticsTypes, statistics_time_window: timedelta):
+    def create_statistics(pattern: Pattern, stat_type: StatisticsTypes, statistics_time_window: timedelta,
+                          selectivity_sampling_rate: int = DefaultConfig.SELECTIVITY_SAMPLING_RATE,
+                          arrival_rates_bucket_size: timedelta = DefaultConfig.ARRIVAL_RATES_BUCKET_SIZE,
+                          selectivity_statistics_type: SelectivityStatisticsTypes =
+                          DefaultConfig.SELECTIVITY_STATISTICS_TYPE):
         predefined_statistics = None
         if pattern.statistics and stat_type in pattern.statistics:
             predefined_statistics = pattern.statistics[stat_type]
 
         if stat_type == StatisticsTypes.ARRIVAL_RATES:
-            return ArrivalRatesStatistics(statistics_time_window, pattern, predefined_statistics)
+            return ArrivalRatesStatistics(statistics_time_window, pattern, predefined_statistics,
+                                          arrival_rates_bucket_size)
         if stat_type == StatisticsTypes.SELECTIVITY_MATRIX:
-            return SelectivityStatistics(pattern, predefined_statistics)
+            return StatisticsFactory.__create_selectivity_statistics(pattern, selectivity_statistics_type,
+                                                                     statistics_time_window, predefined_statistics,
+                                                                     selectivity_sampling_rate)
         raise Exception("Unknown statistics type: %s" % (StatisticsTypes.stat_type,))
+
+    @staticmethod
+    def __create_selectivity_statistics(pattern: Pattern, selectivity_statistics_type: SelectivityStatisticsTypes,
+                                        statistics_time_window: timedelta, predefined_statistics,
+                                        selectivity_sampling_rate: int):
+        """
+        Creates the selectivity statistics according to the way the age of the evaluations should be handled.
+        """
+        if selectivity_statistics_type == SelectivityStatisticsTypes.CUMULATIVE:
+            return SelectivityStatistics(pattern, predefined_statistics, selectivity_sampling_rate)
+        if selectivity_statistics_type == SelectivityStatisticsTypes.SLIDING_WINDOW:
+            return SlidingWindowSelectivityStatistics(statistics_time_window, pattern, predefined_statistics,
+                                                      selectivity_sampling_rate)
+        if selectivity_statistics_type == SelectivityStatisticsTypes.EXPONENTIAL_DECAY:
+            return ExponentialDecaySelectivityStatistics(statistics_time_window, pattern, predefined_statistics,
+                                                         selectivity_sampling_rate)
+        raise Exception("Unknown selectivity statistics type: %s" % (selectivity_statistics_type,))
@@ -7,3 +7,12 @@ class StatisticsTypes(Enum):
     """
     ARRIVAL_RATES = 1
     SELECTIVITY_MATRIX = 2
+
+
+class SelectivityStatisticsTypes(Enum):
+    """
+    The ways to account for the time of the condition evaluations when estimating the selectivities.
+    """
+    CUMULATIVE = 0  # all evaluations since the beginning of the stream are equally weighted
+    SLIDING_WINDOW = 1  # only the evaluations within the statistics time window are considered
+    EXPONENTIAL_DECAY = 2  # the weight of an evaluation decays exponentially with its age
@@ -1,15 +1,49 @@
+from datetime import datetime, timedelta, timezone
+from itertools import count
 from base.DataFormatter import DataFormatter
 
 
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def datetime_to_nanoseconds(timestamp: datetime):
+    """
+    Converts the given datetime into the number of nanoseconds since the epoch. Timezone-aware datetimes are converted
+    to UTC.
+    """
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return (timestamp - _EPOCH) // _ONE_MICROSECOND * 1000
+
+
+def timedelta_to_nanoseconds(time_delta: timedelta):
+    """
+    Converts the given time interval into nanoseconds.
+    """
+    return time_delta // _ONE_MICROSECOND * 1000
+
+
+def nanoseconds_to_timedelta(nanoseconds: int):
+    """
+    Converts the given number of nanoseconds into a time interval.
+    """
+    return timedelta(microseconds=nanoseconds // 1000)
+
+
 class Event:
     """
     This class represents a single primitive event received from an input stream. It may contain arbitrary attributes
     of arbitrary types. The only requirement is that event type and timestamp of occurrence must be derivable from these
     attributes using an appropriate data formatter.
+    Besides the timestamp provided by the data formatter, the number of nanoseconds since the epoch is stored, which is
+    used for all time window calculations.
     """
+    __slots__ = ("payload", "type", "index", "timestamp", "timestamp_ns", "probability")
 
-    # used in order to assign a serial number to each event that enters the system
-    counter = 0
+    # used in order to assign a serial number to each event that enters the system - an atomic counter is used since
+    # events may be created concurrently by several parallel execution units
+    counter = count()
 
     INDEX_ATTRIBUTE_NAME = "InternalIndexAttributeName"
     HIDDEN_ATTRIBUTE_NAMES = [INDEX_ATTRIBUTE_NAME]
@@ -18,17 +52,19 @@ class Event:
         self.payload = data_formatter.parse_event(raw_data)
         self.type = data_formatter.get_event_type(self.payload)
         self.timestamp = data_formatter.get_event_timestamp(self.payload)
-        self.payload[Event.INDEX_ATTRIBUTE_NAME] = Event.counter
+        self.timestamp_ns = datetime_to_nanoseconds(self.timestamp)
+        self.index = next(Event.counter)
+        # the index is also kept in the payload to be accessible by conditions, e.g., the ones enforcing contiguity
+        self.payload[Event.INDEX_ATTRIBUTE_NAME] = self.index
         self.probability = data_formatter.get_probability(self.payload)
         if self.probability is not None and (self.probability < 0.0 or self.probability > 1.0):
             raise Exception("Invalid value for probability:%s" % (self.probability,))
-        Event.counter += 1
 
     def __eq__(self, other):
-        return self.payload[Event.INDEX_ATTRIBUTE_NAME] == other.payload[Event.INDEX_ATTRIBUTE_NAME]
+        return self.index == other.index
 
     def __hash__(self):
-        return hash(self.payload[Event.INDEX_ATTRIBUTE_NAME])
+        return hash(self.index)
 
     def __repr__(self):
         result = ""
@@ -0,0 +1,119 @@
+from typing import Callable, Dict, List
+
+
+class LazyEventPayload(dict):
+    """
+    An event payload whose attributes are only converted from their raw string values when they are first accessed.
+    The payload is created from the raw values of a data item split into columns, where the name and the converter of
+    each column are given by a fixed schema shared by all payloads of a data formatter. This way, the payload of an
+    event that is discarded after its type and timestamp were inspected is never fully built.
+    Accessing an attribute by its key only converts this attribute. Any operation that requires the entire payload,
+    such as iterating over it or comparing it to another dictionary, converts all the remaining attributes and
+    arranges them in the order of the schema, followed by the attributes that were added to the payload directly.
+    """
+    __slots__ = ("__column_indices", "__column_converters", "__raw_values", "__is_materialized")
+
+    def __init__(self, column_indices: Dict[str, int], column_converters: List[Callable[[str], object]],
+                 raw_values: List[str]):
+        super().__init__()
+        self.__column_indices = column_indices
+        self.__column_converters = column_converters
+        self.__raw_values = raw_values
+        self.__is_materialized = False
+
+    def get_raw_value(self, key: str):
+        """
+        Returns the unconverted value of the given column, or None if the column does not exist.
+        """
+        index = self.__column_indices.get(key)
+        return None if index is None or index >= len(self.__raw_values) else self.__raw_values[index]
+
+    def __missing__(self, key):
+        if self.__is_materialized:
+            raise KeyError(key)
+        index = self.__column_indices.get(key)
+        if index is None or index >= len(self.__raw_values):
+            raise KeyError(key)
+        value = self.__column_converters[index](self.__raw_values[index])
+        dict.__setitem__(self, key, value)
+        return value
+
+    def __materialize(self):
+        """
+        Converts all the attributes that were not accessed yet and restores the order of the schema.
+        """
+        if self.__is_materialized:
+            return
+        self.__is_materialized = True
+        attributes = {}
+        for key, index in self.__column_indices.items():
+            if index >= len(self.__raw_values):
+                continue
+            attributes[key] = dict.__getitem__(self, key) if dict.__contains__(self, key) else \
+                self.__column_converters[index](self.__raw_values[index])
+        for key, value in dict.items(self):
+            if key not in attributes:
+                attributes[key] = value
+        dict.clear(self)
+        dict.update(self, attributes)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or (not self.__is_materialized and self.get_raw_value(key) is not None)
+
+    def __len__(self):
+        self.__materialize()
+        return dict.__len__(self)
+
+    def __iter__(self):
+        self.__materialize()
+        return dict.__iter__(self)
+
+    def keys(self):
+        self.__materialize()
+        return dict.keys(self)
+
+    def values(self):
+        self.__materialize()
+        return dict.values(self)
+
+    def items(self):
+        self.__materialize()
+        return dict.items(self)
+
+    def pop(self, key, *args):
+        self.__materialize()
+        return dict.pop(self, key, *args)
+
+    def popitem(self):
+        self.__materialize()
+        return dict.popitem(self)
+
+    def setdefault(self, key, default=None):
+        self.__materialize()
+        return dict.setdefault(self, key, default)
+
+    def copy(self):
+        self.__materialize()
+        return dict(self)
+
+    def __eq__(self, other):
+        self.__materialize()
+        return dict.__eq__(self, other.copy() if isinstance(other, LazyEventPayload) else other)
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __repr__(self):
+        self.__materialize()
+        return dict.__repr__(self)
+
+    def __reduce__(self):
+        # a lazy payload is serialized as a regular dictionary
+        return dict, (self.copy(),)
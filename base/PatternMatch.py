@@ -7,15 +7,94 @@ class PatternMatch:
     Represents a set of primitive events satisfying one or more patterns.
     An instance of this class could correspond either to a full pattern match, or to any intermediate result
     created during the evaluation process.
+    A partial match created by joining two partial matches only references them together with the positions of their
+    events in the joined match, instead of holding its own list of events. Single events are located by following these
+    references, while the full list of events is merged anew upon each request, so that partial matches stored at
+    different nodes of an evaluation tree share their events rather than copying them. The list of events is only kept
+    once the match is materialized, which is done for full pattern matches.
+    The first and the last timestamps of a match are kept in nanoseconds since the epoch, like Event.timestamp_ns, and
+    are used for all time window calculations. Their datetime counterparts are derived from the events upon access.
     """
+    __slots__ = ("__events", "__join_sources", "first_timestamp_ns", "last_timestamp_ns", "pattern_ids", "probability")
+
     def __init__(self, events: List[Event], probability: float = None):
-        self.events = events
-        self.last_timestamp = max(events, key=lambda x: x.timestamp).timestamp
-        self.first_timestamp = min(events, key=lambda x: x.timestamp).timestamp
+        self.__events = events
+        self.__join_sources = None
+        self.last_timestamp_ns = max(event.timestamp_ns for event in events)
+        self.first_timestamp_ns = min(event.timestamp_ns for event in events)
         # this field is only used for full pattern matches
         self.pattern_ids = []
         self.probability = probability
 
+    @staticmethod
+    def join(first_match, second_match, event_positions: tuple, probability: float = None):
+        """
+        Creates a partial match consisting of the events of the two given partial matches, deriving its boundary
+        timestamps from theirs. The i-th entry of event_positions is a pair of the index of the partial match containing
+        the i-th event of the new match (0 for the first one and 1 for the second one) and the position of the event in
+        that partial match.
+        """
+        match = PatternMatch.__new__(PatternMatch)
+        match.__events = None
+        match.__join_sources = (first_match, second_match, event_positions)
+        match.last_timestamp_ns = max(first_match.last_timestamp_ns, second_match.last_timestamp_ns)
+        match.first_timestamp_ns = min(first_match.first_timestamp_ns, second_match.first_timestamp_ns)
+        match.pattern_ids = []
+        match.probability = probability
+        return match
+
+    @property
+    def events(self):
+        """
+        Returns the primitive events of this match.
+        """
+        if self.__events is not None:
+            return self.__events
+        first_match, second_match, event_positions = self.__join_sources
+        source_events = (first_match.events, second_match.events)
+        return [source_events[source][position] for source, position in event_positions]
+
+    def get_event(self, position: int):
+        """
+        Returns the event at the given position of this match without merging the events of the joined partial matches.
+        """
+        match = self
+        while match.__events is None:
+            first_match, second_match, event_positions = match.__join_sources
+            source, position = event_positions[position]
+            match = second_match if source else first_match
+        return match.__events[position]
+
+    def materialize_events(self):
+        """
+        Stores the list of events of this match, releasing the joined partial matches it was created from.
+        """
+        if self.__events is None:
+            self.__events = self.events
+            self.__join_sources = None
+
+    @property
+    def first_timestamp(self):
+        """
+        Returns the timestamp of the earliest event of this match as a datetime object.
+        """
+        return min(self.events, key=lambda event: event.timestamp_ns).timestamp
+
+    @property
+    def last_timestamp(self):
+        """
+        Returns the timestamp of the latest event of this match as a datetime object.
+        """
+        return max(self.events, key=lambda event: event.timestamp_ns).timestamp
+
+    def __getstate__(self):
+        # the events are serialized instead of the joined partial matches
+        return self.events, self.first_timestamp_ns, self.last_timestamp_ns, self.pattern_ids, self.probability
+
+    def __setstate__(self, state):
+        self.__events, self.first_timestamp_ns, self.last_timestamp_ns, self.pattern_ids, self.probability = state
+        self.__join_sources = None
+
     def __eq__(self, other):
         return isinstance(other, PatternMatch) and set(self.events) == set(other.events) and \
                self.pattern_ids == other.pattern_ids
@@ -26,6 +26,30 @@ class CompositeCondition(Condition, ABC):
                 return self.__terminating_result
         return not self.__terminating_result
 
+    def compile(self, event_positions: dict):
+        """
+        Compiles all contained conditions and combines them according to the logic of this composite condition.
+        Fails if any of the contained conditions cannot be compiled.
+        """
+        if type(self).eval is not CompositeCondition.eval:
+            return None
+        if self.get_num_conditions() == 0:
+            return lambda events: True
+        compiled_conditions = []
+        for condition in self.__conditions:
+            compiled_condition = condition.compile(event_positions)
+            if compiled_condition is None:
+                return None
+            compiled_conditions.append(compiled_condition)
+        terminating_result = self.__terminating_result
+
+        def compiled_composite_condition(events: list):
+            for compiled_condition in compiled_conditions:
+                if compiled_condition(events) == terminating_result:
+                    return terminating_result
+            return not terminating_result
+        return compiled_composite_condition
+
     def __eq__(self, other):
         if self == other:
             return True
@@ -79,6 +79,15 @@ class Condition(ABC):
         """
         raise NotImplementedError()
 
+    def compile(self, event_positions: dict):
+        """
+        Returns a function evaluating this condition directly on a list of events, where the event bound to each name is
+        located at the position specified by the given dict. Unlike eval(), the returned function requires no binding
+        to be created for every evaluation.
+        Returns None if this condition cannot be compiled, in which case eval() should be used instead.
+        """
+        return None
+
     def extract_atomic_conditions(self):
         """
         Returns all atomic conditions comprising this condition.
@@ -101,6 +110,8 @@ class AtomicCondition(Condition, ABC):
     def __init__(self):
         # currently used to update the selectivity statistics if they are present in the statistics collector
         self._statistics_collector = None
+        # an integer identifying this condition in the selectivity statistics
+        self._statistics_id = None
 
     def eval(self, binding: dict or list = None):
         result = self._eval(binding)
@@ -117,6 +128,31 @@ class AtomicCondition(Condition, ABC):
         """
         raise NotImplementedError()
 
+    def compile(self, event_positions: dict):
+        """
+        Wraps the compiled version of _eval with the statistics update performed by eval.
+        """
+        if type(self).eval is not AtomicCondition.eval:
+            # eval was overridden and its behavior cannot be reproduced
+            return None
+        compiled_eval = self._compile(event_positions)
+        if compiled_eval is None:
+            return None
+
+        def compiled_condition(events: list):
+            result = compiled_eval(events)
+            if self._statistics_collector is not None:
+                self._statistics_collector.update_statistics_by_type(StatisticsTypes.SELECTIVITY_MATRIX,
+                                                                     (self, result))
+            return result
+        return compiled_condition
+
+    def _compile(self, event_positions: dict):
+        """
+        Returns a function implementing _eval on a list of events as described in compile(), or None if not supported.
+        """
+        return None
+
     def is_condition_of(self, names: set):
         """
         Returns True if all variable names participating in this condition appear in the given set and False otherwise.
@@ -132,6 +168,18 @@ class AtomicCondition(Condition, ABC):
         """
         self._statistics_collector = statistics_collector
 
+    def get_statistics_id(self):
+        """
+        Returns the integer identifying this condition in the selectivity statistics or None if it was not assigned.
+        """
+        return self._statistics_id
+
+    def set_statistics_id(self, statistics_id: int):
+        """
+        Sets the integer identifying this condition in the selectivity statistics.
+        """
+        self._statistics_id = statistics_id
+
 
 class TrueCondition(AtomicCondition):
     """
@@ -140,6 +188,9 @@ class TrueCondition(AtomicCondition):
     def _eval(self, binding: dict = None):
         return True
 
+    def _compile(self, event_positions: dict):
+        return lambda events: True
+
     def __repr__(self):
         return "True Condition"
 
@@ -168,6 +219,32 @@ class SimpleCondition(AtomicCondition):
             rel_terms.append(term.eval(binding) if isinstance(term, Variable) else term)
         return self.relation_op(*rel_terms)
 
+    def _compile(self, event_positions: dict):
+        """
+        Creates a closure fetching the values of the terms directly from the events at the positions of their names.
+        Conditions over one or two variables, which are by far the most common ones, are given dedicated closures.
+        """
+        if type(self)._eval is not SimpleCondition._eval:
+            return None
+        for term in self.terms:
+            if isinstance(term, Variable) and term.name not in event_positions:
+                return None
+        relation_op = self.relation_op
+        if all(isinstance(term, Variable) for term in self.terms):
+            if len(self.terms) == 1:
+                position, getattr_func = event_positions[self.terms[0].name], self.terms[0].getattr_func
+                return lambda events: relation_op(getattr_func(events[position].payload))
+            if len(self.terms) == 2:
+                left_position, left_getattr_func = event_positions[self.terms[0].name], self.terms[0].getattr_func
+                right_position, right_getattr_func = event_positions[self.terms[1].name], self.terms[1].getattr_func
+                return lambda events: relation_op(left_getattr_func(events[left_position].payload),
+                                                  right_getattr_func(events[right_position].payload))
+        # the general case - a constant term is represented by a None position
+        term_getters = [(event_positions[term.name], term.getattr_func) if isinstance(term, Variable) else (None, term)
+                        for term in self.terms]
+        return lambda events: relation_op(*[value if position is None else value(events[position].payload)
+                                            for position, value in term_getters])
+
     def is_condition_of(self, names: set):
         for term in self.terms:
             if term.name not in names:
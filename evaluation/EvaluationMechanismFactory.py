@@ -18,6 +18,8 @@ from plan.multi.MultiPatternTreePlanMergeApproaches import MultiPatternTreePlanM
 from tree.PatternMatchStorage import TreeStorageParameters
 from tree.evaluation.SimultaneousTreeBasedEvaluationMechanism import SimultaneousTreeBasedEvaluationMechanism
 from tree.evaluation.TrivialTreeBasedEvaluationMechnism import TrivialTreeBasedEvaluationMechanism
+from tree.evaluation.PartialMatchMigrationTreeBasedEvaluationMechanism import \
+    PartialMatchMigrationTreeBasedEvaluationMechanism
 
 
 class EvaluationMechanismParameters:
@@ -86,7 +88,8 @@ class EvaluationMechanismFactory:
 
         return EvaluationMechanismFactory.__create_tree_based_evaluation_mechanism_by_update_type(
             pattern_to_tree_plan_map, eval_mechanism_params.storage_params, runtime_statistics_collector, optimizer,
-            optimizer_params.statistics_updates_time_window, eval_mechanism_params.tree_update_type)
+            optimizer_params.statistics_updates_time_window, eval_mechanism_params.tree_update_type,
+            optimizer_params.asynchronous_reoptimization)
 
     @staticmethod
     def __merge_tree_plans(pattern_to_tree_plan_map: Dict[Pattern, TreePlan],
@@ -118,7 +121,8 @@ class EvaluationMechanismFactory:
                                                                 statistics_collector: StatisticsCollector,
                                                                 optimizer: Optimizer,
                                                                 statistics_update_time_window: timedelta,
-                                                                tree_update_type: TreeEvaluationMechanismUpdateTypes):
+                                                                tree_update_type: TreeEvaluationMechanismUpdateTypes,
+                                                                asynchronous_reoptimization: bool):
         """
         Instantiates a tree-based evaluation mechanism given all the parameters.
         """
@@ -127,12 +131,22 @@ class EvaluationMechanismFactory:
                                                        storage_params,
                                                        statistics_collector,
                                                        optimizer,
-                                                       statistics_update_time_window)
+                                                       statistics_update_time_window,
+                                                       asynchronous_reoptimization)
 
         if tree_update_type == TreeEvaluationMechanismUpdateTypes.SIMULTANEOUS_TREE_EVALUATION:
             return SimultaneousTreeBasedEvaluationMechanism(pattern_to_tree_plan_map,
                                                             storage_params,
                                                             statistics_collector,
                                                             optimizer,
-                                                            statistics_update_time_window)
+                                                            statistics_update_time_window,
+                                                            asynchronous_reoptimization)
+
+        if tree_update_type == TreeEvaluationMechanismUpdateTypes.PARTIAL_MATCH_MIGRATION_TREE_EVALUATION:
+            return PartialMatchMigrationTreeBasedEvaluationMechanism(pattern_to_tree_plan_map,
+                                                                     storage_params,
+                                                                     statistics_collector,
+                                                                     optimizer,
+                                                                     statistics_update_time_window,
+                                                                     asynchronous_reoptimization)
         raise Exception("Unknown evaluation mechanism type: %s" % (tree_update_type,))
@@ -5,12 +5,13 @@ Each of the values below can be overridden by providing a different value in CEP
 from datetime import timedelta
 from evaluation.EvaluationMechanismTypes import EvaluationMechanismTypes
 from misc.SelectionStrategies import SelectionStrategies
-from adaptive.statistics.StatisticsTypes import StatisticsTypes
+from adaptive.statistics.StatisticsTypes import StatisticsTypes, SelectivityStatisticsTypes
 from adaptive.optimizer.OptimizerTypes import OptimizerTypes
 from tree.evaluation.TreeEvaluationMechanismUpdateTypes import TreeEvaluationMechanismUpdateTypes
 from parallel.ParallelExecutionModes import *
 from parallel.ParallelExecutionPlatforms import ParallelExecutionPlatforms
-from plan.IterativeImprovement import IterativeImprovementType, IterativeImprovementInitType
+from plan.IterativeImprovement import IterativeImprovementType, IterativeImprovementInitType, \
+    IterativeImprovementSearchType
 from plan.TreeCostModels import TreeCostModels
 from plan.TreePlanBuilderTypes import TreePlanBuilderTypes
 from transformation.PatternTransformationRules import PatternTransformationRules
@@ -33,10 +34,17 @@ SECONDARY_SELECTION_STRATEGY = SelectionStrategies.MATCH_SINGLE
 SHOULD_SORT_STORAGE = False
 CLEANUP_INTERVAL = 10  # the default number of pattern match additions between subsequent storage cleanups
 PRIORITIZE_SORTING_BY_TIMESTAMP = True
+USE_BLOCKED_SORTED_STORAGE = False  # enable for nodes expected to hold large numbers of partial matches
+SORTED_STORAGE_BLOCK_SIZE = 500  # the typical number of pattern matches in a block of a blocked sorted storage
 
 # iterative improvement defaults
 ITERATIVE_IMPROVEMENT_TYPE = IterativeImprovementType.SWAP_BASED
 ITERATIVE_IMPROVEMENT_INIT_TYPE = IterativeImprovementInitType.RANDOM
+ITERATIVE_IMPROVEMENT_SEARCH_TYPE = IterativeImprovementSearchType.HILL_CLIMBING
+ITERATIVE_IMPROVEMENT_RESTARTS_NUMBER = 1  # the number of independent searches, all but the first start randomly
+ITERATIVE_IMPROVEMENT_WORKERS_NUMBER = 1  # if larger than 1, the searches are distributed over a process pool
+ITERATIVE_IMPROVEMENT_TIME_LIMIT = None  # if set to a timedelta, the best order found within this time is returned
+SIMULATED_ANNEALING_INITIAL_TEMPERATURE_RATIO = 0.1  # the initial temperature relative to the initial order cost
 
 # parallel execution settings
 DEFAULT_PARALLEL_EXECUTION_MODE = ParallelExecutionModes.SEQUENTIAL
@@ -46,6 +54,12 @@ DEFAULT_PARALLEL_UNITS_NUMBER = 1
 DEFAULT_PARALLEL_KEY = None
 DEFAULT_PARALLEL_ATTRIBUTES_DICT = None
 DEFAULT_PARALLEL_MULT = 3
+DEFAULT_PARALLEL_BATCH_SIZE = 1000  # the number of objects transferred to or from an execution unit at once
+MULTIPROCESSING_START_METHOD = None  # e.g., "fork" or "spawn" - None selects the default of the operating system
+
+# stream settings
+USE_THREAD_SAFE_STREAMS = True  # disable if the streams are never accessed concurrently with the evaluation
+FILE_STREAM_BUFFER_SIZE = 1024 * 1024  # the size of the chunks in which lazy file input streams are read
 
 # settings for pattern transformation rules
 PREPROCESSING_RULES_ORDER = None  # disabled for now
@@ -70,4 +84,12 @@ DEVIATION_OPTIMIZER_THRESHOLD = 0.5  # the default threshold for statistics chan
 DEFAULT_TREE_UPDATE_TYPE = TreeEvaluationMechanismUpdateTypes.TRIVIAL_TREE_EVALUATION
 DEFAULT_STATISTICS_TYPE = [StatisticsTypes.ARRIVAL_RATES, StatisticsTypes.SELECTIVITY_MATRIX]  # the default statistics type can also be a list of types
 STATISTICS_TIME_WINDOW = timedelta(hours=1)  # Time window for statistics
+SELECTIVITY_SAMPLING_RATE = 1  # only one out of every N condition evaluations is recorded in the selectivity statistics
+SELECTIVITY_STATISTICS_TYPE = SelectivityStatisticsTypes.CUMULATIVE  # how the age of condition evaluations is handled
+SELECTIVITY_WINDOW_BUCKETS_NUMBER = 10  # the number of buckets the sliding window of the selectivity is divided into
+ARRIVAL_RATES_BUCKET_SIZE = None  # if set, arrival times are rounded down to this resolution, otherwise the memory grows with the event rate
 STATISTICS_UPDATES_WAIT_TIME = None  # the default wait time between statistics updates or None to disable adaptivity
+ASYNCHRONOUS_REOPTIMIZATION = False  # whether new evaluation plans are built in the background during event processing
+TREE_PLAN_CACHE_CAPACITY = 64  # the maximal number of tree plans stored by a tree plan cache
+TREE_PLAN_CACHE_STATISTICS_QUANTIZATION_BASE = 1.25  # statistics within the same power of this base share a cached plan
+TREE_PLAN_CACHE_FILE_PATH = None  # if set, the tree plan cache is persisted to this file
@@ -16,26 +16,27 @@ from copy import deepcopy
 from stream.Stream import Stream
 
 
-def find_partial_match_by_timestamp(partial_matches: List[PatternMatch], timestamp: datetime):
+def find_partial_match_by_timestamp(partial_matches: List[PatternMatch], timestamp: int):
     """
-    Returns the partial match from the given list such that its timestamp is the closest to the given timestamp.
+    Returns the partial match from the given list such that its timestamp is the closest to the given timestamp, which
+    is given in nanoseconds since the epoch.
     The list is assumed to be sorted according to the earliest event timestamp.
     """
     # should count how many PMs are before last date.
     length = len(partial_matches)
-    if length == 0 or partial_matches[0].first_timestamp >= timestamp:
+    if length == 0 or partial_matches[0].first_timestamp_ns >= timestamp:
         return 0
     if length == 1:  # here we already know that first item's date < lastDate
         return 1
-    if partial_matches[-1].first_timestamp < timestamp:
+    if partial_matches[-1].first_timestamp_ns < timestamp:
         return length
 
     start = 0
     end = length - 1
     while start <= end:
         mid = (start + end) // 2
-        mid_timestamp = partial_matches[mid].first_timestamp
-        if partial_matches[mid - 1].first_timestamp < timestamp <= mid_timestamp:
+        mid_timestamp = partial_matches[mid].first_timestamp_ns
+        if partial_matches[mid - 1].first_timestamp_ns < timestamp <= mid_timestamp:
             return mid
         elif timestamp > mid_timestamp:
             start = mid + 1
@@ -73,6 +74,18 @@ def str_to_number(x: str):
     return x
 
 
+def decimal_str_to_number(x: str):
+    """
+    Converts a string known to contain a decimal number into an int or a float, in the same way as str_to_number.
+    Unlike str_to_number, it normally does not attempt and fail a conversion first. Strings in other formats, such as
+    ones with an exponent, fall back to str_to_number.
+    """
+    try:
+        return float(x) if "." in x else int(x)
+    except ValueError:
+        return str_to_number(x)
+
+
 def get_order_by_occurrences(primitive_events: List[PrimitiveEventStructure], occurrences: dict):
     """
     Sorts the given list according to the occurrences dictionary.
@@ -157,6 +170,16 @@ def merge_according_to(arr1: list, arr2: list, actual1: list, actual2: list, key
     return ret
 
 
+def get_merge_permutation(arr1: list, arr2: list, key: callable = lambda x: x):
+    """
+    Returns the positions in the concatenation of arr1 and arr2 in the order a merge of arr1 and arr2 would produce.
+    Applying this permutation on the concatenation of actual1 and actual2 is equivalent to merge_according_to.
+    """
+    positions = merge([(item, i) for i, item in enumerate(arr1)],
+                      [(item, len(arr1) + i) for i, item in enumerate(arr2)], key=lambda x: key(x[0]))
+    return [position for _, position in positions]
+
+
 def is_sorted(arr: list, key: callable = lambda x: x):
     """
     Returns True if the given list is sorted with respect to the given comparator function and False otherwise.
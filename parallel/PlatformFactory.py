@@ -5,6 +5,8 @@ from parallel.ParallelExecutionParameters import ParallelExecutionParameters
 from parallel.ParallelExecutionPlatforms import ParallelExecutionPlatforms
 from parallel.platform.ThreadingParallelExecutionPlatform import \
     ThreadingParallelExecutionPlatform
+from parallel.platform.MultiprocessingParallelExecutionPlatform import \
+    MultiprocessingParallelExecutionPlatform
 
 
 class PlatformFactory:
@@ -17,4 +19,6 @@ class PlatformFactory:
             parallel_execution_params = ParallelExecutionParameters()
         if parallel_execution_params.platform == ParallelExecutionPlatforms.THREADING:
             return ThreadingParallelExecutionPlatform()
+        if parallel_execution_params.platform == ParallelExecutionPlatforms.MULTIPROCESSING:
+            return MultiprocessingParallelExecutionPlatform()
         raise Exception("Unknown parallel execution platform: %s" % (parallel_execution_params.platform,))
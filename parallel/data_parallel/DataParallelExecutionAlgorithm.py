@@ -1,26 +1,177 @@
+import heapq
+import threading
 from abc import ABC
+from itertools import count
+from math import inf
+from base.Event import Event
 from base.Pattern import Pattern
 from evaluation.EvaluationMechanismFactory import \
     EvaluationMechanismParameters, EvaluationMechanismFactory
 from base.DataFormatter import DataFormatter
 from base.PatternMatch import *
-from parallel.platform.ParallelExecutionPlatform import ParallelExecutionPlatform
+from misc import DefaultConfig
+from parallel.platform.ParallelExecutionPlatform import ParallelExecutionPlatform, ParallelExecutionChannel
+from stream.ChannelStream import ChannelInputStream, ChannelOutputStream
 from stream.Stream import *
 
 
+class ProgressMark:
+    """
+    Marks the progress of the evaluation in the streams transferred to and from the execution units.
+    In the event stream of a unit, a mark states that all the events up to the given timestamp were sent to the unit.
+    The unit echoes the mark in its match stream once it has processed all the events preceding the mark, stating that
+    all its matches whose last events precede the given timestamp were already sent.
+    """
+    __slots__ = ("timestamp",)
+
+    def __init__(self, timestamp: int):
+        self.timestamp = timestamp
+
+
+class ProgressReportingInputStream(InputStream):
+    """
+    Reads the events sent to an execution unit, echoing each progress mark found between them to the match stream of
+    the unit. As the next event is only requested once the previous one was processed, the matches preceding a mark
+    are always sent before it.
+    """
+    def __init__(self, events: InputStream, matches: ChannelOutputStream):
+        super().__init__()
+        self.__events = events
+        self.__matches = matches
+
+    def __next__(self):
+        item = next(self.__events)
+        while isinstance(item, ProgressMark):
+            self.__matches.add_item(item)
+            self.__matches.flush()
+            item = next(self.__events)
+        return item
+
+
 class DataParallelExecutionAlgorithm(ABC):
     """
     An abstract base class for all data parallel evaluation algorithms.
+    Each execution unit runs its own evaluation mechanism on the part of the input stream assigned to it by the
+    algorithm. Each raw event is parsed once, in order to determine the units it should be sent to, and the parsed
+    event is transferred to these units. Events and matches are transferred to and from the units in batches, and the
+    matches detected by the units are merged into a single output stream ordered by the timestamps of their last events.
+    The input stream is divided in a separate thread while the matches are merged, and the units periodically report
+    their progress, such that matches are reported while the input stream is still being read.
     """
     def __init__(self, units_number, patterns: Pattern or List[Pattern],
                  eval_mechanism_params: EvaluationMechanismParameters, platform: ParallelExecutionPlatform):
-        raise NotImplementedError()
+        if units_number <= 0:
+            raise Exception("Invalid number of execution units: %s" % (units_number,))
+        self._units_number = units_number
+        self._patterns = [patterns] if isinstance(patterns, Pattern) else patterns
+        self._platform = platform
+        self._eval_mechanisms = [EvaluationMechanismFactory.build_eval_mechanism(eval_mechanism_params, self._patterns)
+                                 for _ in range(units_number)]
+        self._units = []
 
     def eval(self, events: InputStream, matches: OutputStream, data_formatter: DataFormatter):
         """
         Activates the actual parallel algorithm.
         """
+        self._units = []
+        for unit_id in range(self._units_number):
+            unit = self._platform.create_parallel_execution_unit(unit_id, self._eval_unit, unit_id, data_formatter)
+            self._units.append(unit)
+            unit.start()
+
+        # the exception raised while dividing the input stream, if any, is re-raised once the units are done
+        divider_exceptions = []
+        divider = threading.Thread(target=self.__divide_stream_and_record_exception,
+                                   args=(events, data_formatter, divider_exceptions), daemon=True)
+        divider.start()
+        self._merge_matches([ChannelInputStream(unit) for unit in self._units], matches)
+        divider.join()
+        for unit in self._units:
+            unit.wait()
+        if len(divider_exceptions) > 0:
+            raise divider_exceptions[0]
+        matches.close()
+
+    def _eval_unit(self, channel: ParallelExecutionChannel, unit_id: int, data_formatter: DataFormatter):
+        """
+        The function executed by each execution unit. Applies the evaluation mechanism of the unit on the events
+        received from the channel and sends the detected matches back, along with the progress marks.
+        """
+        matches = ChannelOutputStream(channel)
+        events = ProgressReportingInputStream(ChannelInputStream(channel), matches)
+        self._eval_mechanisms[unit_id].eval(events, matches, data_formatter)
+
+    def __divide_stream_and_record_exception(self, events: InputStream, data_formatter: DataFormatter,
+                                             exceptions: list):
+        """
+        Runs _divide_stream in the divider thread, recording the exception it raised, if any.
+        """
+        try:
+            self._divide_stream(events, data_formatter)
+        except Exception as e:
+            exceptions.append(e)
+
+    def _divide_stream(self, events: InputStream, data_formatter: DataFormatter):
+        """
+        Parses each raw event of the input stream and routes it to the execution units returned by _get_event_units.
+        After every batch of events, a progress mark is sent to all the units, including the ones that received none of
+        these events. The event streams of the units are closed even if the input stream could not be read.
+        """
+        unit_event_streams = [ChannelOutputStream(unit) for unit in self._units]
+        try:
+            for events_number, raw_event in enumerate(events, 1):
+                event = Event(raw_event, data_formatter)
+                for unit_id in self._get_event_units(event):
+                    unit_event_streams[unit_id].add_item(event)
+                if events_number % DefaultConfig.DEFAULT_PARALLEL_BATCH_SIZE == 0:
+                    for stream in unit_event_streams:
+                        stream.add_item(ProgressMark(event.timestamp_ns))
+                        stream.flush()
+        finally:
+            for stream in unit_event_streams:
+                stream.close()
+
+    def _merge_matches(self, unit_match_streams: List[InputStream], matches: OutputStream):
+        """
+        Collects the matches detected by all execution units into the given output stream.
+        The matches are merged according to the timestamps of their last events, assuming that each unit detects its
+        matches in this order. A match is reported as soon as every other unit has either sent a later match or progress
+        mark or finished its evaluation. To this end, the unit lagging behind the others is always the one read next.
+        Only the matches approved by _should_report_match are reported.
+        """
+        # the lower bound on the last event timestamps of the matches yet to be received from each unit
+        unit_progress = [-inf] * len(unit_match_streams)
+        pending_matches = []
+        arrival_counter = count()
+        while True:
+            unit_id = min(range(len(unit_match_streams)), key=unit_progress.__getitem__)
+            if unit_progress[unit_id] == inf:
+                break
+            item = next(unit_match_streams[unit_id], None)
+            if item is None:
+                unit_progress[unit_id] = inf
+            elif isinstance(item, ProgressMark):
+                unit_progress[unit_id] = max(unit_progress[unit_id], item.timestamp)
+            else:
+                unit_progress[unit_id] = max(unit_progress[unit_id], item.last_timestamp_ns)
+                if self._should_report_match(item, unit_id):
+                    heapq.heappush(pending_matches, (item.last_timestamp_ns, unit_id, next(arrival_counter), item))
+            progress = min(unit_progress)
+            while len(pending_matches) > 0 and pending_matches[0][0] <= progress:
+                matches.add_item(heapq.heappop(pending_matches)[3])
+
+    def _get_event_units(self, event: Event):
+        """
+        Returns the IDs of the execution units the given event should be sent to - to be implemented by subclasses.
+        """
         raise NotImplementedError()
 
+    def _should_report_match(self, match: PatternMatch, unit_id: int):
+        """
+        Returns True if the given match detected by the given unit should be reported.
+        By default, the units are assumed to produce disjoint sets of matches.
+        """
+        return True
+
     def get_structure_summary(self):
-        raise NotImplementedError()
+        return self._eval_mechanisms[0].get_structure_summary()
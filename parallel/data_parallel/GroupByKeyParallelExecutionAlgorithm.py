@@ -4,7 +4,7 @@ from parallel.data_parallel.DataParallelExecutionAlgorithm import DataParallelEx
 from base.Pattern import Pattern
 from evaluation.EvaluationMechanismFactory import \
     EvaluationMechanismParameters
-from base.DataFormatter import DataFormatter
+from base.Event import Event
 from base.PatternMatch import *
 from stream.Stream import *
 
@@ -12,13 +12,19 @@ from stream.Stream import *
 class GroupByKeyParallelExecutionAlgorithm(DataParallelExecutionAlgorithm, ABC):
     """
     Implements the key-based partitioning algorithm.
+    Each event is sent to a single execution unit, selected by hashing the value of the given key attribute. This
+    algorithm is only correct for patterns that require all events of a match to share the same key value.
     """
     def __init__(self, units_number, patterns: Pattern or List[Pattern],
                  eval_mechanism_params: EvaluationMechanismParameters,
                  platform, key: str):
+        if key is None:
+            raise Exception("A key attribute must be specified for the group-by-key algorithm")
         super().__init__(units_number, patterns, eval_mechanism_params, platform)
         self.__key = key
 
-    def eval(self, events: InputStream, matches: OutputStream,
-             data_formatter: DataFormatter):
-        raise NotImplementedError()
+    def _get_event_units(self, event: Event):
+        """
+        Sends the event to the unit assigned to the value of its key attribute.
+        """
+        return [hash(event.payload.get(self.__key)) % self._units_number]
@@ -2,12 +2,12 @@
  Data parallel HyperCube algorithms
 """
 from abc import ABC
+from itertools import product
 from parallel.data_parallel.DataParallelExecutionAlgorithm import DataParallelExecutionAlgorithm
-import math
 from base.Pattern import Pattern
 from evaluation.EvaluationMechanismFactory import \
     EvaluationMechanismParameters
-from base.DataFormatter import DataFormatter
+from base.Event import Event
 from base.PatternMatch import *
 from stream.Stream import *
 
@@ -15,11 +15,65 @@ from stream.Stream import *
 class HyperCubeParallelExecutionAlgorithm(DataParallelExecutionAlgorithm, ABC):
     """
     Implements the HyperCube algorithm.
+    The execution units are arranged in a hypercube with a dimension for each primitive event of the patterns, such
+    that the number of units is equal to X**(number of primitive events) for some integer X. An event is hashed along
+    each dimension corresponding to its type using the attribute specified for this type in the given dictionary, and
+    is replicated along all other dimensions. Hence, each combination of events meets in at least one unit.
+    Since a match might be detected by several units, each match is only reported by one of them.
     """
     def __init__(self, units_number, patterns: Pattern or List[Pattern],
                  eval_mechanism_params: EvaluationMechanismParameters, platform, attributes_dict: dict):
         super().__init__(units_number - 1, patterns, eval_mechanism_params, platform)
         self.__attributes_dict = attributes_dict
+        dimension_types = []
+        for pattern in self._patterns:
+            if pattern.negative_structure is not None:
+                raise Exception("The HyperCube algorithm does not support patterns with negation")
+            dimension_types.extend(event.type for event in pattern.get_primitive_events())
+        for event_type in dimension_types:
+            if attributes_dict is None or event_type not in attributes_dict:
+                raise Exception("No attribute was specified for the event type %s" % (event_type,))
+        self.__dimension_size = round(self._units_number ** (1 / len(dimension_types)))
+        if self.__dimension_size ** len(dimension_types) != self._units_number:
+            raise Exception("The number of units minus one must be equal to X**%s for some integer X, got: %s" %
+                            (len(dimension_types), self._units_number))
+        self.__type_to_dimensions = {}
+        for dimension, event_type in enumerate(dimension_types):
+            self.__type_to_dimensions.setdefault(event_type, []).append(dimension)
+        self.__dimension_value_to_units = self.__init_dimension_value_to_units(len(dimension_types))
 
-    def eval(self, events: InputStream, matches: OutputStream, data_formatter: DataFormatter):
-        raise NotImplementedError()
+    def __init_dimension_value_to_units(self, dimensions_number: int):
+        """
+        Calculates, for each dimension and each coordinate along it, the units located in the corresponding slice of
+        the hypercube.
+        """
+        dimension_value_to_units = {}
+        for unit_id, coordinates in enumerate(product(range(self.__dimension_size), repeat=dimensions_number)):
+            for dimension, value in enumerate(coordinates):
+                dimension_value_to_units.setdefault((dimension, value), []).append(unit_id)
+        return dimension_value_to_units
+
+    def _get_event_units(self, event: Event):
+        """
+        Sends the event to all units whose coordinate along one of the dimensions of its type matches the hashed
+        value of its attribute.
+        """
+        dimensions = self.__type_to_dimensions.get(event.type)
+        if dimensions is None:
+            return []
+        value = hash(event.payload.get(self.__attributes_dict[event.type])) % self.__dimension_size
+        units = set()
+        for dimension in dimensions:
+            units.update(self.__dimension_value_to_units[(dimension, value)])
+        return units
+
+    def _should_report_match(self, match: PatternMatch, unit_id: int):
+        """
+        A match is detected by every unit that received all of its events. It is only reported by the one with the
+        lowest ID among these units, which can be determined from the coordinates of the events alone.
+        """
+        match_units = None
+        for event in match.events:
+            event_units = self._get_event_units(event)
+            match_units = event_units if match_units is None else match_units.intersection(event_units)
+        return min(match_units) == unit_id
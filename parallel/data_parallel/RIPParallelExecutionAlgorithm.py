@@ -1,9 +1,9 @@
 from abc import ABC
 from parallel.data_parallel.DataParallelExecutionAlgorithm import DataParallelExecutionAlgorithm
-import math
+from base.Event import Event, timedelta_to_nanoseconds
 from base.Pattern import Pattern
 from evaluation.EvaluationMechanismFactory import \
-    EvaluationMechanismParameters, EvaluationMechanismFactory
+    EvaluationMechanismParameters
 from base.DataFormatter import DataFormatter
 from base.PatternMatch import *
 from stream.Stream import *
@@ -11,13 +11,51 @@ from stream.Stream import *
 
 class RIPParallelExecutionAlgorithm(DataParallelExecutionAlgorithm, ABC):
     """
-    Implements the RIP algorithm.
+    Implements the RIP (replicated input partitioning) algorithm.
+    The input stream is split into consecutive time intervals whose length is the given multiple of the pattern time
+    window, and the intervals are assigned to the execution units in a round-robin manner. The events occurring during
+    the first time window of each interval are also replicated to the unit of the preceding interval, such that every
+    match is fully contained in the input of the unit owning the interval in which the match starts.
+    A match is only reported by the unit owning its earliest event, which removes the duplicates produced in the
+    overlapping parts of the intervals.
     """
     def __init__(self, units_number, patterns: Pattern or List[Pattern],
                  eval_mechanism_params: EvaluationMechanismParameters,
                  platform, multiple):
+        if multiple is None or multiple < 1:
+            raise Exception("The RIP interval multiple must be at least 1, got: %s" % (multiple,))
         super().__init__(units_number - 1, patterns, eval_mechanism_params, platform)
-        self.__eval_mechanism_params = eval_mechanism_params
+        # the time values are kept in nanoseconds to be compared with the timestamps of the matches
+        self.__window = timedelta_to_nanoseconds(max(pattern.window for pattern in self._patterns))
+        self.__interval = self.__window * multiple
+        self.__start_time = None
 
     def eval(self, events: InputStream, matches: OutputStream, data_formatter: DataFormatter):
-        raise NotImplementedError()
+        self.__start_time = None
+        super().eval(events, matches, data_formatter)
+
+    def _get_event_units(self, event: Event):
+        """
+        Sends the event to the unit owning its interval and, if the event occurred during the first time window of the
+        interval, to the unit owning the preceding interval as well.
+        """
+        timestamp = event.timestamp_ns
+        if self.__start_time is None:
+            self.__start_time = timestamp
+        interval_index = self.__get_interval_index(timestamp)
+        units = {interval_index % self._units_number}
+        if interval_index > 0 and (timestamp - self.__start_time) % self.__interval <= self.__window:
+            units.add((interval_index - 1) % self._units_number)
+        return units
+
+    def _should_report_match(self, match: PatternMatch, unit_id: int):
+        """
+        Only reports the matches detected by the unit owning the interval of their earliest event.
+        """
+        return self.__get_interval_index(match.first_timestamp_ns) % self._units_number == unit_id
+
+    def __get_interval_index(self, timestamp: int):
+        """
+        Returns the index of the interval containing the given timestamp.
+        """
+        return (timestamp - self.__start_time) // self.__interval
@@ -0,0 +1,55 @@
+"""
+Provides parallelization functionality based on Python multiprocessing library.
+"""
+import multiprocessing
+
+from misc import DefaultConfig
+from parallel.platform.ParallelExecutionPlatform import ParallelExecutionPlatform, ParallelExecutionUnit, \
+    ParallelExecutionChannel, QueueBasedParallelExecutionChannel
+
+
+class MultiprocessingParallelExecutionPlatform(ParallelExecutionPlatform):
+    """
+    Creates execution unit objects based on Python processes.
+    The processes are created using the given start method, or using the default start method of the operating system
+    if none is given. With the "fork" start method (the default on Linux), the callback function and its arguments
+    (e.g., evaluation mechanisms containing lambda conditions) are inherited by the new process rather than pickled.
+    With the "spawn" start method (the default on Windows and macOS, where forking is unavailable or unsafe), they are
+    pickled and hence must be picklable. In any case, all objects passed between the processes using send and receive
+    must be picklable.
+    """
+    def __init__(self, start_method: str = DefaultConfig.MULTIPROCESSING_START_METHOD):
+        if start_method is not None and start_method not in multiprocessing.get_all_start_methods():
+            raise Exception("Unsupported multiprocessing start method: %s" % (start_method,))
+        self.__context = multiprocessing.get_context(start_method)
+
+    def create_parallel_execution_unit(self, unit_id: int, callback_function: callable, *args, **kwargs):
+        unit_channel, creator_channel = QueueBasedParallelExecutionChannel.create_channel_pair(self.__context.Queue)
+        new_process = self.__context.Process(target=callback_function, args=(unit_channel,) + args, kwargs=kwargs,
+                                             daemon=True)
+        return MultiprocessingParallelExecutionUnit(unit_id, new_process, creator_channel)
+
+
+class MultiprocessingParallelExecutionUnit(ParallelExecutionUnit):
+    """
+    A parallel execution unit wrapping a single Python process.
+    """
+    def __init__(self, unit_id: int, process: multiprocessing.Process, channel: ParallelExecutionChannel):
+        super().__init__(unit_id)
+        self._process = process
+        self._channel = channel
+
+    def start(self):
+        return self._process.start()
+
+    def stop(self):
+        return self._process.terminate()
+
+    def wait(self, timeout: float = None):
+        return self._process.join(timeout)
+
+    def send(self, data: object):
+        self._channel.send(data)
+
+    def receive(self, timeout: float = None):
+        return self._channel.receive(timeout)
@@ -4,6 +4,7 @@ A generic interface for encapsulating the platform that provides parallelization
 """
 
 from abc import ABC
+from queue import Empty
 
 
 class ParallelExecutionPlatform(ABC):
@@ -14,6 +15,9 @@ class ParallelExecutionPlatform(ABC):
     def create_parallel_execution_unit(unit_id: int, callback_function: callable, *args, **kwargs):
         """
         Initializes and returns an object representing a single parallel execution unit.
+        The callback function is invoked inside the new unit with the unit-side ParallelExecutionChannel as its first
+        argument, followed by the given arguments. Objects passed to the send method of the returned unit can be
+        received through this channel, and vice versa.
         """
         raise NotImplementedError()
 
@@ -60,3 +64,49 @@ class ParallelExecutionUnit(ABC):
         Attempts to receive an object from the execution unit.
         """
         raise NotImplementedError()
+
+
+class ParallelExecutionChannel(ABC):
+    """
+    One endpoint of a bidirectional communication channel between an execution unit and its creator.
+    """
+    def send(self, data: object):
+        """
+        Sends a given object to the other endpoint of the channel.
+        """
+        raise NotImplementedError()
+
+    def receive(self, timeout: float = None):
+        """
+        Receives an object from the other endpoint of the channel. Returns None if no object arrived before the given
+        timeout has expired.
+        """
+        raise NotImplementedError()
+
+
+class QueueBasedParallelExecutionChannel(ParallelExecutionChannel):
+    """
+    A channel endpoint implemented using a pair of queues, one for each direction. Supports any queue implementation
+    following the interface of queue.Queue (e.g., multiprocessing.Queue).
+    """
+    def __init__(self, incoming_queue, outgoing_queue):
+        self.__incoming_queue = incoming_queue
+        self.__outgoing_queue = outgoing_queue
+
+    def send(self, data: object):
+        self.__outgoing_queue.put(data)
+
+    def receive(self, timeout: float = None):
+        try:
+            return self.__incoming_queue.get(block=True, timeout=timeout)
+        except Empty:
+            return None
+
+    @staticmethod
+    def create_channel_pair(queue_factory: callable):
+        """
+        Creates two connected channel endpoints using queues created by the given factory.
+        """
+        first_queue, second_queue = queue_factory(), queue_factory()
+        return QueueBasedParallelExecutionChannel(first_queue, second_queue), \
+            QueueBasedParallelExecutionChannel(second_queue, first_queue)
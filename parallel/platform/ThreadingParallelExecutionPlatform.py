@@ -2,8 +2,10 @@
 Provides parallelization functionality based on Python threading library.
 """
 import threading
+from queue import Queue
 
-from parallel.platform.ParallelExecutionPlatform import ParallelExecutionPlatform, ParallelExecutionUnit
+from parallel.platform.ParallelExecutionPlatform import ParallelExecutionPlatform, ParallelExecutionUnit, \
+    ParallelExecutionChannel, QueueBasedParallelExecutionChannel
 
 
 class ThreadingParallelExecutionPlatform(ParallelExecutionPlatform):
@@ -12,32 +14,36 @@ class ThreadingParallelExecutionPlatform(ParallelExecutionPlatform):
     """
     @staticmethod
     def create_parallel_execution_unit(unit_id: int, callback_function: callable, *args, **kwargs):
-        new_thread = threading.Thread(target=callback_function, args=args, kwargs=kwargs)
-        return ThreadingParallelExecutionUnit(unit_id, new_thread)
+        unit_channel, creator_channel = QueueBasedParallelExecutionChannel.create_channel_pair(Queue)
+        new_thread = threading.Thread(target=callback_function, args=(unit_channel,) + args, kwargs=kwargs,
+                                      daemon=True)
+        return ThreadingParallelExecutionUnit(unit_id, new_thread, creator_channel)
 
 
 class ThreadingParallelExecutionUnit(ParallelExecutionUnit):
     """
     A parallel execution unit wrapping a single Python thread.
     """
-    def __init__(self, unit_id: int, thread: threading.Thread):
+    def __init__(self, unit_id: int, thread: threading.Thread, channel: ParallelExecutionChannel):
         super().__init__(unit_id)
         self._thread = thread
+        self._channel = channel
 
     def start(self):
         return self._thread.start()
 
     def stop(self):
-        # TODO: not yet implemented
-        return
+        """
+        Python threads cannot be terminated externally. Instead, an empty object is sent to the unit, which is expected
+        to treat it as a termination request.
+        """
+        self._channel.send(None)
 
     def wait(self, timeout: float = None):
         return self._thread.join(timeout)
 
     def send(self, data: object):
-        # TODO: not yet implemented
-        return
+        self._channel.send(data)
 
     def receive(self, timeout: float = None):
-        # TODO: not yet implemented
-        return
+        return self._channel.receive(timeout)
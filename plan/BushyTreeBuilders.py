@@ -6,23 +6,26 @@ from typing import List, Dict
 from plan.TreePlan import TreePlanNode
 from plan.TreePlanBuilder import TreePlanBuilder
 from base.Pattern import Pattern
-from misc.Utils import get_all_disjoint_sets
 from misc.LegacyStatistics import MissingStatisticsException
 from adaptive.statistics.StatisticsTypes import StatisticsTypes
 from plan.LeftDeepTreeBuilders import GreedyLeftDeepTreeBuilder
-from itertools import combinations
 
 
 class DynamicProgrammingBushyTreeBuilder(TreePlanBuilder):
     """
     Creates a bushy tree using a dynamic programming algorithm.
+    The subsets of the pattern events are represented as bitmasks. Following the DPccp algorithm, only the pairs of
+    disjoint subsets that are connected by conditions (i.e., selectivities lower than 1) and are connected to each other
+    are joined, such that no cross products are considered. If the events of the pattern cannot be connected this way,
+    the best plans of the connected components are then joined using cross products.
+    The expected number of partial matches and the cost of the best plan are memoized for every subset, allowing each
+    split to be priced in constant time. Tree plan nodes are only created for the best plan of the full set of events.
     """
     def _create_tree_topology(self, pattern: Pattern, statistics: Dict, leaves: List[TreePlanNode]):
         if StatisticsTypes.ARRIVAL_RATES in statistics and \
                 StatisticsTypes.SELECTIVITY_MATRIX in statistics and \
                 len(statistics) == 2:
             selectivity_matrix = statistics[StatisticsTypes.SELECTIVITY_MATRIX]
-            arrival_rates = statistics[StatisticsTypes.ARRIVAL_RATES]
         else:
             raise MissingStatisticsException()
 
@@ -30,39 +33,150 @@ class DynamicProgrammingBushyTreeBuilder(TreePlanBuilder):
         if args_num == 1:
             return leaves[0]
 
-        items = frozenset(range(args_num))
-        # Save subsets' optimal topologies, the cost and the left to add items.
-        # In case of a nested node and not a real Primitive, creates nested node instead
-        sub_trees = {frozenset({i}): (leaves[i],
-                                      self._get_plan_cost(pattern, leaves[i], statistics),
-                                      items.difference({i}))
-                     for i in items}
+        neighbors = DynamicProgrammingBushyTreeBuilder.__get_neighbors(selectivity_matrix)
+        # the cost of a leaf is the number of partial matches it contains
+        partial_matches = {1 << i: self._get_plan_cost(pattern, leaf, statistics) for i, leaf in enumerate(leaves)}
+        # maps each subset to the cost of its best plan and to the left and right subsets it is split into
+        best_plans = {subset: (cost, None, None) for subset, cost in partial_matches.items()}
 
-        # for each subset of size i, find optimal topology for these subsets according to size (i-1) subsets.
-        for i in range(2, args_num + 1):
-            for tSubset in combinations(items, i):
-                subset = frozenset(tSubset)
-                disjoint_sets_iter = get_all_disjoint_sets(subset)  # iterator for all disjoint splits of a set.
-                # use first option as speculative best.
-                set1_, set2_ = next(disjoint_sets_iter)
-                tree1_, _, _ = sub_trees[set1_]
-                tree2_, _, _ = sub_trees[set2_]
-                new_tree_ = TreePlanBuilder._instantiate_binary_node(pattern, tree1_, tree2_)
-                new_cost_ = self._get_plan_cost(pattern, new_tree_, statistics)
-                new_left_ = items.difference({subset})
-                sub_trees[subset] = new_tree_, new_cost_, new_left_
-                # find the best topology based on previous topologies for smaller subsets.
-                for set1, set2 in disjoint_sets_iter:
-                    tree1, _, _ = sub_trees[set1]
-                    tree2, _, _ = sub_trees[set2]
-                    new_tree = TreePlanBuilder._instantiate_binary_node(pattern, tree1, tree2)
-                    new_cost = self._get_plan_cost(pattern, new_tree, statistics)
-                    _, cost, left = sub_trees[subset]
-                    # if new subset's topology is better, then update to it.
-                    if new_cost < cost:
-                        sub_trees[subset] = new_tree, new_cost, left
-        # the best topology (index 0 at tuple) for items - the set of all arguments
-        return sub_trees[items][0]
+        def update_best_plan(left: int, right: int):
+            """
+            Considers the plan joining the best plans of the given subsets.
+            """
+            subset = left | right
+            if subset not in partial_matches:
+                subset_partial_matches = partial_matches[left] * partial_matches[right]
+                for i in DynamicProgrammingBushyTreeBuilder.__get_indices(left):
+                    for j in DynamicProgrammingBushyTreeBuilder.__get_indices(right):
+                        subset_partial_matches *= selectivity_matrix[i][j]
+                partial_matches[subset] = subset_partial_matches
+            cost = best_plans[left][0] + best_plans[right][0] + partial_matches[subset]
+            if subset not in best_plans or cost < best_plans[subset][0]:
+                best_plans[subset] = cost, left, right
+
+        DynamicProgrammingBushyTreeBuilder.__enumerate_connected_complement_pairs(neighbors, update_best_plan)
+        components = DynamicProgrammingBushyTreeBuilder.__get_connected_components(neighbors)
+        if len(components) > 1:
+            # cross products are only created between the connected components, treating each one as a single event
+            all_components = (1 << len(components)) - 1
+            components_neighbors = [all_components & ~(1 << i) for i in range(len(components))]
+
+            def get_events(components_subset: int):
+                events_subset = 0
+                for i in DynamicProgrammingBushyTreeBuilder.__get_indices(components_subset):
+                    events_subset |= components[i]
+                return events_subset
+
+            DynamicProgrammingBushyTreeBuilder.__enumerate_connected_complement_pairs(
+                components_neighbors, lambda left, right: update_best_plan(get_events(left), get_events(right)))
+        return DynamicProgrammingBushyTreeBuilder.__instantiate_best_plan(pattern, (1 << args_num) - 1,
+                                                                          best_plans, leaves)
+
+    @staticmethod
+    def __get_neighbors(selectivity_matrix: List[List[float]]):
+        """
+        Returns, for each event, the bitmask of the events it shares a condition with.
+        """
+        args_num = len(selectivity_matrix)
+        neighbors = [0] * args_num
+        for i in range(args_num):
+            for j in range(args_num):
+                if i != j and (selectivity_matrix[i][j] < 1.0 or selectivity_matrix[j][i] < 1.0):
+                    neighbors[i] |= 1 << j
+        return neighbors
+
+    @staticmethod
+    def __get_connected_components(neighbors: List[int]):
+        """
+        Returns the bitmasks of the connected components of the given graph ordered by their lowest event index.
+        """
+        components = []
+        remaining = (1 << len(neighbors)) - 1
+        while remaining:
+            component = frontier = remaining & -remaining
+            while frontier:
+                new_component = component
+                for i in DynamicProgrammingBushyTreeBuilder.__get_indices(frontier):
+                    new_component |= neighbors[i]
+                frontier = new_component & ~component
+                component = new_component
+            components.append(component)
+            remaining &= ~component
+        return components
+
+    @staticmethod
+    def __enumerate_connected_complement_pairs(neighbors: List[int], callback: callable):
+        """
+        Invokes the given callback on every pair of disjoint connected subsets that are connected to each other.
+        The pairs are enumerated as in the DPccp algorithm by Moerkotte and Neumann, which guarantees that the callback
+        is invoked on all the pairs forming a subset before this subset is passed to it.
+        The left subset of each pair always contains the lowest event index of their union.
+        """
+        def get_neighborhood(subset: int):
+            neighborhood = 0
+            for i in DynamicProgrammingBushyTreeBuilder.__get_indices(subset):
+                neighborhood |= neighbors[i]
+            return neighborhood
+
+        def enumerate_connected_subsets(subset: int, excluded: int):
+            neighborhood = get_neighborhood(subset) & ~excluded
+            for extension in DynamicProgrammingBushyTreeBuilder.__get_subsets(neighborhood):
+                emit_connected_subset(subset | extension)
+            for extension in DynamicProgrammingBushyTreeBuilder.__get_subsets(neighborhood):
+                enumerate_connected_subsets(subset | extension, excluded | neighborhood)
+
+        def emit_connected_subset(left: int):
+            lowest_index = (left & -left).bit_length() - 1
+            excluded = left | ((1 << (lowest_index + 1)) - 1)
+            neighborhood = get_neighborhood(left) & ~excluded
+            for i in reversed(DynamicProgrammingBushyTreeBuilder.__get_indices(neighborhood)):
+                callback(left, 1 << i)
+                enumerate_complements(left, 1 << i, excluded | (neighborhood & ((1 << (i + 1)) - 1)))
+
+        def enumerate_complements(left: int, right: int, excluded: int):
+            neighborhood = get_neighborhood(right) & ~excluded
+            for extension in DynamicProgrammingBushyTreeBuilder.__get_subsets(neighborhood):
+                callback(left, right | extension)
+            for extension in DynamicProgrammingBushyTreeBuilder.__get_subsets(neighborhood):
+                enumerate_complements(left, right | extension, excluded | neighborhood)
+
+        for index in reversed(range(len(neighbors))):
+            emit_connected_subset(1 << index)
+            enumerate_connected_subsets(1 << index, (1 << (index + 1)) - 1)
+
+    @staticmethod
+    def __instantiate_best_plan(pattern: Pattern, subset: int, best_plans: Dict, leaves: List[TreePlanNode]):
+        """
+        Creates the tree plan nodes of the best plan found for the given subset.
+        """
+        _, left, right = best_plans[subset]
+        if left is None:
+            return leaves[subset.bit_length() - 1]
+        left_tree = DynamicProgrammingBushyTreeBuilder.__instantiate_best_plan(pattern, left, best_plans, leaves)
+        right_tree = DynamicProgrammingBushyTreeBuilder.__instantiate_best_plan(pattern, right, best_plans, leaves)
+        return TreePlanBuilder._instantiate_binary_node(pattern, left_tree, right_tree)
+
+    @staticmethod
+    def __get_indices(subset: int):
+        """
+        Returns the indices of the events in the given subset in an ascending order.
+        """
+        indices = []
+        while subset:
+            lowest_bit = subset & -subset
+            indices.append(lowest_bit.bit_length() - 1)
+            subset ^= lowest_bit
+        return indices
+
+    @staticmethod
+    def __get_subsets(subset: int):
+        """
+        A generator for all non-empty subsets of the given subset in an ascending order.
+        """
+        current = subset & -subset
+        while current:
+            yield current
+            current = (current - subset) & subset
 
 
 class ZStreamTreeBuilder(TreePlanBuilder):
@@ -1,5 +1,8 @@
+import math
 import random
+import time
 from enum import Enum
+from typing import List
 
 
 class IterativeImprovementType(Enum):
@@ -20,24 +23,129 @@ class IterativeImprovementInitType(Enum):
     GREEDY = 1
 
 
+class IterativeImprovementSearchType(Enum):
+    """
+    The way of deciding whether to accept a move:
+    - hill climbing (only accept moves decreasing the cost of the current order)
+    - simulated annealing (also accept moves increasing the cost, with a probability decreasing as the search proceeds)
+    """
+    HILL_CLIMBING = 0
+    SIMULATED_ANNEALING = 1
+
+
+class LeftDeepOrderCostCalculator:
+    """
+    Calculates the cost of a left-deep evaluation order according to the intermediate results cost model.
+    The expected number of partial matches of every prefix of the order is stored, such that after a move only the
+    prefixes ending between the first and the last modified positions have to be recalculated.
+    """
+    def __init__(self, order: List[int], leaf_costs: List[float], selectivity_matrix: List[List[float]]):
+        # the order is shared with the caller and modified by it
+        self.__order = order
+        self.__leaf_costs = leaf_costs
+        self.__selectivity_matrix = selectivity_matrix
+        self.__prefix_partial_matches = [0.0] * len(order)
+        self.__recalculate_prefixes(0, len(order))
+        self.__pending_prefixes = None
+
+    def get_cost(self):
+        """
+        Returns the cost of the order. The cost of a left-deep tree is the sum of the costs of its leaves and the
+        numbers of partial matches in its internal nodes.
+        """
+        return sum(self.__leaf_costs[i] for i in self.__order) + sum(self.__prefix_partial_matches[1:])
+
+    def get_move_cost_difference(self, first_position: int, last_position: int):
+        """
+        Given that the order was modified between the two given positions, recalculates the affected prefixes and
+        returns the resulting change in the cost of the order. The move must then be either committed or reverted.
+        """
+        self.__pending_prefixes = first_position, self.__prefix_partial_matches[first_position:last_position]
+        self.__recalculate_prefixes(first_position, last_position)
+        first_internal_position = max(first_position, 1)
+        old_prefixes = self.__pending_prefixes[1][first_internal_position - first_position:]
+        new_prefixes = self.__prefix_partial_matches[first_internal_position:last_position]
+        return sum(new_prefixes) - sum(old_prefixes)
+
+    def commit_move(self):
+        """
+        Accepts the last move.
+        """
+        self.__pending_prefixes = None
+
+    def revert_move(self):
+        """
+        Restores the prefixes recalculated by the last move. The order itself is restored by the caller.
+        """
+        first_position, old_prefixes = self.__pending_prefixes
+        self.__prefix_partial_matches[first_position:first_position + len(old_prefixes)] = old_prefixes
+        self.__pending_prefixes = None
+
+    def __recalculate_prefixes(self, first_position: int, last_position: int):
+        """
+        Recalculates the numbers of partial matches of the prefixes ending between the given positions.
+        """
+        order, selectivity_matrix = self.__order, self.__selectivity_matrix
+        partial_matches = 1.0 if first_position == 0 else self.__prefix_partial_matches[first_position - 1]
+        for position in range(first_position, last_position):
+            event = order[position]
+            partial_matches *= self.__leaf_costs[event]
+            selectivity_row = selectivity_matrix[event]
+            for previous_position in range(position):
+                partial_matches *= selectivity_row[order[previous_position]]
+            self.__prefix_partial_matches[position] = partial_matches
+
+
 class IterativeImprovement:
     """
     Implements the generic iterative improvement algorithm.
     """
-    def execute(self, step_limit: int, initial_order: list, get_cost_callback: callable):
-        new_order = initial_order.copy()
-        curr_cost = get_cost_callback(new_order)
+    def execute(self, step_limit: int, initial_order: list, leaf_costs: List[float],
+                selectivity_matrix: List[List[float]],
+                initial_temperature_ratio: float = 0.0, deadline: float = None, random_seed: int = None):
+        """
+        Runs the search starting from the given order for the given number of steps or until the given deadline
+        (in seconds since the epoch) is reached, whichever comes first. The cost of each move is calculated
+        incrementally according to the intermediate results cost model.
+        If the initial temperature ratio is positive, simulated annealing is performed with an initial temperature
+        proportional to the cost of the initial order, which linearly decreases to zero. Otherwise, only the moves
+        decreasing the cost are accepted.
+        Returns the best order found and its cost.
+        """
+        random_generator = random if random_seed is None else random.Random(random_seed)
+        order = initial_order.copy()
+        cost_calculator = LeftDeepOrderCostCalculator(order, leaf_costs, selectivity_matrix)
+        curr_cost = best_cost = cost_calculator.get_cost()
+        best_order = order.copy()
+        initial_temperature = curr_cost * initial_temperature_ratio
         for step in range(step_limit):
-            current_move = self._movement_generator(len(new_order))
-            self._movement_function(new_order, current_move)
-            new_cost = get_cost_callback(new_order)
-            if new_cost < curr_cost:
-                curr_cost = new_cost
+            if deadline is not None and time.time() >= deadline:
+                break
+            current_move = self._movement_generator(len(order), random_generator)
+            self._movement_function(order, current_move)
+            cost_difference = cost_calculator.get_move_cost_difference(min(current_move), max(current_move))
+            if cost_difference < 0 or IterativeImprovement.__should_accept_worse_move(
+                    cost_difference, initial_temperature * (1 - step / step_limit), random_generator):
+                cost_calculator.commit_move()
+                curr_cost += cost_difference
+                if curr_cost < best_cost:
+                    best_cost = curr_cost
+                    best_order = order.copy()
             else:
-                self._movement_function(new_order, self._reverse_move(current_move))
-        return new_order
+                self._movement_function(order, self._reverse_move(current_move))
+                cost_calculator.revert_move()
+        return best_order, best_cost
 
-    def _movement_generator(self, movement_range: int):
+    @staticmethod
+    def __should_accept_worse_move(cost_difference: float, temperature: float, random_generator):
+        """
+        Decides whether a move increasing the cost is accepted according to the Metropolis criterion.
+        """
+        if temperature <= 0:
+            return False
+        return random_generator.random() < math.exp(-cost_difference / temperature)
+
+    def _movement_generator(self, movement_range: int, random_generator=random):
         raise NotImplementedError()
 
     def _movement_function(self, order: list, move: object):
@@ -51,9 +159,9 @@ class SwapBasedIterativeImprovement(IterativeImprovement):
     """
     Implements the swap-based iterative improvement algorithm.
     """
-    def _movement_generator(self, movement_range: int):
-        i = random.randint(0, movement_range - 1)
-        j = random.randint(i, movement_range - 1)
+    def _movement_generator(self, movement_range: int, random_generator=random):
+        i = random_generator.randint(0, movement_range - 1)
+        j = random_generator.randint(i, movement_range - 1)
         return i, j
 
     def _movement_function(self, order: list, move: object):
@@ -71,11 +179,11 @@ class CircleBasedIterativeImprovement(IterativeImprovement):
     """
     Implements the circle-based iterative improvement algorithm.
     """
-    def _movement_generator(self, movement_range: int):
-        i = random.randint(0, movement_range - 3)
-        j = random.randint(i + 1, movement_range - 2)
-        k = random.randint(j + 1, movement_range - 1)
-        if random.randint(0, 1) == 1:
+    def _movement_generator(self, movement_range: int, random_generator=random):
+        i = random_generator.randint(0, movement_range - 3)
+        j = random_generator.randint(i + 1, movement_range - 2)
+        k = random_generator.randint(j + 1, movement_range - 1)
+        if random_generator.randint(0, 1) == 1:
             return i, j, k
         return i, k, j
 
@@ -88,7 +196,7 @@ class CircleBasedIterativeImprovement(IterativeImprovement):
 
     def _reverse_move(self, move: object):
         i, j, k = move
-        return k, i, j
+        return i, k, j
 
 
 class IterativeImprovementAlgorithmBuilder:
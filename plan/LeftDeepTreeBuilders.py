@@ -2,12 +2,15 @@
 This file contains the implementations of algorithms constructing a left-deep tree-based evaluation mechanism.
 """
 import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
 from typing import List, Dict
 
 from base.PatternStructure import CompositeStructure
 from misc import DefaultConfig
 from plan.IterativeImprovement import IterativeImprovementType, IterativeImprovementInitType, \
-    IterativeImprovementAlgorithmBuilder
+    IterativeImprovementAlgorithmBuilder, IterativeImprovementSearchType
 from plan.TreeCostModels import TreeCostModels
 from plan.TreePlan import TreePlanNode, TreePlanLeafNode
 from plan.TreePlanBuilder import TreePlanBuilder
@@ -138,14 +141,26 @@ class GreedyLeftDeepTreeBuilder(LeftDeepTreeBuilder):
 class IterativeImprovementLeftDeepTreeBuilder(LeftDeepTreeBuilder):
     """
     Creates a left-deep tree using the iterative improvement procedure.
+    Several independent searches can be executed, in which case the first one starts from the order specified by the
+    initialization type and the rest start from random orders. If more than one worker is requested, the searches are
+    distributed over a process pool. The best order found by all searches within the time limit (if any) is returned.
     """
     def __init__(self, cost_model_type: TreeCostModels, negation_algorithm_type: NegationAlgorithmTypes,
                  step_limit: int, ii_type: IterativeImprovementType = DefaultConfig.ITERATIVE_IMPROVEMENT_TYPE,
-                 init_type: IterativeImprovementInitType = DefaultConfig.ITERATIVE_IMPROVEMENT_TYPE):
+                 init_type: IterativeImprovementInitType = DefaultConfig.ITERATIVE_IMPROVEMENT_INIT_TYPE,
+                 search_type: IterativeImprovementSearchType = DefaultConfig.ITERATIVE_IMPROVEMENT_SEARCH_TYPE,
+                 restarts_number: int = DefaultConfig.ITERATIVE_IMPROVEMENT_RESTARTS_NUMBER,
+                 workers_number: int = DefaultConfig.ITERATIVE_IMPROVEMENT_WORKERS_NUMBER,
+                 time_limit: timedelta = DefaultConfig.ITERATIVE_IMPROVEMENT_TIME_LIMIT):
         super().__init__(cost_model_type, negation_algorithm_type)
         self.__iterative_improvement = IterativeImprovementAlgorithmBuilder.create_ii_algorithm(ii_type)
         self.__initType = init_type
         self.__step_limit = step_limit
+        self.__initial_temperature_ratio = DefaultConfig.SIMULATED_ANNEALING_INITIAL_TEMPERATURE_RATIO \
+            if search_type == IterativeImprovementSearchType.SIMULATED_ANNEALING else 0.0
+        self.__restarts_number = restarts_number
+        self.__workers_number = workers_number
+        self.__time_limit = time_limit
 
     def _create_evaluation_order(self, pattern: Pattern, statistics: Dict):
         if StatisticsTypes.ARRIVAL_RATES in statistics and \
@@ -155,13 +170,34 @@ class IterativeImprovementLeftDeepTreeBuilder(LeftDeepTreeBuilder):
             arrival_rates = statistics[StatisticsTypes.ARRIVAL_RATES]
         else:
             raise MissingStatisticsException()
+        deadline = None if self.__time_limit is None else time.time() + self.__time_limit.total_seconds()
         order = None
         if self.__initType == IterativeImprovementInitType.RANDOM:
             order = self.__get_random_order(len(arrival_rates))
         elif self.__initType == IterativeImprovementInitType.GREEDY:
             order = GreedyLeftDeepTreeBuilder.calculate_greedy_order(selectivity_matrix, arrival_rates)
-        get_cost_callback = lambda o: self._get_order_cost(pattern, o, statistics)
-        return self.__iterative_improvement.execute(self.__step_limit, order, get_cost_callback)
+        initial_orders = [order] + [self.__get_random_order(len(arrival_rates))
+                                    for _ in range(self.__restarts_number - 1)]
+        # the cost of a leaf is the number of partial matches it contains
+        leaf_costs = [self._get_order_cost(pattern, [i], statistics) for i in range(len(arrival_rates))]
+        if self.__workers_number > 1 and len(initial_orders) > 1:
+            # each process receives its own seed, as otherwise the processes would generate identical moves
+            with ProcessPoolExecutor(max_workers=min(self.__workers_number, len(initial_orders))) as executor:
+                futures = [executor.submit(self.__iterative_improvement.execute, self.__step_limit, initial_order,
+                                           leaf_costs, selectivity_matrix, self.__initial_temperature_ratio,
+                                           deadline, random.getrandbits(32))
+                           for initial_order in initial_orders]
+                results = [future.result() for future in futures]
+        else:
+            results = []
+            for initial_order in initial_orders:
+                if len(results) > 0 and deadline is not None and time.time() >= deadline:
+                    break
+                results.append(self.__iterative_improvement.execute(self.__step_limit, initial_order, leaf_costs,
+                                                                    selectivity_matrix,
+                                                                    self.__initial_temperature_ratio, deadline))
+        best_order, _ = min(results, key=lambda result: result[1])
+        return best_order
 
     @staticmethod
     def __get_random_order(n: int):
@@ -180,6 +216,10 @@ class IterativeImprovementLeftDeepTreeBuilder(LeftDeepTreeBuilder):
 class DynamicProgrammingLeftDeepTreeBuilder(LeftDeepTreeBuilder):
     """
     Creates a left-deep tree using a dynamic programming algorithm.
+    Following the algorithm by Selinger et al., the subsets of the pattern events are represented as bitmasks and
+    processed in an ascending order, such that all subsets of a subset are handled before it. The expected number of
+    partial matches and the cost of the best order are kept for every subset, and the best order of a subset is found by
+    extending the best orders of its subsets missing a single event.
     """
     def _create_evaluation_order(self, pattern: Pattern, statistics: Dict):
         if StatisticsTypes.ARRIVAL_RATES in statistics and \
@@ -192,32 +232,49 @@ class DynamicProgrammingLeftDeepTreeBuilder(LeftDeepTreeBuilder):
         if args_num == 1:  # boring extreme case
             return [0]
 
-        items = frozenset(range(args_num))
-        # Save subsets' optimal orders, the cost and the left to add items.
-        sub_orders = {frozenset({i}): ([i],
-                                       self._get_order_cost(pattern, [i], statistics),
-                                       items.difference({i}))
-                      for i in items}
-
-        for i in range(2, args_num + 1):
-            # for each subset of size i, we will find the best order for each subset
-            next_orders = {}
-            for subset in sub_orders.keys():
-                order, _, left_to_add = sub_orders[subset]
-                for item in left_to_add:
-                    # calculate for optional order for set of size i
-                    new_subset = frozenset(subset.union({item}))
-                    new_cost = self._get_order_cost(pattern, order, statistics)
-                    # check if it is not the first order for that set
-                    if new_subset in next_orders.keys():
-                        _, t_cost, t_left = next_orders[new_subset]
-                        if new_cost < t_cost:  # check if it is the current best order for that set
-                            new_order = order + [item]
-                            next_orders[new_subset] = new_order, new_cost, t_left
-                    else:  # if it is the first order for that set
-                        new_order = order + [item]
-                        next_orders[new_subset] = new_order, new_cost, left_to_add.difference({item})
-            # update subsets for next iteration
-            sub_orders = next_orders
-        return list(sub_orders.values())[0][
-            0]  # return the order (at index 0 in the tuple) of item 0, the only item in subsets of size n.
+        # the cost of a leaf is the number of partial matches it contains
+        leaf_costs = [self._get_order_cost(pattern, [i], statistics) for i in range(args_num)]
+        subsets_num = 1 << args_num
+        # for each subset, the expected number of partial matches, the cost of the best order and its last event
+        partial_matches = [0.0] * subsets_num
+        costs = [0.0] * subsets_num
+        last_events = [0] * subsets_num
+        for i in range(args_num):
+            partial_matches[1 << i] = costs[1 << i] = leaf_costs[i]
+            last_events[1 << i] = i
+
+        for subset in range(1, subsets_num):
+            lowest_bit = subset & -subset
+            if subset == lowest_bit:
+                continue
+            indices = []
+            remaining = subset
+            while remaining:
+                bit = remaining & -remaining
+                indices.append(bit.bit_length() - 1)
+                remaining ^= bit
+            # the number of partial matches does not depend on the order - it is derived by adding the lowest event
+            lowest_index = indices[0]
+            subset_partial_matches = partial_matches[subset ^ lowest_bit] * leaf_costs[lowest_index]
+            selectivity_row = selectivity_matrix[lowest_index]
+            for i in indices[1:]:
+                subset_partial_matches *= selectivity_row[i]
+            partial_matches[subset] = subset_partial_matches
+
+            # ties are broken by placing last the event with more partial matches and then the one with a higher index
+            best_cost, best_prefix_cost, best_last_event = None, None, None
+            for i in reversed(indices):
+                prefix_cost = costs[subset ^ (1 << i)]
+                cost = prefix_cost + leaf_costs[i]
+                if best_cost is None or cost < best_cost or (cost == best_cost and prefix_cost < best_prefix_cost):
+                    best_cost, best_prefix_cost, best_last_event = cost, prefix_cost, i
+            costs[subset] = best_cost + subset_partial_matches
+            last_events[subset] = best_last_event
+
+        order = []
+        subset = subsets_num - 1
+        while subset:
+            order.append(last_events[subset])
+            subset ^= 1 << last_events[subset]
+        order.reverse()
+        return order
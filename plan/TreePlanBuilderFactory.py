@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 from plan.negation.NegationAlgorithmTypes import NegationAlgorithmTypes
 from plan.BushyTreeBuilders import *
 from plan.invariant.InvariantBushyTreeBuilder import InvariantAwareZStreamTreeBuilder
@@ -25,14 +27,23 @@ class IterativeImprovementTreePlanBuilderParameters(TreePlanBuilderParameters):
     """
     Parameters for tree plan builders based on local search include the number of search steps, the
     choice of the neighborhood (step) function, and the way to generate the initial state.
+    Optionally, several independent searches can be executed, possibly in parallel, and bounded by a time limit.
     """
     def __init__(self, cost_model_type: TreeCostModels, step_limit: int,
                  ii_type: IterativeImprovementType = DefaultConfig.ITERATIVE_IMPROVEMENT_TYPE,
-                 init_type: IterativeImprovementInitType = DefaultConfig.ITERATIVE_IMPROVEMENT_INIT_TYPE):
+                 init_type: IterativeImprovementInitType = DefaultConfig.ITERATIVE_IMPROVEMENT_INIT_TYPE,
+                 search_type: IterativeImprovementSearchType = DefaultConfig.ITERATIVE_IMPROVEMENT_SEARCH_TYPE,
+                 restarts_number: int = DefaultConfig.ITERATIVE_IMPROVEMENT_RESTARTS_NUMBER,
+                 workers_number: int = DefaultConfig.ITERATIVE_IMPROVEMENT_WORKERS_NUMBER,
+                 time_limit: timedelta = DefaultConfig.ITERATIVE_IMPROVEMENT_TIME_LIMIT):
         super().__init__(TreePlanBuilderTypes.LOCAL_SEARCH_LEFT_DEEP_TREE, cost_model_type)
         self.ii_type = ii_type
         self.init_type = init_type
         self.step_limit = step_limit
+        self.search_type = search_type
+        self.restarts_number = restarts_number
+        self.workers_number = workers_number
+        self.time_limit = time_limit
 
 
 class TreePlanBuilderFactory:
@@ -55,7 +66,11 @@ class TreePlanBuilderFactory:
                                                            tree_plan_params.negation_algorithm_type,
                                                            tree_plan_params.step_limit,
                                                            tree_plan_params.ii_type,
-                                                           tree_plan_params.init_type)
+                                                           tree_plan_params.init_type,
+                                                           tree_plan_params.search_type,
+                                                           tree_plan_params.restarts_number,
+                                                           tree_plan_params.workers_number,
+                                                           tree_plan_params.time_limit)
         if tree_plan_params.builder_type == TreePlanBuilderTypes.DYNAMIC_PROGRAMMING_LEFT_DEEP_TREE:
             return DynamicProgrammingLeftDeepTreeBuilder(tree_plan_params.cost_model_type,
                                                          tree_plan_params.negation_algorithm_type)
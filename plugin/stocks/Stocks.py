@@ -1,8 +1,9 @@
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from base.DataFormatter import DataFormatter, EventTypeClassifier
-from misc.Utils import str_to_number
+from base.LazyEventPayload import LazyEventPayload
+from misc.Utils import str_to_number, decimal_str_to_number
 
 METASTOCK_STOCK_TICKER_KEY = "Stock Ticker"
 METASTOCK_EVENT_TIMESTAMP_KEY = "Date"
@@ -19,6 +20,18 @@ METASTOCK_7_COLUMN_KEYS = [
 
 ADDITIONAL_OPTIONAL_KEYS = [PROBABILITY_KEY]
 
+# a column schema for the metastock 7 format (followed by an optional probability), converting each column in the same
+# way as the schemaless parsing does for well-formed inputs
+METASTOCK_7_COLUMN_SCHEMA = [
+    (METASTOCK_STOCK_TICKER_KEY, str),
+    (METASTOCK_EVENT_TIMESTAMP_KEY, int),
+    ("Opening Price", decimal_str_to_number),
+    ("Peak Price", decimal_str_to_number),
+    ("Lowest Price", decimal_str_to_number),
+    ("Close Price", decimal_str_to_number),
+    ("Volume", decimal_str_to_number),
+    (PROBABILITY_KEY, float)]
+
 
 class MetastockByTickerEventTypeClassifier(EventTypeClassifier):
     """
@@ -36,14 +49,29 @@ class MetastockDataFormatter(DataFormatter):
     A data formatter implementation for a stock event stream, where each event is given as a string in metastock 7
     format.
     """
-    def __init__(self, event_type_classifier: EventTypeClassifier = MetastockByTickerEventTypeClassifier()):
+    def __init__(self, event_type_classifier: EventTypeClassifier = MetastockByTickerEventTypeClassifier(),
+                 column_schema: List[Tuple[str, Callable[[str], Any]]] = None):
+        """
+        If a column schema consisting of the name and the converter of each column is provided, the columns are not
+        probed for their types. Instead, each event payload is created lazily, such that only the attributes required
+        for deducing the type and the timestamp of an event are converted before it is either discarded or processed.
+        """
         super().__init__(event_type_classifier)
+        if column_schema is None:
+            self.__column_indices = self.__column_converters = None
+        else:
+            self.__column_indices = {key: index for index, (key, _) in enumerate(column_schema)}
+            self.__column_converters = [converter for _, converter in column_schema]
+        # the most recently parsed timestamp, as consecutive events typically share the same one
+        self.__last_timestamp = (None, None)
 
     def parse_event(self, raw_data: str):
         """
         Parses a metastock 7 formatted string into an event.
         """
         event_attributes = raw_data.replace("\n", "").split(",")
+        if self.__column_indices is not None:
+            return LazyEventPayload(self.__column_indices, self.__column_converters, event_attributes)
         return dict(zip(
             METASTOCK_7_COLUMN_KEYS + ADDITIONAL_OPTIONAL_KEYS,
             map(str_to_number, event_attributes)
@@ -53,9 +81,17 @@ class MetastockDataFormatter(DataFormatter):
         """
         The event timestamp is represented in metastock 7 using a YYYYMMDDhhmm format.
         """
-        timestamp_str = str(event_payload[METASTOCK_EVENT_TIMESTAMP_KEY])
-        return datetime(year=int(timestamp_str[0:4]), month=int(timestamp_str[4:6]), day=int(timestamp_str[6:8]),
-                        hour=int(timestamp_str[8:10]), minute=int(timestamp_str[10:12]))
+        timestamp_str = event_payload.get_raw_value(METASTOCK_EVENT_TIMESTAMP_KEY) \
+            if isinstance(event_payload, LazyEventPayload) else None
+        if timestamp_str is None:
+            timestamp_str = str(event_payload[METASTOCK_EVENT_TIMESTAMP_KEY])
+        last_timestamp_str, last_timestamp = self.__last_timestamp
+        if timestamp_str == last_timestamp_str:
+            return last_timestamp
+        timestamp = datetime(year=int(timestamp_str[0:4]), month=int(timestamp_str[4:6]), day=int(timestamp_str[6:8]),
+                             hour=int(timestamp_str[8:10]), minute=int(timestamp_str[10:12]))
+        self.__last_timestamp = (timestamp_str, timestamp)
+        return timestamp
 
     def get_probability(self, event_payload: Dict[str, Any]) -> Optional[float]:
         return event_payload.get(PROBABILITY_KEY, None)
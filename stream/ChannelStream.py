@@ -0,0 +1,72 @@
+from misc import DefaultConfig
+from parallel.platform.ParallelExecutionPlatform import ParallelExecutionChannel, ParallelExecutionUnit
+from stream.Stream import InputStream, OutputStream
+
+
+class ChannelInputStream(InputStream):
+    """
+    Reads the objects from a parallel execution channel or from an execution unit. The objects are expected to arrive
+    in batches (lists), and an empty object marks the end of the stream.
+    """
+    def __init__(self, channel: ParallelExecutionChannel or ParallelExecutionUnit):
+        super().__init__()
+        self.__channel = channel
+        self.__batch = []
+        self.__batch_index = 0
+        self.__is_closed = False
+
+    def __next__(self):
+        while self.__batch_index >= len(self.__batch):
+            if self.__is_closed:
+                raise StopIteration()
+            batch = self.__channel.receive()
+            if batch is None:
+                self.__is_closed = True
+                raise StopIteration()
+            self.__batch = batch
+            self.__batch_index = 0
+        item = self.__batch[self.__batch_index]
+        self.__batch_index += 1
+        return item
+
+    def duplicate(self):
+        raise Exception("Unsupported operation")
+
+    def count(self):
+        raise Exception("Unsupported operation")
+
+    def first(self):
+        raise Exception("Unsupported operation")
+
+    def last(self):
+        raise Exception("Unsupported operation")
+
+
+class ChannelOutputStream(OutputStream):
+    """
+    Writes the objects into a parallel execution channel or to an execution unit in batches of a predefined size.
+    Closing the stream flushes the last batch and sends an empty object marking the end of the stream.
+    """
+    def __init__(self, channel: ParallelExecutionChannel or ParallelExecutionUnit,
+                 batch_size: int = DefaultConfig.DEFAULT_PARALLEL_BATCH_SIZE):
+        super().__init__()
+        self.__channel = channel
+        self.__batch_size = batch_size
+        self.__batch = []
+
+    def add_item(self, item: object):
+        self.__batch.append(item)
+        if len(self.__batch) >= self.__batch_size:
+            self.flush()
+
+    def close(self):
+        self.flush()
+        self.__channel.send(None)
+
+    def flush(self):
+        """
+        Sends the items accumulated so far without waiting for the batch to fill up.
+        """
+        if len(self.__batch) > 0:
+            self.__channel.send(self.__batch)
+            self.__batch = []
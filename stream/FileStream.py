@@ -1,21 +1,115 @@
+import gzip
+import io
+import mmap
 import os
 
+from misc import DefaultConfig
 from stream.Stream import InputStream, OutputStream
 
 
 class FileInputStream(InputStream):
     """
     Reads the objects from a predefined input file.
+    The entire content of the file is loaded into memory upon creation. For large files, consider using
+    LazyFileInputStream instead.
     """
     def __init__(self, file_path: str):
         super().__init__()
-        # TODO: reading the entire content of the input file here is very inefficient
         with open(file_path, "r") as f:
             for line in f.readlines():
                 self._stream.put(line)
         self.close()
 
 
+class LazyFileInputStream(InputStream):
+    """
+    Reads the objects from a predefined input file line by line, only as the stream is being consumed.
+    The file is read in chunks of the given size, either using buffered I/O or by memory-mapping it.
+    Unlike FileInputStream, the lines are never stored in memory in their entirety. As a consequence, operations
+    requiring access to the whole content of the stream are not supported.
+    """
+    def __init__(self, file_path: str, buffer_size: int = DefaultConfig.FILE_STREAM_BUFFER_SIZE,
+                 use_mmap: bool = False):
+        super().__init__()
+        self._file_path = file_path
+        self._buffer_size = buffer_size
+        self._use_mmap = use_mmap
+        self.__lines = self._read_lines()
+
+    def __next__(self):
+        return next(self.__lines)
+
+    def duplicate(self):
+        """
+        Returns a new stream reading the same file from its beginning.
+        """
+        return LazyFileInputStream(self._file_path, self._buffer_size, self._use_mmap)
+
+    def count(self):
+        raise Exception("Unsupported operation")
+
+    def first(self):
+        raise Exception("Unsupported operation")
+
+    def last(self):
+        raise Exception("Unsupported operation")
+
+    def close(self):
+        self.__lines.close()
+
+    def _read_lines(self):
+        """
+        A generator yielding the lines of the input file.
+        """
+        if not self._use_mmap:
+            with self._open_file() as f:
+                yield from f
+            return
+        if os.path.getsize(self._file_path) == 0:
+            # empty files cannot be memory-mapped
+            return
+        with open(self._file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            for line in iter(mapped_file.readline, b""):
+                yield line.decode()
+
+    def _open_file(self):
+        """
+        Opens the input file for buffered reading in text mode.
+        """
+        return open(self._file_path, "r", buffering=self._buffer_size)
+
+
+class CompressedFileInputStream(LazyFileInputStream):
+    """
+    Lazily reads the objects from a predefined compressed input file.
+    The compression format is determined by the file extension: ".gz" for gzip and ".zst" for zstd. Reading zstd files
+    requires the zstandard package to be installed.
+    """
+    GZIP_EXTENSION = ".gz"
+    ZSTD_EXTENSION = ".zst"
+
+    def __init__(self, file_path: str, buffer_size: int = DefaultConfig.FILE_STREAM_BUFFER_SIZE):
+        if not file_path.endswith(CompressedFileInputStream.GZIP_EXTENSION) and \
+                not file_path.endswith(CompressedFileInputStream.ZSTD_EXTENSION):
+            raise Exception("Unknown compression format of the input file: %s" % (file_path,))
+        super().__init__(file_path, buffer_size)
+
+    def duplicate(self):
+        return CompressedFileInputStream(self._file_path, self._buffer_size)
+
+    def _open_file(self):
+        if self._file_path.endswith(CompressedFileInputStream.GZIP_EXTENSION):
+            return io.TextIOWrapper(io.BufferedReader(gzip.open(self._file_path, "rb"), self._buffer_size))
+        try:
+            import zstandard
+        except ImportError:
+            raise Exception("The zstandard package is required for reading zstd-compressed files")
+        compressed_file = open(self._file_path, "rb")
+        reader = zstandard.ZstdDecompressor().stream_reader(compressed_file, read_size=self._buffer_size,
+                                                            closefd=True)
+        return io.TextIOWrapper(io.BufferedReader(reader, self._buffer_size))
+
+
 class FileOutputStream(OutputStream):
     """
     Writes the objects into a predefined output file.
@@ -1,12 +1,37 @@
+from collections import deque
 from queue import Queue
 
 
+class UnsynchronizedQueue:
+    """
+    A lightweight replacement for queue.Queue backed by a plain deque and performing no locking. Only suitable when
+    all operations on the queue are performed by a single thread, in which case a blocking get would never return.
+    Hence, attempting to get an item from an empty queue results in an exception.
+    """
+    def __init__(self):
+        self.queue = deque()
+
+    def put(self, item: object):
+        self.queue.append(item)
+
+    def get(self, block: bool = True):
+        try:
+            return self.queue.popleft()
+        except IndexError:
+            raise Exception("Attempted to read from an empty unsynchronized stream")
+
+    def qsize(self):
+        return len(self.queue)
+
+
 class Stream:
     """
     Represents a generic stream of objects.
+    By default, the stream is thread-safe and reading from it blocks until an item is available. A stream which is only
+    accessed by a single thread can be made unsynchronized to avoid the locking overhead.
     """
-    def __init__(self):
-        self._stream = Queue()
+    def __init__(self, is_thread_safe: bool = True):
+        self._stream = Queue() if is_thread_safe else UnsynchronizedQueue()
 
     def __next__(self):
         next_item = self._stream.get(block=True)  # Blocking get
@@ -24,10 +49,24 @@ class Stream:
         self._stream.put(None)
 
     def duplicate(self):
-        ret = Stream()
+        ret = Stream(self.is_thread_safe())
         ret._stream.queue = self._stream.queue.copy()
         return ret
 
+    def is_thread_safe(self):
+        return isinstance(self._stream, Queue)
+
+    def set_thread_safety(self, is_thread_safe: bool):
+        """
+        Switches the stream between the thread-safe and the unsynchronized implementations while keeping its content.
+        Must not be invoked while other threads access the stream.
+        """
+        if is_thread_safe == self.is_thread_safe():
+            return
+        new_stream = Queue() if is_thread_safe else UnsynchronizedQueue()
+        new_stream.queue = self._stream.queue
+        self._stream = new_stream
+
     def get_item(self):
         return self.__next__()
 
@@ -0,0 +1,67 @@
+import random
+from test.testUtils import *
+from datetime import datetime, timedelta
+from condition.Condition import Variable, BinaryCondition
+from condition.CompositeCondition import AndCondition
+from base.PatternStructure import SeqOperator, AndOperator, PrimitiveEventStructure
+from base.Pattern import Pattern
+from adaptive.statistics.StatisticsTypes import StatisticsTypes
+from plan.LeftDeepTreeBuilders import GreedyLeftDeepTreeBuilder, DynamicProgrammingLeftDeepTreeBuilder
+from plan.TreeCostModel import IntermediateResultsTreeCostModel
+from plan.TreeCostModels import TreeCostModels
+from plan.negation.NegationAlgorithmTypes import NegationAlgorithmTypes
+
+
+def partialMatchHandoffBenchMarkTest():
+    """
+    A pattern producing a large number of partial matches at every level of the tree, thus stressing the transfer of
+    partial matches from nodes to their parents.
+    PATTERN SEQ(MicrosoftStockPriceUpdate a, DrivStockPriceUpdate b, OrlyStockPriceUpdate c, CbrlStockPriceUpdate d)
+    WHERE a.OpeningPrice > b.OpeningPrice AND c.OpeningPrice > d.OpeningPrice
+    WITHIN 10 minutes
+    """
+    pattern = Pattern(
+        SeqOperator(PrimitiveEventStructure("MSFT", "a"), PrimitiveEventStructure("DRIV", "b"),
+                    PrimitiveEventStructure("ORLY", "c"), PrimitiveEventStructure("CBRL", "d")),
+        AndCondition(
+            BinaryCondition(Variable("a", lambda x: x["Opening Price"]),
+                            Variable("b", lambda x: x["Opening Price"]),
+                            relation_op=lambda x, y: x > y),
+            BinaryCondition(Variable("c", lambda x: x["Opening Price"]),
+                            Variable("d", lambda x: x["Opening Price"]),
+                            relation_op=lambda x, y: x > y)
+        ),
+        timedelta(minutes=10)
+    )
+    runBenchMark("partialMatchHandoffBenchMark", [pattern], events=nasdaqEventStreamMedium)
+
+
+def leftDeepPlanningBenchMarkTest():
+    """
+    Compares the dynamic programming left-deep tree builder to the greedy one in terms of the cost of the created plans
+    and the time required to create them. The statistics of patterns of 5 to 20 events are randomly generated.
+    """
+    random_generator = random.Random(0)
+    cost_model = IntermediateResultsTreeCostModel()
+    for events_num in range(5, 21, 5):
+        pattern = Pattern(AndOperator(*[PrimitiveEventStructure("T%d" % i, "e%d" % i) for i in range(events_num)]),
+                          AndCondition(), timedelta(minutes=1))
+        selectivity_matrix = [[1.0] * events_num for _ in range(events_num)]
+        for i in range(events_num):
+            for j in range(i + 1, events_num):
+                selectivity_matrix[i][j] = selectivity_matrix[j][i] = random_generator.uniform(0.05, 1.0)
+        arrival_rates = [random_generator.uniform(0.01, 1.0) for _ in range(events_num)]
+        statistics = {StatisticsTypes.SELECTIVITY_MATRIX: selectivity_matrix,
+                      StatisticsTypes.ARRIVAL_RATES: arrival_rates}
+        results = []
+        for builder_class in [GreedyLeftDeepTreeBuilder, DynamicProgrammingLeftDeepTreeBuilder]:
+            builder = builder_class(TreeCostModels.INTERMEDIATE_RESULTS_TREE_COST_MODEL,
+                                    NegationAlgorithmTypes.NAIVE_NEGATION_ALGORITHM)
+            start_time = datetime.now()
+            plan = builder.build_tree_plan(pattern, statistics)
+            planning_time = (datetime.now() - start_time).total_seconds()
+            results.append((cost_model.get_plan_cost(pattern, plan.root, statistics), planning_time))
+        (greedy_cost, greedy_time), (dp_cost, dp_time) = results
+        print("Bench Mark leftDeepPlanning with %d events completed, greedy plan cost: %s (%s seconds), "
+              "dynamic programming plan cost: %s (%s seconds)" % (events_num, greedy_cost, greedy_time,
+                                                                  dp_cost, dp_time))
@@ -6,6 +6,7 @@ from adaptive.optimizer.OptimizerFactory import StatisticsDeviationAwareOptimize
 from plan.TreePlanBuilderFactory import TreePlanBuilderParameters, TreeCostModels, StatisticsTypes
 from plan.TreePlanBuilderTypes import TreePlanBuilderTypes
 from adaptive.statistics.StatisticsCollectorFactory import StatisticsCollectorParameters
+from adaptive.statistics.StatisticsTypes import SelectivityStatisticsTypes
 from tree.PatternMatchStorage import TreeStorageParameters
 
 
@@ -19,6 +20,14 @@ Default testing statistics collector settings
 DEFAULT_TESTING_STATISTICS_COLLECTOR_SELECTIVITY_AND_ARRIVAL_RATES_STATISTICS = \
     StatisticsCollectorParameters(statistics_types=[StatisticsTypes.SELECTIVITY_MATRIX, StatisticsTypes.ARRIVAL_RATES])
 
+DEFAULT_TESTING_STATISTICS_COLLECTOR_SLIDING_WINDOW_SELECTIVITY_AND_ARRIVAL_RATES_STATISTICS = \
+    StatisticsCollectorParameters(statistics_types=[StatisticsTypes.SELECTIVITY_MATRIX, StatisticsTypes.ARRIVAL_RATES],
+                                  selectivity_statistics_type=SelectivityStatisticsTypes.SLIDING_WINDOW)
+
+DEFAULT_TESTING_STATISTICS_COLLECTOR_EXPONENTIAL_DECAY_SELECTIVITY_AND_ARRIVAL_RATES_STATISTICS = \
+    StatisticsCollectorParameters(statistics_types=[StatisticsTypes.SELECTIVITY_MATRIX, StatisticsTypes.ARRIVAL_RATES],
+                                  selectivity_statistics_type=SelectivityStatisticsTypes.EXPONENTIAL_DECAY)
+
 """
 Default testing tree builder settings
 """
@@ -42,11 +51,27 @@ DEFAULT_TESTING_TRIVIAL_OPTIMIZER_SETTINGS = \
                                statistics_collector_params=DEFAULT_TESTING_STATISTICS_COLLECTOR_SELECTIVITY_AND_ARRIVAL_RATES_STATISTICS,
                                statistics_updates_wait_time=timedelta(minutes=10))
 
+DEFAULT_TESTING_ASYNCHRONOUS_TRIVIAL_OPTIMIZER_SETTINGS = \
+    TrivialOptimizerParameters(tree_plan_params=DEFAULT_BASIC_TESTING_TREE_BUILDER,
+                               statistics_collector_params=DEFAULT_TESTING_STATISTICS_COLLECTOR_SELECTIVITY_AND_ARRIVAL_RATES_STATISTICS,
+                               statistics_updates_wait_time=timedelta(minutes=10),
+                               asynchronous_reoptimization=True)
+
 DEFAULT_TESTING_DEVIATION_AWARE_OPTIMIZER_SETTINGS = \
     StatisticsDeviationAwareOptimizerParameters(tree_plan_params=DEFAULT_BASIC_TESTING_TREE_BUILDER, deviation_threshold=0.5,
                                statistics_collector_params=DEFAULT_TESTING_STATISTICS_COLLECTOR_SELECTIVITY_AND_ARRIVAL_RATES_STATISTICS,
                                statistics_updates_wait_time=timedelta(minutes=10))
 
+DEFAULT_TESTING_SLIDING_WINDOW_SELECTIVITY_DEVIATION_AWARE_OPTIMIZER_SETTINGS = \
+    StatisticsDeviationAwareOptimizerParameters(tree_plan_params=DEFAULT_BASIC_TESTING_TREE_BUILDER, deviation_threshold=0.5,
+                               statistics_collector_params=DEFAULT_TESTING_STATISTICS_COLLECTOR_SLIDING_WINDOW_SELECTIVITY_AND_ARRIVAL_RATES_STATISTICS,
+                               statistics_updates_wait_time=timedelta(minutes=10))
+
+DEFAULT_TESTING_EXPONENTIAL_DECAY_SELECTIVITY_DEVIATION_AWARE_OPTIMIZER_SETTINGS = \
+    StatisticsDeviationAwareOptimizerParameters(tree_plan_params=DEFAULT_BASIC_TESTING_TREE_BUILDER, deviation_threshold=0.5,
+                               statistics_collector_params=DEFAULT_TESTING_STATISTICS_COLLECTOR_EXPONENTIAL_DECAY_SELECTIVITY_AND_ARRIVAL_RATES_STATISTICS,
+                               statistics_updates_wait_time=timedelta(minutes=10))
+
 DEFAULT_TESTING_GREEDY_INVARIANT_OPTIMIZER_SETTINGS = \
     InvariantsAwareOptimizerParameters(tree_plan_params=DEFAULT_TESTING_INVARIANT_AWARE_GREEDY_TREE_BUILDER,
                                statistics_collector_params=DEFAULT_TESTING_STATISTICS_COLLECTOR_SELECTIVITY_AND_ARRIVAL_RATES_STATISTICS,
@@ -80,6 +105,25 @@ DEFAULT_TESTING_TRIVIAL_EVALUATION_MECHANISM_SETTINGS_AND_DEVIATION_AWARE_OPTIMI
                                            optimizer_params=DEFAULT_TESTING_DEVIATION_AWARE_OPTIMIZER_SETTINGS)
 
 
+"""
+evaluation mechanism: trivial
+optimizer: changes aware optimizer, estimating the selectivities over a sliding window
+"""
+DEFAULT_TESTING_TRIVIAL_EVALUATION_MECHANISM_SETTINGS_AND_SLIDING_WINDOW_SELECTIVITY = \
+    TreeBasedEvaluationMechanismParameters(storage_params=DEFAULT_TREE_STORAGE_PARAMETERS,
+                                           tree_update_type=TreeEvaluationMechanismUpdateTypes.TRIVIAL_TREE_EVALUATION,
+                                           optimizer_params=DEFAULT_TESTING_SLIDING_WINDOW_SELECTIVITY_DEVIATION_AWARE_OPTIMIZER_SETTINGS)
+
+"""
+evaluation mechanism: trivial
+optimizer: changes aware optimizer, estimating the selectivities with exponentially decaying weights
+"""
+DEFAULT_TESTING_TRIVIAL_EVALUATION_MECHANISM_SETTINGS_AND_EXPONENTIAL_DECAY_SELECTIVITY = \
+    TreeBasedEvaluationMechanismParameters(storage_params=DEFAULT_TREE_STORAGE_PARAMETERS,
+                                           tree_update_type=TreeEvaluationMechanismUpdateTypes.TRIVIAL_TREE_EVALUATION,
+                                           optimizer_params=DEFAULT_TESTING_EXPONENTIAL_DECAY_SELECTIVITY_DEVIATION_AWARE_OPTIMIZER_SETTINGS)
+
+
 """
 evaluation mechanism: trivial
 optimizer: greedy invariant
@@ -136,3 +180,33 @@ DEFAULT_TESTING_SIMULTANEOUS_EVALUATION_MECHANISM_SETTINGS_AND_ZSTREAM_INVARIANT
     TreeBasedEvaluationMechanismParameters(storage_params=DEFAULT_TREE_STORAGE_PARAMETERS,
                                            tree_update_type=TreeEvaluationMechanismUpdateTypes.SIMULTANEOUS_TREE_EVALUATION,
                                            optimizer_params=DEFAULT_TESTING_ZSTREAM_INVARIANT_OPTIMIZER_SETTINGS)
+
+
+"""
+evaluation mechanism: partial match migration
+optimizer: trivial
+"""
+DEFAULT_TESTING_PARTIAL_MATCH_MIGRATION_EVALUATION_MECHANISM_SETTINGS = \
+    TreeBasedEvaluationMechanismParameters(storage_params=DEFAULT_TREE_STORAGE_PARAMETERS,
+                                           tree_update_type=TreeEvaluationMechanismUpdateTypes.PARTIAL_MATCH_MIGRATION_TREE_EVALUATION,
+                                           optimizer_params=DEFAULT_TESTING_TRIVIAL_OPTIMIZER_SETTINGS)
+
+
+"""
+evaluation mechanism: partial match migration
+optimizer: zstream invariant
+"""
+DEFAULT_TESTING_PARTIAL_MATCH_MIGRATION_EVALUATION_MECHANISM_SETTINGS_AND_ZSTREAM_INVARIANT_OPTIMIZER = \
+    TreeBasedEvaluationMechanismParameters(storage_params=DEFAULT_TREE_STORAGE_PARAMETERS,
+                                           tree_update_type=TreeEvaluationMechanismUpdateTypes.PARTIAL_MATCH_MIGRATION_TREE_EVALUATION,
+                                           optimizer_params=DEFAULT_TESTING_ZSTREAM_INVARIANT_OPTIMIZER_SETTINGS)
+
+
+"""
+evaluation mechanism: partial match migration
+optimizer: trivial, running in the background
+"""
+DEFAULT_TESTING_PARTIAL_MATCH_MIGRATION_EVALUATION_MECHANISM_SETTINGS_AND_ASYNCHRONOUS_TRIVIAL_OPTIMIZER = \
+    TreeBasedEvaluationMechanismParameters(storage_params=DEFAULT_TREE_STORAGE_PARAMETERS,
+                                           tree_update_type=TreeEvaluationMechanismUpdateTypes.PARTIAL_MATCH_MIGRATION_TREE_EVALUATION,
+                                           optimizer_params=DEFAULT_TESTING_ASYNCHRONOUS_TRIVIAL_OPTIMIZER_SETTINGS)
@@ -47,6 +47,24 @@ def simple_8():
         test_name = 'simple|_adaptive_zstream_invariant_optimizer_simultaneous_tree_update')
 
 
+def simple_9():
+    simplePatternSearchTest(
+        eval_mechanism_params=DEFAULT_TESTING_PARTIAL_MATCH_MIGRATION_EVALUATION_MECHANISM_SETTINGS,
+        test_name = 'simple|_adaptive_trivial_optimizer_partial_match_migration_tree_update')
+
+
+def simple_10():
+    simplePatternSearchTest(
+        eval_mechanism_params=DEFAULT_TESTING_PARTIAL_MATCH_MIGRATION_EVALUATION_MECHANISM_SETTINGS_AND_ZSTREAM_INVARIANT_OPTIMIZER,
+        test_name = 'simple|_adaptive_zstream_invariant_optimizer_partial_match_migration_tree_update')
+
+
+def simple_11():
+    simplePatternSearchTest(
+        eval_mechanism_params=DEFAULT_TESTING_PARTIAL_MATCH_MIGRATION_EVALUATION_MECHANISM_SETTINGS_AND_ASYNCHRONOUS_TRIVIAL_OPTIMIZER,
+        test_name = 'simple|_adaptive_asynchronous_trivial_optimizer_partial_match_migration_tree_update')
+
+
 def googleAscendPatternSearchTest_1():
     googleAscendPatternSearchTest(eval_mechanism_params=DEFAULT_TESTING_TRIVIAL_EVALUATION_MECHANISM_SETTINGS,
                                   test_name = 'googleAscend|_adaptive_trivial_optimizer_trivial_tree_update')
@@ -92,6 +110,24 @@ def googleAscendPatternSearchTest_8():
         test_name = 'googleAscend|_adaptive_zstream_invariant_optimizer_simultaneous_tree_update')
 
 
+def googleAscendPatternSearchTest_9():
+    googleAscendPatternSearchTest(
+        eval_mechanism_params=DEFAULT_TESTING_PARTIAL_MATCH_MIGRATION_EVALUATION_MECHANISM_SETTINGS,
+        test_name = 'googleAscend|_adaptive_trivial_optimizer_partial_match_migration_tree_update')
+
+
+def googleAscendPatternSearchTest_10():
+    googleAscendPatternSearchTest(
+        eval_mechanism_params=DEFAULT_TESTING_PARTIAL_MATCH_MIGRATION_EVALUATION_MECHANISM_SETTINGS_AND_ZSTREAM_INVARIANT_OPTIMIZER,
+        test_name = 'googleAscend|_adaptive_zstream_invariant_optimizer_partial_match_migration_tree_update')
+
+
+def googleAscendPatternSearchTest_11():
+    googleAscendPatternSearchTest(
+        eval_mechanism_params=DEFAULT_TESTING_PARTIAL_MATCH_MIGRATION_EVALUATION_MECHANISM_SETTINGS_AND_ASYNCHRONOUS_TRIVIAL_OPTIMIZER,
+        test_name = 'googleAscend|_adaptive_asynchronous_trivial_optimizer_partial_match_migration_tree_update')
+
+
 def amazonInstablePatternSearchTest_1():
     amazonInstablePatternSearchTest(eval_mechanism_params=DEFAULT_TESTING_TRIVIAL_EVALUATION_MECHANISM_SETTINGS,
                                     test_name = 'amazonInstable|_adaptive_trivial_optimizer_trivial_tree_update')
@@ -137,6 +173,36 @@ def amazonInstablePatternSearchTest_8():
         test_name = 'amazonInstable|_adaptive_zstream_invariant_optimizer_simultaneous_tree_update')
 
 
+def amazonInstablePatternSearchTest_9():
+    amazonInstablePatternSearchTest(
+        eval_mechanism_params=DEFAULT_TESTING_PARTIAL_MATCH_MIGRATION_EVALUATION_MECHANISM_SETTINGS,
+        test_name = 'amazonInstable|_adaptive_trivial_optimizer_partial_match_migration_tree_update')
+
+
+def amazonInstablePatternSearchTest_10():
+    amazonInstablePatternSearchTest(
+        eval_mechanism_params=DEFAULT_TESTING_PARTIAL_MATCH_MIGRATION_EVALUATION_MECHANISM_SETTINGS_AND_ZSTREAM_INVARIANT_OPTIMIZER,
+        test_name = 'amazonInstable|_adaptive_zstream_invariant_optimizer_partial_match_migration_tree_update')
+
+
+def amazonInstablePatternSearchTest_11():
+    amazonInstablePatternSearchTest(
+        eval_mechanism_params=DEFAULT_TESTING_PARTIAL_MATCH_MIGRATION_EVALUATION_MECHANISM_SETTINGS_AND_ASYNCHRONOUS_TRIVIAL_OPTIMIZER,
+        test_name = 'amazonInstable|_adaptive_asynchronous_trivial_optimizer_partial_match_migration_tree_update')
+
+
+def amazonInstablePatternSearchTest_12():
+    amazonInstablePatternSearchTest(
+        eval_mechanism_params=DEFAULT_TESTING_TRIVIAL_EVALUATION_MECHANISM_SETTINGS_AND_SLIDING_WINDOW_SELECTIVITY,
+        test_name = 'amazonInstable|_adaptive_sliding_window_selectivity_deviation_optimizer_trivial_tree_update')
+
+
+def amazonInstablePatternSearchTest_13():
+    amazonInstablePatternSearchTest(
+        eval_mechanism_params=DEFAULT_TESTING_TRIVIAL_EVALUATION_MECHANISM_SETTINGS_AND_EXPONENTIAL_DECAY_SELECTIVITY,
+        test_name = 'amazonInstable|_adaptive_exponential_decay_selectivity_deviation_optimizer_trivial_tree_update')
+
+
 def msftDrivRacePatternSearchTest_1():
     msftDrivRacePatternSearchTest(eval_mechanism_params=DEFAULT_TESTING_TRIVIAL_EVALUATION_MECHANISM_SETTINGS,
                                   test_name = 'msftDrivRace|_adaptive_trivial_optimizer_trivial_tree_update')
@@ -182,6 +248,24 @@ def msftDrivRacePatternSearchTest_8():
         test_name = 'msftDrivRace|_adaptive_zstream_invariant_optimizer_simultaneous_tree_update')
 
 
+def msftDrivRacePatternSearchTest_9():
+    msftDrivRacePatternSearchTest(
+        eval_mechanism_params=DEFAULT_TESTING_PARTIAL_MATCH_MIGRATION_EVALUATION_MECHANISM_SETTINGS,
+        test_name = 'msftDrivRace|_adaptive_trivial_optimizer_partial_match_migration_tree_update')
+
+
+def msftDrivRacePatternSearchTest_10():
+    msftDrivRacePatternSearchTest(
+        eval_mechanism_params=DEFAULT_TESTING_PARTIAL_MATCH_MIGRATION_EVALUATION_MECHANISM_SETTINGS_AND_ZSTREAM_INVARIANT_OPTIMIZER,
+        test_name = 'msftDrivRace|_adaptive_zstream_invariant_optimizer_partial_match_migration_tree_update')
+
+
+def msftDrivRacePatternSearchTest_11():
+    msftDrivRacePatternSearchTest(
+        eval_mechanism_params=DEFAULT_TESTING_PARTIAL_MATCH_MIGRATION_EVALUATION_MECHANISM_SETTINGS_AND_ASYNCHRONOUS_TRIVIAL_OPTIMIZER,
+        test_name = 'msftDrivRace|_adaptive_asynchronous_trivial_optimizer_partial_match_migration_tree_update')
+
+
 def googleIncreasePatternSearchTest_1():
     googleIncreasePatternSearchTest(eval_mechanism_params=DEFAULT_TESTING_TRIVIAL_EVALUATION_MECHANISM_SETTINGS,
                                     test_name = 'googleIncrease|_adaptive_trivial_optimizer_trivial_tree_update')
@@ -227,6 +311,24 @@ def googleIncreasePatternSearchTest_8():
         test_name = 'googleIncrease|_adaptive_zstream_invariant_optimizer_simultaneous_tree_update')
 
 
+def googleIncreasePatternSearchTest_9():
+    googleIncreasePatternSearchTest(
+        eval_mechanism_params=DEFAULT_TESTING_PARTIAL_MATCH_MIGRATION_EVALUATION_MECHANISM_SETTINGS,
+        test_name = 'googleIncrease|_adaptive_trivial_optimizer_partial_match_migration_tree_update')
+
+
+def googleIncreasePatternSearchTest_10():
+    googleIncreasePatternSearchTest(
+        eval_mechanism_params=DEFAULT_TESTING_PARTIAL_MATCH_MIGRATION_EVALUATION_MECHANISM_SETTINGS_AND_ZSTREAM_INVARIANT_OPTIMIZER,
+        test_name = 'googleIncrease|_adaptive_zstream_invariant_optimizer_partial_match_migration_tree_update')
+
+
+def googleIncreasePatternSearchTest_11():
+    googleIncreasePatternSearchTest(
+        eval_mechanism_params=DEFAULT_TESTING_PARTIAL_MATCH_MIGRATION_EVALUATION_MECHANISM_SETTINGS_AND_ASYNCHRONOUS_TRIVIAL_OPTIMIZER,
+        test_name = 'googleIncrease|_adaptive_asynchronous_trivial_optimizer_partial_match_migration_tree_update')
+
+
 def amazonSpecificPatternSearchTest_1():
     amazonSpecificPatternSearchTest(eval_mechanism_params=DEFAULT_TESTING_TRIVIAL_EVALUATION_MECHANISM_SETTINGS,
                                     test_name = 'amazonSpecific|_adaptive_trivial_optimizer_trivial_tree_update')
@@ -272,6 +374,24 @@ def amazonSpecificPatternSearchTest_8():
         test_name = 'amazonSpecific|_adaptive_zstream_invariant_optimizer_simultaneous_tree_update')
 
 
+def amazonSpecificPatternSearchTest_9():
+    amazonSpecificPatternSearchTest(
+        eval_mechanism_params=DEFAULT_TESTING_PARTIAL_MATCH_MIGRATION_EVALUATION_MECHANISM_SETTINGS,
+        test_name = 'amazonSpecific|_adaptive_trivial_optimizer_partial_match_migration_tree_update')
+
+
+def amazonSpecificPatternSearchTest_10():
+    amazonSpecificPatternSearchTest(
+        eval_mechanism_params=DEFAULT_TESTING_PARTIAL_MATCH_MIGRATION_EVALUATION_MECHANISM_SETTINGS_AND_ZSTREAM_INVARIANT_OPTIMIZER,
+        test_name = 'amazonSpecific|_adaptive_zstream_invariant_optimizer_partial_match_migration_tree_update')
+
+
+def amazonSpecificPatternSearchTest_11():
+    amazonSpecificPatternSearchTest(
+        eval_mechanism_params=DEFAULT_TESTING_PARTIAL_MATCH_MIGRATION_EVALUATION_MECHANISM_SETTINGS_AND_ASYNCHRONOUS_TRIVIAL_OPTIMIZER,
+        test_name = 'amazonSpecific|_adaptive_asynchronous_trivial_optimizer_partial_match_migration_tree_update')
+
+
 def googleAmazonLowPatternSearchTest_1():
     googleAmazonLowPatternSearchTest(eval_mechanism_params=DEFAULT_TESTING_TRIVIAL_EVALUATION_MECHANISM_SETTINGS,
                                      test_name = 'googleAmazonLow|_adaptive_trivial_optimizer_trivial_tree_update')
@@ -315,3 +435,21 @@ def googleAmazonLowPatternSearchTest_8():
     googleAmazonLowPatternSearchTest(
         eval_mechanism_params=DEFAULT_TESTING_SIMULTANEOUS_EVALUATION_MECHANISM_SETTINGS_AND_ZSTREAM_INVARIANT_OPTIMIZER,
         test_name = 'googleAmazonLow|_adaptive_zstream_invariant_optimizer_simultaneous_tree_update')
+
+
+def googleAmazonLowPatternSearchTest_9():
+    googleAmazonLowPatternSearchTest(
+        eval_mechanism_params=DEFAULT_TESTING_PARTIAL_MATCH_MIGRATION_EVALUATION_MECHANISM_SETTINGS,
+        test_name = 'googleAmazonLow|_adaptive_trivial_optimizer_partial_match_migration_tree_update')
+
+
+def googleAmazonLowPatternSearchTest_10():
+    googleAmazonLowPatternSearchTest(
+        eval_mechanism_params=DEFAULT_TESTING_PARTIAL_MATCH_MIGRATION_EVALUATION_MECHANISM_SETTINGS_AND_ZSTREAM_INVARIANT_OPTIMIZER,
+        test_name = 'googleAmazonLow|_adaptive_zstream_invariant_optimizer_partial_match_migration_tree_update')
+
+
+def googleAmazonLowPatternSearchTest_11():
+    googleAmazonLowPatternSearchTest(
+        eval_mechanism_params=DEFAULT_TESTING_PARTIAL_MATCH_MIGRATION_EVALUATION_MECHANISM_SETTINGS_AND_ASYNCHRONOUS_TRIVIAL_OPTIMIZER,
+        test_name = 'googleAmazonLow|_adaptive_asynchronous_trivial_optimizer_partial_match_migration_tree_update')
@@ -0,0 +1,184 @@
+import threading
+import time
+from test.testUtils import *
+from datetime import timedelta
+from condition.Condition import Variable, BinaryCondition
+from condition.CompositeCondition import AndCondition
+from base.PatternStructure import SeqOperator, PrimitiveEventStructure
+from base.Pattern import Pattern
+from parallel.ParallelExecutionParameters import DataParallelExecutionParametersHirzelAlgorithm, \
+    DataParallelExecutionParametersRIPAlgorithm, DataParallelExecutionParametersHyperCubeAlgorithm
+from parallel.ParallelExecutionPlatforms import ParallelExecutionPlatforms
+from plugin.stocks.Stocks import METASTOCK_STOCK_TICKER_KEY
+from stream.Stream import Stream
+
+
+def createGoogleAscendPattern():
+    """
+    PATTERN SEQ(GoogleStockPriceUpdate a, GoogleStockPriceUpdate b, GoogleStockPriceUpdate c)
+    WHERE a.PeakPrice < b.PeakPrice AND b.PeakPrice < c.PeakPrice
+    WITHIN 3 minutes
+    """
+    return Pattern(
+        SeqOperator(PrimitiveEventStructure("GOOG", "a"), PrimitiveEventStructure("GOOG", "b"),
+                    PrimitiveEventStructure("GOOG", "c")),
+        AndCondition(
+            BinaryCondition(Variable("a", lambda x: x["Peak Price"]),
+                            Variable("b", lambda x: x["Peak Price"]),
+                            relation_op=lambda x, y: x < y),
+            BinaryCondition(Variable("b", lambda x: x["Peak Price"]),
+                            Variable("c", lambda x: x["Peak Price"]),
+                            relation_op=lambda x, y: x < y)
+        ),
+        timedelta(minutes=3)
+    )
+
+
+def createAppleAmazonGooglePattern():
+    """
+    PATTERN SEQ(AppleStockPriceUpdate a, AmazonStockPriceUpdate b, GoogleStockPriceUpdate c)
+    WHERE a.OpeningPrice > b.OpeningPrice AND b.PeakPrice < c.PeakPrice
+    WITHIN 1 minutes
+    """
+    return Pattern(
+        SeqOperator(PrimitiveEventStructure("AAPL", "a"), PrimitiveEventStructure("AMZN", "b"),
+                    PrimitiveEventStructure("GOOG", "c")),
+        AndCondition(
+            BinaryCondition(Variable("a", lambda x: x["Opening Price"]),
+                            Variable("b", lambda x: x["Opening Price"]),
+                            relation_op=lambda x, y: x > y),
+            BinaryCondition(Variable("b", lambda x: x["Peak Price"]),
+                            Variable("c", lambda x: x["Peak Price"]),
+                            relation_op=lambda x, y: x < y)
+        ),
+        timedelta(minutes=1)
+    )
+
+
+def groupByKeySingleUnitTest(createTestFile=False):
+    runTest("groupByKeySingleUnit", [createGoogleAscendPattern()], createTestFile,
+            eventStream=nasdaqEventStream_AAPL_AMZN_GOOG, expected_file_name="parallelGoogleAscend",
+            parallel_execution_params=DataParallelExecutionParametersHirzelAlgorithm(
+                units_number=1, key=METASTOCK_STOCK_TICKER_KEY))
+
+
+def groupByKeyMultipleUnitsTest(createTestFile=False):
+    runTest("groupByKeyMultipleUnits", [createGoogleAscendPattern()], createTestFile,
+            eventStream=nasdaqEventStream_AAPL_AMZN_GOOG, expected_file_name="parallelGoogleAscend",
+            parallel_execution_params=DataParallelExecutionParametersHirzelAlgorithm(
+                units_number=4, key=METASTOCK_STOCK_TICKER_KEY))
+
+
+def groupByKeyMultiprocessingTest(createTestFile=False):
+    runTest("groupByKeyMultiprocessing", [createGoogleAscendPattern()], createTestFile,
+            eventStream=nasdaqEventStream_AAPL_AMZN_GOOG, expected_file_name="parallelGoogleAscend",
+            parallel_execution_params=DataParallelExecutionParametersHirzelAlgorithm(
+                platform=ParallelExecutionPlatforms.MULTIPROCESSING,
+                units_number=4, key=METASTOCK_STOCK_TICKER_KEY))
+
+
+def ripSingleUnitTest(createTestFile=False):
+    runTest("ripSingleUnit", [createAppleAmazonGooglePattern()], createTestFile,
+            eventStream=nasdaqEventStream_AAPL_AMZN_GOOG, expected_file_name="parallelAppleAmazonGoogle",
+            parallel_execution_params=DataParallelExecutionParametersRIPAlgorithm(units_number=2, multiple=1))
+
+
+def ripMultipleUnitsTest(createTestFile=False):
+    runTest("ripMultipleUnits", [createAppleAmazonGooglePattern()], createTestFile,
+            eventStream=nasdaqEventStream_AAPL_AMZN_GOOG, expected_file_name="parallelAppleAmazonGoogle",
+            parallel_execution_params=DataParallelExecutionParametersRIPAlgorithm(units_number=5, multiple=1))
+
+
+def ripAscendMultiprocessingTest(createTestFile=False):
+    runTest("ripAscendMultiprocessing", [createGoogleAscendPattern()], createTestFile,
+            eventStream=nasdaqEventStream_AAPL_AMZN_GOOG, expected_file_name="parallelGoogleAscend",
+            parallel_execution_params=DataParallelExecutionParametersRIPAlgorithm(
+                platform=ParallelExecutionPlatforms.MULTIPROCESSING, units_number=4, multiple=3))
+
+
+def hyperCubeMultipleTypesTest(createTestFile=False):
+    attributes_dict = {"AAPL": "Opening Price", "AMZN": "Opening Price", "GOOG": "Peak Price"}
+    runTest("hyperCubeMultipleTypes", [createAppleAmazonGooglePattern()], createTestFile,
+            eventStream=nasdaqEventStream_AAPL_AMZN_GOOG, expected_file_name="parallelAppleAmazonGoogle",
+            parallel_execution_params=DataParallelExecutionParametersHyperCubeAlgorithm(
+                units_number=9, attributes_dict=attributes_dict))
+
+
+def hyperCubeSameTypeMultiprocessingTest(createTestFile=False):
+    runTest("hyperCubeSameTypeMultiprocessing", [createGoogleAscendPattern()], createTestFile,
+            eventStream=nasdaqEventStream_AAPL_AMZN_GOOG, expected_file_name="parallelGoogleAscend",
+            parallel_execution_params=DataParallelExecutionParametersHyperCubeAlgorithm(
+                platform=ParallelExecutionPlatforms.MULTIPROCESSING,
+                units_number=9, attributes_dict={"GOOG": "Peak Price"}))
+
+
+def ripMatchOrderTest():
+    matches = OutputStream()
+    cep = CEP([createGoogleAscendPattern()], DEFAULT_TESTING_EVALUATION_MECHANISM_SETTINGS,
+              DataParallelExecutionParametersRIPAlgorithm(units_number=5, multiple=1))
+    cep.run(nasdaqEventStream_AAPL_AMZN_GOOG.duplicate(), matches, DEFAULT_TESTING_DATA_FORMATTER)
+    timestamps = [match.last_timestamp for match in matches]
+    is_test_successful = len(timestamps) > 0 and timestamps == sorted(timestamps)
+    print("Test ripMatchOrder result: %s" % ("Succeeded" if is_test_successful else "Failed",))
+
+
+def getMatchStrings(events, parallel_execution_params=None):
+    matches = OutputStream()
+    cep = CEP([createAppleAmazonGooglePattern()], DEFAULT_TESTING_EVALUATION_MECHANISM_SETTINGS,
+              parallel_execution_params)
+    cep.run(events, matches, DEFAULT_TESTING_DATA_FORMATTER)
+    return sorted(str(match) for match in matches)
+
+
+def hyperCubeDuplicateEventsTest():
+    """
+    Every raw event appears twice in the input stream, hence distinct matches may consist of identical events.
+    """
+    sequential_events, parallel_events = Stream(), Stream()
+    for raw_event in nasdaqEventStream_AAPL_AMZN_GOOG.duplicate():
+        for _ in range(2):
+            sequential_events.add_item(raw_event)
+            parallel_events.add_item(raw_event)
+    sequential_events.close()
+    parallel_events.close()
+    attributes_dict = {"AAPL": "Opening Price", "AMZN": "Opening Price", "GOOG": "Peak Price"}
+    expected_matches = getMatchStrings(sequential_events)
+    actual_matches = getMatchStrings(parallel_events, DataParallelExecutionParametersHyperCubeAlgorithm(
+        units_number=9, attributes_dict=attributes_dict))
+    is_test_successful = len(expected_matches) > 0 and actual_matches == expected_matches
+    print("Test hyperCubeDuplicateEvents result: %s" % ("Succeeded" if is_test_successful else "Failed",))
+
+
+def liveStreamParallelTest():
+    """
+    The input stream stays open while the matches are read, hence the matches must be reported before it ends.
+    """
+    raw_events = list(nasdaqEventStream_AAPL_AMZN_GOOG.duplicate())
+    sequential_matches = OutputStream()
+    CEP([createGoogleAscendPattern()], DEFAULT_TESTING_EVALUATION_MECHANISM_SETTINGS).run(
+        nasdaqEventStream_AAPL_AMZN_GOOG.duplicate(), sequential_matches, DEFAULT_TESTING_DATA_FORMATTER)
+    expected_matches = sorted(str(match) for match in sequential_matches)
+    is_test_successful = len(expected_matches) > 0
+    for parallel_execution_params in [
+        DataParallelExecutionParametersHirzelAlgorithm(units_number=4, key=METASTOCK_STOCK_TICKER_KEY),
+        DataParallelExecutionParametersRIPAlgorithm(units_number=3, multiple=1)
+    ]:
+        events, matches = Stream(), OutputStream()
+        cep = CEP([createGoogleAscendPattern()], DEFAULT_TESTING_EVALUATION_MECHANISM_SETTINGS,
+                  parallel_execution_params)
+        evaluation = threading.Thread(target=cep.run, args=(events, matches, DEFAULT_TESTING_DATA_FORMATTER),
+                                      daemon=True)
+        evaluation.start()
+        for raw_event in raw_events:
+            events.add_item(raw_event)
+        deadline = time.time() + 60
+        while matches.count() == 0 and time.time() < deadline:
+            time.sleep(0.01)
+        is_test_successful = is_test_successful and matches.count() > 0
+        events.close()
+        evaluation.join()
+        actual_matches = list(matches)
+        timestamps = [match.last_timestamp_ns for match in actual_matches]
+        is_test_successful = is_test_successful and timestamps == sorted(timestamps) and \
+            sorted(str(match) for match in actual_matches) == expected_matches
+    print("Test liveStreamParallel result: %s" % ("Succeeded" if is_test_successful else "Failed",))
@@ -1,6 +1,6 @@
 from datetime import timedelta
 
-from condition.BaseRelationCondition import GreaterThanCondition, GreaterThanEqCondition
+from condition.BaseRelationCondition import GreaterThanCondition, GreaterThanEqCondition, EqCondition
 from test.testUtils import *
 from condition.Condition import Variable
 from condition.CompositeCondition import AndCondition
@@ -27,6 +27,57 @@ def sortedStorageTest(createTestFile=False):
     runTest("sortedStorageTest", [pattern], createTestFile, eval_mechanism_params=eval_params, events=nasdaqEventStream)
 
 
+def blockedSortedStorageTest(createTestFile=False):
+    """
+    A pattern with inequality conditions for which the storage of every node is a blocked sorted list.
+    PATTERN AND(DrivStockPriceUpdate a, MicrosoftStockPriceUpdate b, CbrlStockPriceUpdate c)
+    WHERE a.OpeningPrice > b.OpeningPrice AND b.OpeningPrice > c.OpeningPrice
+    WITHIN 10 minutes
+    """
+    pattern = Pattern(
+        AndOperator(PrimitiveEventStructure("DRIV", "a"), PrimitiveEventStructure("MSFT", "b"), PrimitiveEventStructure("CBRL", "c")),
+        AndCondition(
+            GreaterThanCondition(
+                Variable("a", lambda x: x["Opening Price"]), Variable("b", lambda x: x["Opening Price"])
+            ),
+            GreaterThanCondition(
+                Variable("b", lambda x: x["Opening Price"]), Variable("c", lambda x: x["Opening Price"])
+            ),
+        ),
+        timedelta(minutes=10),
+    )
+    storage_params = TreeStorageParameters(True, clean_up_interval=500, use_blocked_storage=True)
+    eval_params = TreeBasedEvaluationMechanismParameters(
+        optimizer_params=StatisticsDeviationAwareOptimizerParameters(tree_plan_params=TreePlanBuilderParameters()),
+        storage_params=storage_params)
+    runTest("blockedSortedStorage", [pattern], createTestFile, eval_mechanism_params=eval_params,
+            events=nasdaqEventStreamMedium)
+
+
+def hashedStorageTest(createTestFile=False):
+    """
+    An equi-join pattern for which the storage of every node is keyed by an equality condition.
+    PATTERN AND(MicrosoftStockPriceUpdate a, DrivStockPriceUpdate b, CbrlStockPriceUpdate c)
+    WHERE a.Date = b.Date AND b.Date = c.Date
+    WITHIN 5 minutes
+    """
+    pattern = Pattern(
+        AndOperator(PrimitiveEventStructure("MSFT", "a"), PrimitiveEventStructure("DRIV", "b"),
+                    PrimitiveEventStructure("CBRL", "c")),
+        AndCondition(
+            EqCondition(Variable("a", lambda x: x["Date"]), Variable("b", lambda x: x["Date"])),
+            EqCondition(Variable("b", lambda x: x["Date"]), Variable("c", lambda x: x["Date"])),
+        ),
+        timedelta(minutes=5),
+    )
+    storage_params = TreeStorageParameters(True, attributes_priorities={"a": 1, "b": 2, "c": 3})
+    eval_params = TreeBasedEvaluationMechanismParameters(
+        optimizer_params=StatisticsDeviationAwareOptimizerParameters(tree_plan_params=TreePlanBuilderParameters()),
+        storage_params=storage_params)
+    runTest("hashedStorage", [pattern], createTestFile, eval_mechanism_params=eval_params,
+            events=nasdaqEventStreamMedium)
+
+
 def sortedStorageBenchMarkTest(createTestFile=False):
     pattern = Pattern(
         AndOperator(PrimitiveEventStructure("DRIV", "a"), PrimitiveEventStructure("MSFT", "b"),
@@ -51,3 +102,10 @@ def sortedStorageBenchMarkTest(createTestFile=False):
         storage_params=storage_params)
 
     runBenchMark("sortedStorageBenchMark - sorted storage", [pattern], eval_mechanism_params=eval_params)
+    storage_params = TreeStorageParameters(sort_storage=True, attributes_priorities={"a": 122, "b": 200, "c": 104, "m": 139},
+                                           use_blocked_storage=True)
+    eval_params = TreeBasedEvaluationMechanismParameters(
+        optimizer_params=StatisticsDeviationAwareOptimizerParameters(tree_plan_params=TreePlanBuilderParameters()),
+        storage_params=storage_params)
+
+    runBenchMark("sortedStorageBenchMark - blocked sorted storage", [pattern], eval_mechanism_params=eval_params)
@@ -0,0 +1,44 @@
+from test.testUtils import *
+from test.ParallelTests import createGoogleAscendPattern
+from stream.FileStream import LazyFileInputStream, CompressedFileInputStream
+from parallel.ParallelExecutionParameters import DataParallelExecutionParametersRIPAlgorithm
+
+
+def lazyFileStreamTest(createTestFile=False):
+    events = LazyFileInputStream(os.path.join(absolutePath, "test/EventFiles/NASDAQ_AAPL_AMZN_GOOG.txt"))
+    runTest("lazyFileStream", [createGoogleAscendPattern()], createTestFile,
+            events=events, expected_file_name="parallelGoogleAscend")
+
+
+def mmapFileStreamTest(createTestFile=False):
+    events = LazyFileInputStream(os.path.join(absolutePath, "test/EventFiles/NASDAQ_AAPL_AMZN_GOOG.txt"),
+                                 use_mmap=True)
+    runTest("mmapFileStream", [createGoogleAscendPattern()], createTestFile,
+            events=events, expected_file_name="parallelGoogleAscend")
+
+
+def gzipFileStreamTest(createTestFile=False):
+    events = CompressedFileInputStream(os.path.join(absolutePath, "test/EventFiles/NASDAQ_AAPL_AMZN_GOOG.txt.gz"))
+    runTest("gzipFileStream", [createGoogleAscendPattern()], createTestFile,
+            events=events, expected_file_name="parallelGoogleAscend")
+
+
+def unsynchronizedStreamTest(createTestFile=False):
+    runTest("unsynchronizedStream", [createGoogleAscendPattern()], createTestFile,
+            eventStream=nasdaqEventStream_AAPL_AMZN_GOOG, expected_file_name="parallelGoogleAscend",
+            use_thread_safe_streams=False)
+
+
+def unsynchronizedStreamParallelTest(createTestFile=False):
+    runTest("unsynchronizedStreamParallel", [createGoogleAscendPattern()], createTestFile,
+            eventStream=nasdaqEventStream_AAPL_AMZN_GOOG, expected_file_name="parallelGoogleAscend",
+            parallel_execution_params=DataParallelExecutionParametersRIPAlgorithm(units_number=3),
+            use_thread_safe_streams=False)
+
+
+def streamThreadSafetyRestoredTest():
+    events, matches = nasdaqEventStream_AAPL_AMZN_GOOG.duplicate(), OutputStream()
+    CEP([createGoogleAscendPattern()]).run(events, matches, DEFAULT_TESTING_DATA_FORMATTER,
+                                           use_thread_safe_streams=False)
+    is_test_successful = events.is_thread_safe() and matches.is_thread_safe() and matches.count() > 0
+    print("Test streamThreadSafetyRestored result: %s" % ("Succeeded" if is_test_successful else "Failed",))
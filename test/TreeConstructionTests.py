@@ -352,6 +352,43 @@ def iiGreedy2PatternSearchTest(createTestFile=False):
     runTest('iiGreedy2', [pattern], createTestFile, eval_mechanism_params=eval_params, events=nasdaqEventStream)
 
 
+def iiSimulatedAnnealingPatternSearchTest(createTestFile=False):
+    pattern = Pattern(
+        SeqOperator(PrimitiveEventStructure("MSFT", "a"), PrimitiveEventStructure("DRIV", "b"),
+                    PrimitiveEventStructure("ORLY", "c"), PrimitiveEventStructure("CBRL", "d")),
+        AndCondition(
+            SmallerThanCondition(Variable("a", lambda x: x["Peak Price"]),
+                                 Variable("b", lambda x: x["Peak Price"])),
+            SmallerThanCondition(Variable("b", lambda x: x["Peak Price"]),
+                                 Variable("c", lambda x: x["Peak Price"])),
+            SmallerThanCondition(Variable("c", lambda x: x["Peak Price"]),
+                                 Variable("d", lambda x: x["Peak Price"]))
+        ),
+        timedelta(minutes=3)
+    )
+    selectivityMatrix = [[1.0, 0.9457796098355941, 1.0, 1.0], [0.9457796098355941, 1.0, 0.15989723367389616, 1.0],
+                         [1.0, 0.15989723367389616, 1.0, 0.9992557393942864], [1.0, 1.0, 0.9992557393942864, 1.0]]
+    arrivalRates = [0.016597077244258872, 0.01454418928322895, 0.013917884481558803, 0.012421711899791231]
+    pattern.set_statistics({StatisticsTypes.SELECTIVITY_MATRIX: selectivityMatrix,
+                            StatisticsTypes.ARRIVAL_RATES: arrivalRates})
+    eval_params = TreeBasedEvaluationMechanismParameters(
+        optimizer_params=StatisticsDeviationAwareOptimizerParameters(
+            tree_plan_params=IterativeImprovementTreePlanBuilderParameters(
+            DEFAULT_TREE_COST_MODEL,
+            100,
+            IterativeImprovementType.CIRCLE_BASED,
+            IterativeImprovementInitType.GREEDY,
+            IterativeImprovementSearchType.SIMULATED_ANNEALING,
+            restarts_number=4,
+            workers_number=2,
+            time_limit=timedelta(seconds=5)),
+            statistics_collector_params=StatisticsCollectorParameters(statistics_types=[StatisticsTypes.ARRIVAL_RATES, StatisticsTypes.SELECTIVITY_MATRIX])),
+        storage_params=DEFAULT_TESTING_EVALUATION_MECHANISM_SETTINGS.storage_params)
+
+    runTest('iiSimulatedAnnealing', [pattern], createTestFile, eval_mechanism_params=eval_params,
+            events=nasdaqEventStream, expected_file_name='iiGreedy2')
+
+
 def dpLdPatternSearchTest(createTestFile=False):
     pattern = Pattern(
         SeqOperator(PrimitiveEventStructure("MSFT", "a"), PrimitiveEventStructure("DRIV", "b"),
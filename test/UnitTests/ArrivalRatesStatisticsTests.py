@@ -0,0 +1,101 @@
+import random
+from datetime import datetime, timedelta
+
+from adaptive.statistics.Statistics import ArrivalRatesStatistics
+from base.Pattern import Pattern
+from base.PatternStructure import SeqOperator, PrimitiveEventStructure
+from condition.Condition import TrueCondition
+from test.UnitTests.EventTimestampTests import createEvent
+
+
+START_TIME = datetime(2020, 1, 1)
+TIME_WINDOW = timedelta(minutes=1)
+
+
+def arrivalRatesStatisticsTests():
+    arrivalRatesEquivalenceTest()
+    arrivalRatesBucketExpiryTest()
+    arrivalRatesBucketNumberTest()
+    print("Arrival rates statistics unit tests executed successfully.")
+
+
+def createPattern():
+    return Pattern(
+        SeqOperator(PrimitiveEventStructure("A", "a"), PrimitiveEventStructure("B", "b"),
+                    PrimitiveEventStructure("A", "c")),
+        TrueCondition(),
+        timedelta(minutes=5))
+
+
+def getBucketsNumber(statistics: ArrivalRatesStatistics):
+    return len(statistics._ArrivalRatesStatistics__arrival_buckets)
+
+
+class PerEventArrivalRatesStatistics:
+    """
+    The reference implementation keeping a record for every arrived event and rescanning the records upon each update.
+    """
+    def __init__(self, pattern: Pattern):
+        self.arrival_rates = [0.0] * len(pattern.get_primitive_events())
+        self.event_type_to_indices_map = {}
+        for i, arg in enumerate(pattern.get_primitive_events()):
+            self.event_type_to_indices_map.setdefault(arg.type, []).append(i)
+        self.arrivals = []
+
+    def update(self, event):
+        if event.type in self.event_type_to_indices_map:
+            self.arrivals.append(event)
+            for index in self.event_type_to_indices_map[event.type]:
+                self.arrival_rates[index] += 1
+        while len(self.arrivals) > 0 and event.timestamp - self.arrivals[0].timestamp > TIME_WINDOW:
+            for index in self.event_type_to_indices_map[self.arrivals.pop(0).type]:
+                self.arrival_rates[index] -= 1
+
+
+def arrivalRatesEquivalenceTest():
+    pattern = createPattern()
+    statistics = ArrivalRatesStatistics(TIME_WINDOW, pattern)
+    reference_statistics = PerEventArrivalRatesStatistics(pattern)
+    random.seed(0)
+    timestamp = START_TIME
+    for _ in range(2000):
+        # events often share a timestamp, and some of them are not a part of the pattern
+        timestamp += timedelta(seconds=random.choice([0, 0, 1, 3, 20]))
+        event = createEvent(random.choice("ABC"), timestamp)
+        statistics.update(event)
+        reference_statistics.update(event)
+        assert statistics.get_statistics() == reference_statistics.arrival_rates, \
+            "Test arrivalRatesEquivalence Failed: the arrival rates differ from the per-event implementation"
+
+
+def arrivalRatesBucketExpiryTest():
+    statistics = ArrivalRatesStatistics(TIME_WINDOW, createPattern(), bucket_size=timedelta(seconds=10))
+    for seconds, event_type in [(1, "A"), (5, "B"), (9, "A"), (12, "B")]:
+        statistics.update(createEvent(event_type, START_TIME + timedelta(seconds=seconds)))
+    assert statistics.get_statistics() == [2, 2, 2] and getBucketsNumber(statistics) == 2, \
+        "Test arrivalRatesBucketExpiry Failed: wrong arrival rates within the time window"
+    statistics.update(createEvent("C", START_TIME + timedelta(seconds=60)))
+    assert statistics.get_statistics() == [2, 2, 2], \
+        "Test arrivalRatesBucketExpiry Failed: a bucket expired before the time window passed since its start"
+    # the events arriving at 5 and 9 seconds are within the time window, but share the expired bucket
+    statistics.update(createEvent("C", START_TIME + timedelta(seconds=61)))
+    assert statistics.get_statistics() == [0, 1, 0] and getBucketsNumber(statistics) == 1, \
+        "Test arrivalRatesBucketExpiry Failed: the first bucket did not expire as a whole"
+    statistics.update(createEvent("A", START_TIME + timedelta(seconds=200)))
+    assert statistics.get_statistics() == [1, 0, 1] and getBucketsNumber(statistics) == 1, \
+        "Test arrivalRatesBucketExpiry Failed: wrong arrival rates after all buckets expired"
+
+
+def arrivalRatesBucketNumberTest():
+    bucket_size = timedelta(seconds=5)
+    statistics = ArrivalRatesStatistics(TIME_WINDOW, createPattern(), bucket_size=bucket_size)
+    unbucketed_statistics = ArrivalRatesStatistics(TIME_WINDOW, createPattern())
+    for i in range(5000):
+        event = createEvent("AB"[i % 2], START_TIME + timedelta(milliseconds=100 * i))
+        statistics.update(event)
+        unbucketed_statistics.update(event)
+        assert getBucketsNumber(statistics) <= TIME_WINDOW / bucket_size + 1, \
+            "Test arrivalRatesBucketNumber Failed: the number of buckets exceeds the time window divided by their size"
+    # without a bucket size, a bucket is kept for every distinct timestamp within the time window
+    assert getBucketsNumber(unbucketed_statistics) == TIME_WINDOW / timedelta(milliseconds=100) + 1, \
+        "Test arrivalRatesBucketNumber Failed: wrong number of buckets without a bucket size"
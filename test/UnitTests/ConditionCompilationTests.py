@@ -0,0 +1,74 @@
+from condition.Condition import Variable, TrueCondition, SimpleCondition, BinaryCondition
+from condition.BaseRelationCondition import EqCondition, GreaterThanCondition, SmallerThanEqCondition
+from condition.CompositeCondition import AndCondition, OrCondition
+from condition.KCCondition import KCIndexCondition
+
+
+"""
+Event for these tests only
+"""
+
+
+class Event:
+    def __init__(self, payload):
+        self.payload = payload
+
+
+class NegatedSimpleCondition(SimpleCondition):
+    """
+    A condition overriding the interpreted evaluation, hence not supporting compilation.
+    """
+    def _eval(self, binding: dict = None):
+        return not super()._eval(binding)
+
+
+EVENT_POSITIONS = {"a": 0, "b": 1, "c": 2}
+EVENT_LISTS = [
+    [Event({"x": 1, "y": 2}), Event({"x": 1, "y": 5}), Event({"x": 3, "y": 5})],
+    [Event({"x": 4, "y": 2}), Event({"x": 1, "y": 1}), Event({"x": 1, "y": 0})],
+    [Event({"x": 2, "y": 2}), Event({"x": 2, "y": 2}), Event({"x": 2, "y": 2})],
+]
+
+
+def conditionCompilationTests():
+    compiledConditionsTest()
+    compilationFallbackTest()
+    print("Condition compilation unit tests executed successfully.")
+
+
+def compiledConditionsTest():
+    conditions = [
+        TrueCondition(),
+        EqCondition(Variable("a", lambda x: x["x"]), Variable("b", lambda x: x["x"])),
+        GreaterThanCondition(Variable("c", lambda x: x["y"]), 1),
+        SmallerThanEqCondition(3, Variable("a", lambda x: x["x"])),
+        SimpleCondition(Variable("a", lambda x: x["x"]), Variable("b", lambda x: x["y"]),
+                        Variable("c", lambda x: x["x"]), relation_op=lambda x, y, z: x + y > z),
+        SimpleCondition(Variable("a", lambda x: x["x"]), 2, relation_op=lambda x, y: x == y),
+        AndCondition(),
+        OrCondition(),
+        AndCondition(GreaterThanCondition(Variable("b", lambda x: x["y"]), Variable("a", lambda x: x["y"])),
+                     OrCondition(EqCondition(Variable("c", lambda x: x["x"]), 3),
+                                 EqCondition(Variable("c", lambda x: x["y"]), 0))),
+    ]
+    for condition in conditions:
+        compiled_condition = condition.compile(EVENT_POSITIONS)
+        assert compiled_condition is not None, "Test compiledConditions Failed: %s was not compiled" % (condition,)
+        for events in EVENT_LISTS:
+            binding = {name: events[position].payload for name, position in EVENT_POSITIONS.items()}
+            assert compiled_condition(events) == condition.eval(binding), \
+                "Test compiledConditions Failed: %s was evaluated incorrectly" % (condition,)
+
+
+def compilationFallbackTest():
+    non_compilable_conditions = [
+        NegatedSimpleCondition(Variable("a", lambda x: x["x"]), relation_op=lambda x: x > 1),
+        BinaryCondition(Variable("a", lambda x: x["x"]), Variable("d", lambda x: x["x"]),
+                        relation_op=lambda x, y: x < y),
+        KCIndexCondition({"a"}, lambda x: x["x"], lambda x, y: x < y, offset=1),
+        AndCondition(EqCondition(Variable("a", lambda x: x["x"]), 1),
+                     NegatedSimpleCondition(Variable("b", lambda x: x["x"]), relation_op=lambda x: x > 1)),
+    ]
+    for condition in non_compilable_conditions:
+        assert condition.compile(EVENT_POSITIONS) is None, \
+            "Test compilationFallback Failed: %s should not be compiled" % (condition,)
@@ -0,0 +1,69 @@
+import pickle
+from datetime import datetime, timedelta, timezone
+
+from base.DataFormatter import DataFormatter, EventTypeClassifier
+from base.Event import Event, datetime_to_nanoseconds
+from base.PatternMatch import PatternMatch
+
+
+EVENT_TIMEZONE = timezone(timedelta(hours=2))
+
+
+class FirstColumnEventTypeClassifier(EventTypeClassifier):
+    def get_event_type(self, event_payload: dict):
+        return event_payload["Type"]
+
+
+class TimezoneAwareDataFormatter(DataFormatter):
+    """
+    Parses events of the form "<type>,<ISO 8601 timestamp with a UTC offset>".
+    """
+    def __init__(self):
+        super().__init__(FirstColumnEventTypeClassifier())
+
+    def parse_event(self, raw_data: str):
+        event_type, timestamp = raw_data.strip().split(",")
+        return {"Type": event_type, "Timestamp": datetime.fromisoformat(timestamp)}
+
+    def get_event_timestamp(self, event_payload: dict):
+        return event_payload["Timestamp"]
+
+
+def eventTimestampTests():
+    timezoneAwareEventTest()
+    matchTimestampsTest()
+    print("Event timestamp unit tests executed successfully.")
+
+
+def createEvent(event_type: str, timestamp: datetime):
+    return Event("%s,%s" % (event_type, timestamp.isoformat()), TimezoneAwareDataFormatter())
+
+
+def timezoneAwareEventTest():
+    timestamp = datetime(2020, 1, 1, 12, 30, 15, 250, tzinfo=EVENT_TIMEZONE)
+    event = createEvent("A", timestamp)
+    assert event.timestamp == timestamp and event.timestamp.tzinfo == EVENT_TIMEZONE, \
+        "Test timezoneAwareEvent Failed: the timezone of the event timestamp was not preserved"
+    assert event.timestamp_ns == datetime_to_nanoseconds(datetime(2020, 1, 1, 10, 30, 15, 250)), \
+        "Test timezoneAwareEvent Failed: the timestamp was not converted to UTC"
+
+
+def matchTimestampsTest():
+    start_time = datetime(2020, 1, 1, tzinfo=EVENT_TIMEZONE)
+    events = [createEvent("B", start_time + timedelta(minutes=2)), createEvent("A", start_time),
+              createEvent("C", start_time + timedelta(minutes=1))]
+    match = PatternMatch(events)
+    assert (match.first_timestamp, match.last_timestamp) == (start_time, start_time + timedelta(minutes=2)), \
+        "Test matchTimestamps Failed: wrong match timestamps"
+    assert match.first_timestamp.tzinfo == EVENT_TIMEZONE and match.last_timestamp.tzinfo == EVENT_TIMEZONE, \
+        "Test matchTimestamps Failed: the timezone of the match timestamps was not preserved"
+    assert (match.first_timestamp_ns, match.last_timestamp_ns) == (events[1].timestamp_ns, events[0].timestamp_ns), \
+        "Test matchTimestamps Failed: wrong match timestamps in nanoseconds"
+    joined_match = PatternMatch.join(PatternMatch(events[:1]), PatternMatch(events[1:]), ((0, 0), (1, 0), (1, 1)))
+    assert (joined_match.first_timestamp, joined_match.last_timestamp) == \
+           (match.first_timestamp, match.last_timestamp), \
+        "Test matchTimestamps Failed: wrong timestamps of a joined match"
+    restored_match = pickle.loads(pickle.dumps(match))
+    assert (restored_match.first_timestamp, restored_match.first_timestamp_ns) == \
+           (match.first_timestamp, match.first_timestamp_ns), \
+        "Test matchTimestamps Failed: the timestamps were not preserved by pickling"
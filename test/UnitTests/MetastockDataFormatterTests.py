@@ -0,0 +1,83 @@
+import os
+import pickle
+from datetime import timedelta
+
+from CEP import CEP
+from base.Event import Event
+from base.Pattern import Pattern
+from base.PatternStructure import SeqOperator, PrimitiveEventStructure
+from condition.BaseRelationCondition import GreaterThanCondition
+from condition.Condition import Variable
+from plugin.stocks.Stocks import MetastockDataFormatter, METASTOCK_7_COLUMN_SCHEMA
+from stream.FileStream import FileInputStream
+from stream.Stream import OutputStream
+from test.testUtils import absolutePath
+
+
+EVENT_FILE_PATH = os.path.join(absolutePath, "test/EventFiles/NASDAQ_SHORT.txt")
+
+
+def metastockDataFormatterTests():
+    schemaEquivalenceTest()
+    lazyPayloadTest()
+    exponentValuesTest()
+    schemaMatchesTest()
+    print("Metastock data formatter unit tests executed successfully.")
+
+
+def getAttributes(event):
+    return {key: (type(value), value) for key, value in event.payload.items() if key != Event.INDEX_ATTRIBUTE_NAME}
+
+
+def schemaEquivalenceTest():
+    formatter = MetastockDataFormatter()
+    schema_formatter = MetastockDataFormatter(column_schema=METASTOCK_7_COLUMN_SCHEMA)
+    raw_events = list(FileInputStream(EVENT_FILE_PATH)) + ["AAPL,200802010900,136.2,136.2,136,136,6700,0.5\n"]
+    for raw_event in raw_events:
+        event, schema_event = Event(raw_event, formatter), Event(raw_event, schema_formatter)
+        assert (schema_event.type, schema_event.timestamp, schema_event.probability) == \
+               (event.type, event.timestamp, event.probability), \
+            "Test schemaEquivalence Failed: different event properties for %s" % (raw_event,)
+        assert str(schema_event) == str(event) and getAttributes(schema_event) == getAttributes(event), \
+            "Test schemaEquivalence Failed: different payloads for %s" % (raw_event,)
+
+
+def lazyPayloadTest():
+    event = Event("AAPL,200802010900,136.2,136.2,136,136,6700\n",
+                  MetastockDataFormatter(column_schema=METASTOCK_7_COLUMN_SCHEMA))
+    assert dict.__len__(event.payload) == 2, "Test lazyPayload Failed: attributes were converted on event creation"
+    assert event.payload["Lowest Price"] == 136 and "Volume" in event.payload and "Probability" not in event.payload, \
+        "Test lazyPayload Failed: wrong attribute access"
+    assert dict.__len__(event.payload) == 3, "Test lazyPayload Failed: an attribute was not converted on access"
+    expected_keys = ["Stock Ticker", "Date", "Opening Price", "Peak Price", "Lowest Price", "Close Price", "Volume",
+                     Event.INDEX_ATTRIBUTE_NAME]
+    assert list(event.payload.keys()) == expected_keys, "Test lazyPayload Failed: wrong attribute order"
+    assert pickle.loads(pickle.dumps(event.payload)) == event.payload, "Test lazyPayload Failed: pickling failed"
+
+
+def exponentValuesTest():
+    raw_event = "AAPL,200802010900,1e5,1E-3,1.5e2,136,2E3\n"
+    event = Event(raw_event, MetastockDataFormatter())
+    schema_event = Event(raw_event, MetastockDataFormatter(column_schema=METASTOCK_7_COLUMN_SCHEMA))
+    assert getAttributes(schema_event) == getAttributes(event), \
+        "Test exponentValues Failed: different payloads for values with an exponent"
+    assert (schema_event.payload["Opening Price"], schema_event.payload["Peak Price"],
+            schema_event.payload["Lowest Price"], schema_event.payload["Volume"]) == (100000.0, 0.001, 150.0, 2000.0), \
+        "Test exponentValues Failed: wrong conversion of values with an exponent"
+
+
+def getMatches(data_formatter):
+    pattern = Pattern(
+        SeqOperator(PrimitiveEventStructure("AAPL", "a"), PrimitiveEventStructure("AMZN", "b")),
+        GreaterThanCondition(Variable("a", lambda x: x["Opening Price"]), Variable("b", lambda x: x["Opening Price"])),
+        timedelta(minutes=3))
+    matches = OutputStream()
+    CEP([pattern]).run(FileInputStream(EVENT_FILE_PATH), matches, data_formatter)
+    return [str(match) for match in matches]
+
+
+def schemaMatchesTest():
+    matches = getMatches(MetastockDataFormatter())
+    assert len(matches) > 0, "Test schemaMatches Failed: no matches were found"
+    assert getMatches(MetastockDataFormatter(column_schema=METASTOCK_7_COLUMN_SCHEMA)) == matches, \
+        "Test schemaMatches Failed: different matches were found"
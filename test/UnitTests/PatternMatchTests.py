@@ -0,0 +1,82 @@
+import pickle
+from datetime import datetime, timedelta
+
+from base.Pattern import Pattern
+from base.PatternMatch import PatternMatch
+from base.PatternStructure import SeqOperator, PrimitiveEventStructure
+from condition.BaseRelationCondition import GreaterThanCondition, SmallerThanCondition
+from condition.CompositeCondition import AndCondition
+from condition.Condition import Variable
+from evaluation.EvaluationMechanismFactory import EvaluationMechanismFactory, TreeBasedEvaluationMechanismParameters
+from plugin.stocks.Stocks import MetastockDataFormatter
+from stream.FileStream import FileInputStream
+from stream.Stream import OutputStream
+from tree.PatternMatchStorage import TreeStorageParameters
+from test.UnitTests.EventTimestampTests import createEvent
+
+
+def patternMatchTests():
+    joinedMatchEventsTest()
+    storedJoinedMatchesTest()
+    print("Pattern match unit tests executed successfully.")
+
+
+def isMaterialized(match: PatternMatch):
+    return match._PatternMatch__events is not None
+
+
+def joinedMatchEventsTest():
+    start_time = datetime(2020, 1, 1)
+    events = [createEvent(event_type, start_time + timedelta(minutes=i)) for i, event_type in enumerate("ABCD")]
+    first_match = PatternMatch.join(PatternMatch(events[2:3]), PatternMatch(events[0:1]), ((1, 0), (0, 0)))
+    second_match = PatternMatch.join(PatternMatch(events[1:2]), PatternMatch(events[3:4]), ((0, 0), (1, 0)))
+    match = PatternMatch.join(second_match, first_match, ((1, 0), (0, 0), (1, 1), (0, 1)))
+    assert match.events == events, "Test joinedMatchEvents Failed: wrong events of a joined match"
+    assert [match.get_event(i) for i in range(len(events))] == events and match.get_event(-1) == events[-1], \
+        "Test joinedMatchEvents Failed: wrong event fetched from a joined match"
+    assert (match.first_timestamp_ns, match.last_timestamp_ns) == (events[0].timestamp_ns, events[-1].timestamp_ns), \
+        "Test joinedMatchEvents Failed: wrong timestamps of a joined match"
+    assert not any(isMaterialized(pm) for pm in (match, first_match, second_match)), \
+        "Test joinedMatchEvents Failed: the events of a joined match were stored upon access"
+    restored_match = pickle.loads(pickle.dumps(match))
+    assert isMaterialized(restored_match) and restored_match.events == events, \
+        "Test joinedMatchEvents Failed: the events of a joined match were not preserved by pickling"
+    match.materialize_events()
+    assert isMaterialized(match) and match.events == events and match.get_event(1) == events[1], \
+        "Test joinedMatchEvents Failed: wrong events of a materialized match"
+    assert not isMaterialized(first_match), \
+        "Test joinedMatchEvents Failed: the joined partial matches were materialized"
+
+
+def storedJoinedMatchesTest():
+    pattern = Pattern(
+        SeqOperator(PrimitiveEventStructure("AAPL", "a"), PrimitiveEventStructure("AMZN", "b"),
+                    PrimitiveEventStructure("GOOG", "c")),
+        AndCondition(
+            GreaterThanCondition(Variable("a", lambda x: x["Opening Price"]),
+                                 Variable("b", lambda x: x["Opening Price"])),
+            SmallerThanCondition(Variable("b", lambda x: x["Opening Price"]),
+                                 Variable("c", lambda x: x["Opening Price"]))),
+        timedelta(minutes=5))
+    eval_mechanism_params = TreeBasedEvaluationMechanismParameters(
+        storage_params=TreeStorageParameters(sort_storage=True, clean_up_interval=10 ** 6))
+    eval_mechanism = EvaluationMechanismFactory.build_eval_mechanism(eval_mechanism_params, [pattern])
+    matches = OutputStream()
+    eval_mechanism.eval(FileInputStream("test/EventFiles/NASDAQ_AAPL_AMZN_GOOG.txt"), matches,
+                        MetastockDataFormatter())
+    full_matches = list(matches)
+    assert len(full_matches) > 0 and all(isMaterialized(match) for match in full_matches), \
+        "Test storedJoinedMatches Failed: the full matches do not hold their events"
+    assert all(match.events[0].payload["Opening Price"] > match.events[1].payload["Opening Price"] and
+               match.events[0].timestamp_ns <= match.events[1].timestamp_ns <= match.events[2].timestamp_ns
+               for match in full_matches), \
+        "Test storedJoinedMatches Failed: a full match violates the pattern"
+    node = eval_mechanism._tree.get_leaves()[0]
+    internal_nodes = []
+    while not node.is_output_node():
+        node = node._parents[0]
+        internal_nodes.append(node)
+    stored_matches = [pm for internal_node in internal_nodes[:-1] for pm in internal_node.get_storage_unit()]
+    assert len(stored_matches) > 0, "Test storedJoinedMatches Failed: no partial matches were stored"
+    assert not any(isMaterialized(pm) for pm in stored_matches), \
+        "Test storedJoinedMatches Failed: a partial match stored at an internal node holds a list of events"
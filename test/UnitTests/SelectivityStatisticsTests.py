@@ -0,0 +1,229 @@
+from copy import deepcopy
+from datetime import datetime, timedelta
+
+from adaptive.optimizer.Optimizer import TrivialOptimizer
+from adaptive.statistics.StatisticsCollectorFactory import StatisticsCollectorFactory, StatisticsCollectorParameters
+from adaptive.statistics.Statistics import SelectivityStatistics, SlidingWindowSelectivityStatistics, \
+    ExponentialDecaySelectivityStatistics
+from adaptive.statistics.StatisticsFactory import StatisticsFactory
+from adaptive.statistics.StatisticsTypes import StatisticsTypes, SelectivityStatisticsTypes
+from base.Event import datetime_to_nanoseconds
+from base.Pattern import Pattern
+from base.PatternStructure import SeqOperator, PrimitiveEventStructure
+from condition.BaseRelationCondition import SmallerThanCondition
+from condition.CompositeCondition import AndCondition
+from condition.Condition import Variable
+from plan.LeftDeepTreeBuilders import TrivialLeftDeepTreeBuilder
+from plan.TreeCostModels import TreeCostModels
+from plan.negation.NegationAlgorithmTypes import NegationAlgorithmTypes
+from plugin.stocks.Stocks import MetastockDataFormatter
+from stream.FileStream import FileInputStream
+from stream.Stream import OutputStream
+from tree.PatternMatchStorage import TreeStorageParameters
+from tree.evaluation.TrivialTreeBasedEvaluationMechnism import TrivialTreeBasedEvaluationMechanism
+
+
+START_TIME = datetime(2020, 1, 1)
+
+
+def selectivityStatisticsTests():
+    slidingWindowExpiryTest()
+    slidingWindowSkipTest()
+    exponentialDecayDriftTest()
+    exponentialDecayRescaleTest()
+    selectivityStatisticsFactoryTest()
+    selectivitySamplingTest()
+    statisticsIdCopyTest()
+    treeConditionCopiesTest()
+    print("Selectivity statistics unit tests executed successfully.")
+
+
+def createPattern():
+    return Pattern(
+        SeqOperator(PrimitiveEventStructure("AAPL", "a"), PrimitiveEventStructure("AMZN", "b"),
+                    PrimitiveEventStructure("AVID", "c")),
+        AndCondition(
+            SmallerThanCondition(Variable("a", lambda x: x["Opening Price"]),
+                                 Variable("b", lambda x: x["Opening Price"])),
+            SmallerThanCondition(Variable("b", lambda x: x["Opening Price"]),
+                                 Variable("c", lambda x: x["Opening Price"]))),
+        timedelta(minutes=5))
+
+
+def recordEvaluations(statistics, atomic_condition, successes_number, failures_number):
+    for _ in range(successes_number):
+        statistics.update((atomic_condition, True))
+    for _ in range(failures_number):
+        statistics.update((atomic_condition, False))
+
+
+def getTimestamp(time_from_start: timedelta = timedelta(0)):
+    """
+    Returns the given time since the start of the test in nanoseconds since the epoch.
+    """
+    return datetime_to_nanoseconds(START_TIME + time_from_start)
+
+
+def getSelectivity(statistics):
+    """
+    Returns the selectivity between the events a and b, which only depends on the first condition of the pattern.
+    """
+    return statistics.get_statistics()[0][1]
+
+
+def slidingWindowExpiryTest():
+    pattern = createPattern()
+    statistics = SlidingWindowSelectivityStatistics(timedelta(minutes=10), pattern, sampling_rate=1, buckets_number=2)
+    atomic_condition = pattern.condition.extract_atomic_conditions()[0]
+    statistics.update_time(getTimestamp())
+    recordEvaluations(statistics, atomic_condition, 1, 3)
+    assert getSelectivity(statistics) == 0.25, "Test slidingWindowExpiry Failed: wrong initial selectivity"
+    statistics.update_time(getTimestamp(timedelta(minutes=6)))
+    recordEvaluations(statistics, atomic_condition, 4, 0)
+    assert getSelectivity(statistics) == 5 / 8, "Test slidingWindowExpiry Failed: a bucket expired too early"
+    statistics.update_time(getTimestamp(timedelta(minutes=11)))
+    assert getSelectivity(statistics) == 1.0, "Test slidingWindowExpiry Failed: the oldest bucket did not expire"
+    assert statistics.get_statistics()[1][2] == 1.0, \
+        "Test slidingWindowExpiry Failed: the selectivity of a condition that was never evaluated changed"
+
+
+def slidingWindowSkipTest():
+    pattern = createPattern()
+    statistics = SlidingWindowSelectivityStatistics(timedelta(minutes=10), pattern, sampling_rate=1, buckets_number=5)
+    atomic_condition = pattern.condition.extract_atomic_conditions()[0]
+    statistics.update_time(getTimestamp())
+    recordEvaluations(statistics, atomic_condition, 1, 1)
+    statistics.update_time(getTimestamp(timedelta(minutes=3)))
+    recordEvaluations(statistics, atomic_condition, 0, 2)
+    assert getSelectivity(statistics) == 0.25, "Test slidingWindowSkip Failed: wrong initial selectivity"
+    # no events arrived during a period longer than the entire window
+    statistics.update_time(getTimestamp(timedelta(hours=5)))
+    assert getSelectivity(statistics) == 0.25, \
+        "Test slidingWindowSkip Failed: the last known selectivity was not retained"
+    recordEvaluations(statistics, atomic_condition, 3, 1)
+    assert getSelectivity(statistics) == 0.75, "Test slidingWindowSkip Failed: expired evaluations were counted"
+    # the window restarts at the time it was skipped to
+    statistics.update_time(getTimestamp(timedelta(hours=5, minutes=3)))
+    recordEvaluations(statistics, atomic_condition, 0, 4)
+    statistics.update_time(getTimestamp(timedelta(hours=5, minutes=9)))
+    assert getSelectivity(statistics) == 3 / 8, "Test slidingWindowSkip Failed: a bucket expired too early"
+    statistics.update_time(getTimestamp(timedelta(hours=5, minutes=10)))
+    assert getSelectivity(statistics) == 0.0, "Test slidingWindowSkip Failed: the oldest bucket did not expire"
+
+
+def exponentialDecayDriftTest():
+    pattern = createPattern()
+    decay_statistics = ExponentialDecaySelectivityStatistics(timedelta(minutes=1), pattern, sampling_rate=1)
+    cumulative_statistics = SelectivityStatistics(pattern, sampling_rate=1)
+    atomic_condition = pattern.condition.extract_atomic_conditions()[0]
+    for statistics in [decay_statistics, cumulative_statistics]:
+        statistics.update_time(getTimestamp())
+        recordEvaluations(statistics, atomic_condition, 0, 10)
+        statistics.update_time(getTimestamp(timedelta(minutes=5)))
+        recordEvaluations(statistics, atomic_condition, 10, 0)
+    assert getSelectivity(cumulative_statistics) == 0.5, \
+        "Test exponentialDecayDrift Failed: wrong cumulative selectivity"
+    assert getSelectivity(decay_statistics) > 0.99, \
+        "Test exponentialDecayDrift Failed: the selectivity did not follow the drift"
+
+
+def exponentialDecayRescaleTest():
+    pattern = createPattern()
+    statistics = ExponentialDecaySelectivityStatistics(timedelta(minutes=1), pattern, sampling_rate=1)
+    atomic_condition = pattern.condition.extract_atomic_conditions()[0]
+    statistics.update_time(getTimestamp())
+    recordEvaluations(statistics, atomic_condition, 1, 3)
+    # the weight of new evaluations exceeds the maximal one, and the counters are rescaled
+    statistics.update_time(getTimestamp(timedelta(minutes=300)))
+    assert abs(getSelectivity(statistics) - 0.25) < 1e-9, \
+        "Test exponentialDecayRescale Failed: rescaling changed the selectivity"
+    recordEvaluations(statistics, atomic_condition, 1, 0)
+    assert getSelectivity(statistics) > 0.99, "Test exponentialDecayRescale Failed: old evaluations were not decayed"
+    # a gap far longer than the one representable by a single weight
+    statistics.update_time(getTimestamp(timedelta(days=365)))
+    recordEvaluations(statistics, atomic_condition, 0, 1)
+    assert getSelectivity(statistics) < 0.01, "Test exponentialDecayRescale Failed: old evaluations were not decayed"
+    statistics.update_time(getTimestamp(timedelta(days=365, minutes=1)))
+    recordEvaluations(statistics, atomic_condition, 1, 1)
+    assert 0.0 < getSelectivity(statistics) < 1.0, "Test exponentialDecayRescale Failed: invalid selectivity"
+
+
+def selectivityStatisticsFactoryTest():
+    expected_types = {SelectivityStatisticsTypes.CUMULATIVE: SelectivityStatistics,
+                      SelectivityStatisticsTypes.SLIDING_WINDOW: SlidingWindowSelectivityStatistics,
+                      SelectivityStatisticsTypes.EXPONENTIAL_DECAY: ExponentialDecaySelectivityStatistics}
+    for selectivity_statistics_type, expected_type in expected_types.items():
+        statistics = StatisticsFactory.create_statistics(createPattern(), StatisticsTypes.SELECTIVITY_MATRIX,
+                                                         timedelta(minutes=10),
+                                                         selectivity_statistics_type=selectivity_statistics_type)
+        assert type(statistics) is expected_type, \
+            "Test selectivityStatisticsFactory Failed: wrong statistics created for %s" % (selectivity_statistics_type,)
+    try:
+        StatisticsFactory.create_statistics(createPattern(), StatisticsTypes.SELECTIVITY_MATRIX, timedelta(minutes=10),
+                                            selectivity_statistics_type=None)
+    except Exception:
+        pass
+    else:
+        assert False, "Test selectivityStatisticsFactory Failed: an unknown statistics type was accepted"
+
+
+def selectivitySamplingTest():
+    pattern = createPattern()
+    statistics = SelectivityStatistics(pattern, sampling_rate=3)
+    first_condition, second_condition = pattern.condition.extract_atomic_conditions()
+    first_results = [True, False, False, False, True, True, False]
+    for i, result in enumerate(first_results):
+        statistics.update((first_condition, result))
+        if i % 2 == 0:
+            # the evaluations of each condition are sampled independently
+            statistics.update((second_condition, result))
+    # only the evaluations 1, 4 and 7 of the first condition and 1 and 4 of the second condition are recorded
+    assert statistics._atomic_condition_totals == [3, 2] and statistics._atomic_condition_successes == [1, 1], \
+        "Test selectivitySampling Failed: wrong evaluation counters"
+    assert getSelectivity(statistics) == 1 / 3 and statistics.get_statistics()[1][2] == 0.5, \
+        "Test selectivitySampling Failed: wrong selectivity"
+    try:
+        SelectivityStatistics(pattern, sampling_rate=0)
+    except Exception:
+        pass
+    else:
+        assert False, "Test selectivitySampling Failed: an invalid sampling rate was accepted"
+
+
+def statisticsIdCopyTest():
+    pattern = createPattern()
+    statistics = SelectivityStatistics(pattern, sampling_rate=1)
+    atomic_conditions = pattern.condition.extract_atomic_conditions()
+    assert [atomic_condition.get_statistics_id() for atomic_condition in atomic_conditions] == [0, 1], \
+        "Test statisticsIdCopy Failed: wrong statistics IDs"
+    copied_atomic_conditions = deepcopy(pattern.condition).extract_atomic_conditions()
+    assert [atomic_condition.get_statistics_id() for atomic_condition in copied_atomic_conditions] == [0, 1], \
+        "Test statisticsIdCopy Failed: the statistics IDs changed upon copying the condition"
+    recordEvaluations(statistics, copied_atomic_conditions[0], 1, 3)
+    assert getSelectivity(statistics) == 0.25 and statistics.get_statistics()[1][2] == 1.0, \
+        "Test statisticsIdCopy Failed: the evaluations of a copied condition were not recorded as the original ones"
+
+
+def treeConditionCopiesTest():
+    pattern = Pattern(
+        SeqOperator(PrimitiveEventStructure("AAPL", "a"), PrimitiveEventStructure("AMZN", "b")),
+        SmallerThanCondition(Variable("a", lambda x: x["Volume"]), Variable("b", lambda x: x["Volume"])),
+        timedelta(minutes=5))
+    statistics_collector = StatisticsCollectorFactory.build_statistics_collector(
+        StatisticsCollectorParameters(statistics_types=StatisticsTypes.SELECTIVITY_MATRIX, selectivity_sampling_rate=1),
+        [pattern])
+    tree_plan_builder = TrivialLeftDeepTreeBuilder(TreeCostModels.INTERMEDIATE_RESULTS_TREE_COST_MODEL,
+                                                   NegationAlgorithmTypes.NAIVE_NEGATION_ALGORITHM)
+    tree_plan = tree_plan_builder.build_tree_plan(pattern, statistics_collector.get_statistics())
+    # the tree is only replaced once, upon the first event
+    optimizer = TrivialOptimizer(tree_plan_builder, True)
+    eval_mechanism = TrivialTreeBasedEvaluationMechanism({pattern: tree_plan}, TreeStorageParameters(),
+                                                         statistics_collector, optimizer, timedelta(days=365))
+    matches = OutputStream()
+    eval_mechanism.eval(FileInputStream("test/EventFiles/NASDAQ_AAPL_AMZN_GOOG.txt"), matches,
+                        MetastockDataFormatter())
+    # the tree evaluates copies of the pattern condition, which share the statistics collector of the original one
+    selectivity_matrix = statistics_collector.get_statistics()[StatisticsTypes.SELECTIVITY_MATRIX]
+    matches_number = len(list(matches))
+    assert matches_number > 0 and 0.0 < selectivity_matrix[0][1] < 1.0, \
+        "Test treeConditionCopies Failed: the selectivity was not updated by the conditions of the tree"
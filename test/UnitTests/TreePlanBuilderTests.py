@@ -0,0 +1,179 @@
+import random
+from datetime import timedelta
+from itertools import combinations, permutations
+
+from adaptive.statistics.StatisticsTypes import StatisticsTypes
+from base.Pattern import Pattern
+from base.PatternStructure import AndOperator, PrimitiveEventStructure
+from condition.CompositeCondition import AndCondition
+from plan.BushyTreeBuilders import DynamicProgrammingBushyTreeBuilder
+from plan.IterativeImprovement import IterativeImprovementType, IterativeImprovementInitType, \
+    IterativeImprovementSearchType, IterativeImprovementAlgorithmBuilder, LeftDeepOrderCostCalculator
+from plan.LeftDeepTreeBuilders import DynamicProgrammingLeftDeepTreeBuilder, LeftDeepTreeBuilder, \
+    IterativeImprovementLeftDeepTreeBuilder
+from plan.TreeCostModel import IntermediateResultsTreeCostModel
+from plan.TreeCostModels import TreeCostModels
+from plan.TreePlan import TreePlanBinaryNode, TreePlanLeafNode, OperatorTypes
+from plan.negation.NegationAlgorithmTypes import NegationAlgorithmTypes
+
+
+ARRIVAL_RATES = [0.9, 0.2, 0.5, 0.05, 0.7]
+CLIQUE_SELECTIVITY_MATRIX = [[1.0, 0.3, 0.8, 0.5, 0.1],
+                             [0.3, 1.0, 0.6, 0.9, 0.4],
+                             [0.8, 0.6, 1.0, 0.2, 0.7],
+                             [0.5, 0.9, 0.2, 1.0, 0.05],
+                             [0.1, 0.4, 0.7, 0.05, 1.0]]
+CHAIN_SELECTIVITY_MATRIX = [[1.0, 0.3, 1.0, 1.0, 1.0],
+                            [0.3, 1.0, 0.6, 1.0, 1.0],
+                            [1.0, 0.6, 1.0, 0.2, 1.0],
+                            [1.0, 1.0, 0.2, 1.0, 0.05],
+                            [1.0, 1.0, 1.0, 0.05, 1.0]]
+DISCONNECTED_SELECTIVITY_MATRIX = [[1.0, 1.0, 0.8, 1.0, 1.0],
+                                   [1.0, 1.0, 1.0, 1.0, 0.4],
+                                   [0.8, 1.0, 1.0, 1.0, 1.0],
+                                   [1.0, 1.0, 1.0, 1.0, 1.0],
+                                   [1.0, 0.4, 1.0, 1.0, 1.0]]
+
+
+def treePlanBuilderTests():
+    dynamicProgrammingBushyOptimalityTest()
+    dynamicProgrammingBushyNoCrossProductsTest()
+    dynamicProgrammingBushyDisconnectedTest()
+    dynamicProgrammingLeftDeepOptimalityTest()
+    iterativeImprovementMoveCostTest()
+    iterativeImprovementRestartsTest()
+    print("Tree plan builder unit tests executed successfully.")
+
+
+def createPattern():
+    return Pattern(AndOperator(*[PrimitiveEventStructure("T%d" % i, "e%d" % i) for i in range(len(ARRIVAL_RATES))]),
+                   AndCondition(), timedelta(seconds=10))
+
+
+def createStatistics(selectivity_matrix):
+    return {StatisticsTypes.SELECTIVITY_MATRIX: selectivity_matrix, StatisticsTypes.ARRIVAL_RATES: ARRIVAL_RATES}
+
+
+def buildDynamicProgrammingBushyPlan(pattern, statistics):
+    builder = DynamicProgrammingBushyTreeBuilder(TreeCostModels.INTERMEDIATE_RESULTS_TREE_COST_MODEL,
+                                                 NegationAlgorithmTypes.NAIVE_NEGATION_ALGORITHM)
+    return builder.build_tree_plan(pattern, statistics).root
+
+
+def buildDynamicProgrammingLeftDeepPlan(pattern, statistics):
+    builder = DynamicProgrammingLeftDeepTreeBuilder(TreeCostModels.INTERMEDIATE_RESULTS_TREE_COST_MODEL,
+                                                    NegationAlgorithmTypes.NAIVE_NEGATION_ALGORITHM)
+    return builder.build_tree_plan(pattern, statistics).root
+
+
+def getAllBushyTrees(indices):
+    """
+    Returns all bushy trees over the given event indices.
+    """
+    if len(indices) == 1:
+        return [TreePlanLeafNode(indices[0])]
+    trees = []
+    for left_size in range(1, len(indices)):
+        for left_indices in combinations(indices, left_size):
+            right_indices = tuple(index for index in indices if index not in left_indices)
+            for left_tree in getAllBushyTrees(left_indices):
+                for right_tree in getAllBushyTrees(right_indices):
+                    trees.append(TreePlanBinaryNode(OperatorTypes.AND, left_tree, right_tree))
+    return trees
+
+
+def getLeafIndices(tree):
+    if isinstance(tree, TreePlanLeafNode):
+        return {tree.event_index}
+    return getLeafIndices(tree.left_child) | getLeafIndices(tree.right_child)
+
+
+def dynamicProgrammingBushyOptimalityTest():
+    pattern, statistics = createPattern(), createStatistics(CLIQUE_SELECTIVITY_MATRIX)
+    cost_model = IntermediateResultsTreeCostModel()
+    plan_cost = cost_model.get_plan_cost(pattern, buildDynamicProgrammingBushyPlan(pattern, statistics), statistics)
+    optimal_cost = min(cost_model.get_plan_cost(pattern, tree, statistics)
+                       for tree in getAllBushyTrees(tuple(range(len(ARRIVAL_RATES)))))
+    assert abs(plan_cost - optimal_cost) <= 1e-9 * optimal_cost, \
+        "Test dynamicProgrammingBushyOptimality Failed: plan cost %s, optimal cost %s" % (plan_cost, optimal_cost)
+
+
+def dynamicProgrammingBushyNoCrossProductsTest():
+    pattern, statistics = createPattern(), createStatistics(CHAIN_SELECTIVITY_MATRIX)
+    nodes = [buildDynamicProgrammingBushyPlan(pattern, statistics)]
+    while len(nodes) > 0:
+        node = nodes.pop()
+        if isinstance(node, TreePlanLeafNode):
+            continue
+        assert any(CHAIN_SELECTIVITY_MATRIX[i][j] < 1.0
+                   for i in getLeafIndices(node.left_child) for j in getLeafIndices(node.right_child)), \
+            "Test dynamicProgrammingBushyNoCrossProducts Failed: a cross product was created"
+        nodes.extend([node.left_child, node.right_child])
+
+
+def dynamicProgrammingBushyDisconnectedTest():
+    pattern, statistics = createPattern(), createStatistics(DISCONNECTED_SELECTIVITY_MATRIX)
+    plan = buildDynamicProgrammingBushyPlan(pattern, statistics)
+    assert getLeafIndices(plan) == set(range(len(ARRIVAL_RATES))), \
+        "Test dynamicProgrammingBushyDisconnected Failed: not all events appear in the plan"
+
+
+def dynamicProgrammingLeftDeepOptimalityTest():
+    pattern, statistics = createPattern(), createStatistics(CLIQUE_SELECTIVITY_MATRIX)
+    cost_model = IntermediateResultsTreeCostModel()
+    plan_cost = cost_model.get_plan_cost(pattern, buildDynamicProgrammingLeftDeepPlan(pattern, statistics), statistics)
+    all_trees = [LeftDeepTreeBuilder._order_to_tree_topology(list(order), pattern)
+                 for order in permutations(range(len(ARRIVAL_RATES)))]
+    optimal_cost = min(cost_model.get_plan_cost(pattern, tree, statistics) for tree in all_trees)
+    assert abs(plan_cost - optimal_cost) <= 1e-9 * optimal_cost, \
+        "Test dynamicProgrammingLeftDeepOptimality Failed: plan cost %s, optimal cost %s" % (plan_cost, optimal_cost)
+
+
+def getOrderCost(pattern, order, statistics):
+    return IntermediateResultsTreeCostModel().get_plan_cost(
+        pattern, LeftDeepTreeBuilder._order_to_tree_topology(order, pattern), statistics)
+
+
+def iterativeImprovementMoveCostTest():
+    pattern, statistics = createPattern(), createStatistics(CLIQUE_SELECTIVITY_MATRIX)
+    leaf_costs = [getOrderCost(pattern, [i], statistics) for i in range(len(ARRIVAL_RATES))]
+    random_generator = random.Random(0)
+    for ii_type in [IterativeImprovementType.SWAP_BASED, IterativeImprovementType.CIRCLE_BASED]:
+        algorithm = IterativeImprovementAlgorithmBuilder.create_ii_algorithm(ii_type)
+        order = list(range(len(ARRIVAL_RATES)))
+        cost_calculator = LeftDeepOrderCostCalculator(order, leaf_costs, CLIQUE_SELECTIVITY_MATRIX)
+        for _ in range(100):
+            cost = cost_calculator.get_cost()
+            move = algorithm._movement_generator(len(order), random_generator)
+            algorithm._movement_function(order, move)
+            cost_difference = cost_calculator.get_move_cost_difference(min(move), max(move))
+            expected_cost = getOrderCost(pattern, order, statistics)
+            assert abs(cost + cost_difference - expected_cost) <= 1e-9 * expected_cost, \
+                "Test iterativeImprovementMoveCost Failed: wrong cost difference for %s" % (ii_type,)
+            if random_generator.random() < 0.5:
+                cost_calculator.commit_move()
+            else:
+                algorithm._movement_function(order, algorithm._reverse_move(move))
+                cost_calculator.revert_move()
+                assert abs(cost_calculator.get_cost() - cost) <= 1e-9 * cost, \
+                    "Test iterativeImprovementMoveCost Failed: a reverted move changed the cost for %s" % (ii_type,)
+
+
+def iterativeImprovementRestartsTest():
+    pattern, statistics = createPattern(), createStatistics(CLIQUE_SELECTIVITY_MATRIX)
+    optimal_cost = IntermediateResultsTreeCostModel().get_plan_cost(
+        pattern, buildDynamicProgrammingLeftDeepPlan(pattern, statistics), statistics)
+    random.seed(0)
+    search_types = [IterativeImprovementSearchType.HILL_CLIMBING, IterativeImprovementSearchType.SIMULATED_ANNEALING]
+    for search_type in search_types:
+        for workers_number in [1, 2]:
+            builder = IterativeImprovementLeftDeepTreeBuilder(TreeCostModels.INTERMEDIATE_RESULTS_TREE_COST_MODEL,
+                                                              NegationAlgorithmTypes.NAIVE_NEGATION_ALGORITHM, 200,
+                                                              IterativeImprovementType.SWAP_BASED,
+                                                              IterativeImprovementInitType.RANDOM, search_type,
+                                                              restarts_number=8, workers_number=workers_number,
+                                                              time_limit=timedelta(seconds=10))
+            plan_cost = IntermediateResultsTreeCostModel().get_plan_cost(
+                pattern, builder.build_tree_plan(pattern, statistics).root, statistics)
+            assert abs(plan_cost - optimal_cost) <= 1e-9 * optimal_cost, \
+                "Test iterativeImprovementRestarts Failed: plan cost %s, optimal cost %s" % (plan_cost, optimal_cost)
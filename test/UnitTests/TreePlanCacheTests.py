@@ -0,0 +1,222 @@
+import os
+import tempfile
+from datetime import timedelta
+from functools import partial
+
+from adaptive.optimizer.Optimizer import TrivialOptimizer
+from adaptive.optimizer.TreePlanCache import TreePlanCache, TreePlanCacheParameters
+from adaptive.statistics.StatisticsTypes import StatisticsTypes
+from base.Pattern import Pattern
+from base.PatternStructure import SeqOperator, PrimitiveEventStructure
+from condition.BaseRelationCondition import GreaterThanCondition, SmallerThanCondition
+from condition.CompositeCondition import AndCondition
+from condition.Condition import Variable, BinaryCondition
+from plan.IterativeImprovement import IterativeImprovementType, IterativeImprovementInitType
+from plan.LeftDeepTreeBuilders import GreedyLeftDeepTreeBuilder, IterativeImprovementLeftDeepTreeBuilder
+from plan.TreeCostModels import TreeCostModels
+from plan.negation.NegationAlgorithmTypes import NegationAlgorithmTypes
+
+
+def treePlanCacheTests():
+    treePlanCacheHitTest()
+    treePlanCacheFingerprintTest()
+    treePlanCacheBuilderParametersTest()
+    treePlanCachePartialFunctionTest()
+    treePlanCacheIndescribableObjectTest()
+    treePlanCacheEvictionTest()
+    treePlanCachePersistenceTest()
+    treePlanCacheCapturedObjectPersistenceTest()
+    treePlanCacheOptimizerTest()
+    print("Tree plan cache unit tests executed successfully.")
+
+
+def createPattern(threshold=100):
+    return Pattern(
+        SeqOperator(PrimitiveEventStructure("AAPL", "a"), PrimitiveEventStructure("AMZN", "b"),
+                    PrimitiveEventStructure("AVID", "c")),
+        AndCondition(
+            GreaterThanCondition(Variable("a", lambda x: x["Opening Price"]),
+                                 Variable("b", lambda x: x["Opening Price"])),
+            SmallerThanCondition(Variable("b", lambda x: x["Peak Price"]), threshold)),
+        timedelta(minutes=5))
+
+
+def createStatistics(arrival_rates):
+    return {StatisticsTypes.ARRIVAL_RATES: arrival_rates,
+            StatisticsTypes.SELECTIVITY_MATRIX: [[1.0, 0.5, 1.0], [0.5, 1.0, 0.2], [1.0, 0.2, 1.0]]}
+
+
+def createTwoEventStatistics():
+    return {StatisticsTypes.ARRIVAL_RATES: [0.3, 0.01], StatisticsTypes.SELECTIVITY_MATRIX: [[1.0, 0.5], [0.5, 1.0]]}
+
+
+def createBuilder():
+    return GreedyLeftDeepTreeBuilder(TreeCostModels.INTERMEDIATE_RESULTS_TREE_COST_MODEL,
+                                     NegationAlgorithmTypes.NAIVE_NEGATION_ALGORITHM)
+
+
+def treePlanCacheHitTest():
+    cache = TreePlanCache(TreePlanCacheParameters(capacity=4, statistics_quantization_base=1.5))
+    pattern, builder = createPattern(), createBuilder()
+    statistics = createStatistics([0.3, 0.01, 0.1])
+    tree_plan = builder.build_tree_plan(pattern, statistics)
+    cache.add_tree_plan(pattern, statistics, builder, tree_plan)
+    assert cache.get_tree_plan(pattern, createStatistics([0.31, 0.0101, 0.1]), builder) is tree_plan, \
+        "Test treePlanCacheHit Failed: similar statistics did not hit the cached plan"
+    assert cache.get_tree_plan(pattern, createStatistics([0.3, 0.1, 0.01]), builder) is None, \
+        "Test treePlanCacheHit Failed: different statistics hit the cached plan"
+
+
+def treePlanCacheFingerprintTest():
+    cache = TreePlanCache(TreePlanCacheParameters(capacity=4))
+    pattern, builder = createPattern(), createBuilder()
+    statistics = createStatistics([0.3, 0.01, 0.1])
+    cache.add_tree_plan(pattern, statistics, builder, builder.build_tree_plan(pattern, statistics))
+    assert cache.get_tree_plan(createPattern(), statistics, builder) is not None, \
+        "Test treePlanCacheFingerprint Failed: an identical pattern did not hit the cached plan"
+    assert cache.get_tree_plan(createPattern(threshold=200), statistics, builder) is None, \
+        "Test treePlanCacheFingerprint Failed: a pattern with a different condition hit the cached plan"
+
+
+def treePlanCacheBuilderParametersTest():
+    cache = TreePlanCache(TreePlanCacheParameters(capacity=4))
+    pattern, builder = createPattern(), createBuilder()
+    statistics = createStatistics([0.3, 0.01, 0.1])
+    cache.add_tree_plan(pattern, statistics, builder, builder.build_tree_plan(pattern, statistics))
+    assert cache.get_tree_plan(pattern, statistics, createBuilder()) is not None, \
+        "Test treePlanCacheBuilderParameters Failed: an identical builder did not hit the cached plan"
+    other_builder = GreedyLeftDeepTreeBuilder(TreeCostModels.INTERMEDIATE_RESULTS_TREE_COST_MODEL,
+                                              NegationAlgorithmTypes.STATISTIC_NEGATION_ALGORITHM)
+    assert cache.get_tree_plan(pattern, statistics, other_builder) is None, \
+        "Test treePlanCacheBuilderParameters Failed: a builder with a different negation algorithm hit the cached plan"
+    ii_builders = [IterativeImprovementLeftDeepTreeBuilder(TreeCostModels.INTERMEDIATE_RESULTS_TREE_COST_MODEL,
+                                                           NegationAlgorithmTypes.NAIVE_NEGATION_ALGORITHM, step_limit,
+                                                           IterativeImprovementType.SWAP_BASED,
+                                                           IterativeImprovementInitType.GREEDY)
+                   for step_limit in [20, 20, 40]]
+    cache.add_tree_plan(pattern, statistics, ii_builders[0], ii_builders[0].build_tree_plan(pattern, statistics))
+    assert cache.get_tree_plan(pattern, statistics, ii_builders[1]) is not None, \
+        "Test treePlanCacheBuilderParameters Failed: an identical builder did not hit the cached plan"
+    assert cache.get_tree_plan(pattern, statistics, ii_builders[2]) is None, \
+        "Test treePlanCacheBuilderParameters Failed: a builder with a different step limit hit the cached plan"
+
+
+def createPartialFunctionPattern(threshold):
+    def is_in_range(lower_bound, x, y, upper_bound=None):
+        return lower_bound < x - y < upper_bound
+
+    return Pattern(
+        SeqOperator(PrimitiveEventStructure("AAPL", "a"), PrimitiveEventStructure("AMZN", "b")),
+        BinaryCondition(Variable("a", lambda x: x["Opening Price"]), Variable("b", lambda x: x["Opening Price"]),
+                        partial(is_in_range, 0, upper_bound=threshold)),
+        timedelta(minutes=5))
+
+
+def treePlanCachePartialFunctionTest():
+    cache = TreePlanCache(TreePlanCacheParameters(capacity=4))
+    pattern, builder = createPartialFunctionPattern(10), createBuilder()
+    statistics = createTwoEventStatistics()
+    cache.add_tree_plan(pattern, statistics, builder, builder.build_tree_plan(pattern, statistics))
+    assert cache.get_tree_plan(createPartialFunctionPattern(10), statistics, builder) is not None, \
+        "Test treePlanCachePartialFunction Failed: an identical pattern did not hit the cached plan"
+    assert cache.get_tree_plan(createPartialFunctionPattern(20), statistics, builder) is None, \
+        "Test treePlanCachePartialFunction Failed: a partial function with different arguments hit the cached plan"
+
+
+def treePlanCacheIndescribableObjectTest():
+    cache = TreePlanCache(TreePlanCacheParameters(capacity=4))
+    marker = object()
+    pattern = Pattern(
+        SeqOperator(PrimitiveEventStructure("AAPL", "a"), PrimitiveEventStructure("AMZN", "b")),
+        BinaryCondition(Variable("a", lambda x: x["Opening Price"]), Variable("b", lambda x: x["Opening Price"]),
+                        lambda x, y: x is not marker and x > y),
+        timedelta(minutes=5))
+    builder = createBuilder()
+    statistics = createTwoEventStatistics()
+    cache.add_tree_plan(pattern, statistics, builder, builder.build_tree_plan(pattern, statistics))
+    assert len(cache) == 0, "Test treePlanCacheIndescribableObject Failed: a pattern that cannot be fingerprinted " \
+                            "was cached"
+    assert cache.get_tree_plan(pattern, statistics, builder) is None, \
+        "Test treePlanCacheIndescribableObject Failed: a pattern that cannot be fingerprinted hit the cache"
+
+
+def treePlanCacheEvictionTest():
+    cache = TreePlanCache(TreePlanCacheParameters(capacity=2))
+    pattern, builder = createPattern(), createBuilder()
+    all_statistics = [createStatistics([rate, 0.01, 0.1]) for rate in [0.1, 1.0, 10.0]]
+    for statistics in all_statistics[:2]:
+        cache.add_tree_plan(pattern, statistics, builder, builder.build_tree_plan(pattern, statistics))
+    cache.get_tree_plan(pattern, all_statistics[0], builder)
+    cache.add_tree_plan(pattern, all_statistics[2], builder, builder.build_tree_plan(pattern, all_statistics[2]))
+    assert len(cache) == 2, "Test treePlanCacheEviction Failed: the capacity was exceeded"
+    assert cache.get_tree_plan(pattern, all_statistics[1], builder) is None, \
+        "Test treePlanCacheEviction Failed: the least recently used plan was not evicted"
+    assert cache.get_tree_plan(pattern, all_statistics[0], builder) is not None, \
+        "Test treePlanCacheEviction Failed: a recently used plan was evicted"
+
+
+def treePlanCachePersistenceTest():
+    pattern, builder = createPattern(), createBuilder()
+    statistics = createStatistics([0.3, 0.01, 0.1])
+    tree_plan = builder.build_tree_plan(pattern, statistics)
+    with tempfile.TemporaryDirectory() as directory:
+        cache_params = TreePlanCacheParameters(capacity=4, file_path=os.path.join(directory, "plans.cache"))
+        TreePlanCache(cache_params).add_tree_plan(pattern, statistics, builder, tree_plan)
+        loaded_tree_plan = TreePlanCache(cache_params).get_tree_plan(createPattern(), statistics, builder)
+    assert loaded_tree_plan is not None, "Test treePlanCachePersistence Failed: the stored plan was not loaded"
+    assert loaded_tree_plan.root.get_event_names() == tree_plan.root.get_event_names(), \
+        "Test treePlanCachePersistence Failed: the loaded plan has a different structure"
+    assert loaded_tree_plan.root.is_equivalent(tree_plan.root), \
+        "Test treePlanCachePersistence Failed: the conditions of the loaded plan were not restored"
+
+
+class PriceThreshold:
+    """
+    An object without a custom representation, such that its default one contains its memory address.
+    """
+    def __init__(self, value):
+        self.value = value
+
+
+def createCapturedObjectPattern():
+    threshold = PriceThreshold(100)
+    return Pattern(
+        SeqOperator(PrimitiveEventStructure("AAPL", "a"), PrimitiveEventStructure("AMZN", "b")),
+        BinaryCondition(Variable("a", lambda x: x["Opening Price"]), Variable("b", lambda x: x["Opening Price"]),
+                        lambda x, y: x - y > threshold.value),
+        timedelta(minutes=5))
+
+
+def treePlanCacheCapturedObjectPersistenceTest():
+    builder = createBuilder()
+    statistics = createTwoEventStatistics()
+    with tempfile.TemporaryDirectory() as directory:
+        cache_params = TreePlanCacheParameters(capacity=4, file_path=os.path.join(directory, "plans.cache"))
+        pattern = createCapturedObjectPattern()
+        TreePlanCache(cache_params).add_tree_plan(pattern, statistics, builder,
+                                                  builder.build_tree_plan(pattern, statistics))
+        # the objects of a restarted process reside at different addresses
+        loaded_tree_plan = TreePlanCache(cache_params).get_tree_plan(createCapturedObjectPattern(), statistics,
+                                                                     createBuilder())
+    assert loaded_tree_plan is not None, \
+        "Test treePlanCacheCapturedObjectPersistence Failed: the stored plan was not loaded for an identical pattern"
+
+
+def treePlanCacheOptimizerTest():
+    class CountingBuilder(GreedyLeftDeepTreeBuilder):
+        def __init__(self):
+            super().__init__(TreeCostModels.INTERMEDIATE_RESULTS_TREE_COST_MODEL,
+                             NegationAlgorithmTypes.NAIVE_NEGATION_ALGORITHM)
+            self.builds_number = 0
+
+        def build_tree_plan(self, pattern, statistics):
+            self.builds_number += 1
+            return super().build_tree_plan(pattern, statistics)
+
+    builder = CountingBuilder()
+    optimizer = TrivialOptimizer(builder, True, TreePlanCache(TreePlanCacheParameters()))
+    pattern = createPattern()
+    for arrival_rates in [[0.3, 0.01, 0.1], [0.1, 0.01, 0.3], [0.3, 0.01, 0.1], [0.1, 0.01, 0.3]]:
+        optimizer.build_new_plan(createStatistics(arrival_rates), pattern)
+    assert builder.builds_number == 2, \
+        "Test treePlanCacheOptimizer Failed: %d plans were built instead of 2" % (builder.builds_number,)
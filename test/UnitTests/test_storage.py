@@ -1,6 +1,9 @@
+from base.Event import datetime_to_nanoseconds
 from base.PatternMatch import PatternMatch
-from tree.PatternMatchStorage import SortedPatternMatchStorage, UnsortedPatternMatchStorage, EquationSides
+from tree.PatternMatchStorage import SortedPatternMatchStorage, UnsortedPatternMatchStorage, \
+    HashedPatternMatchStorage, BlockedSortedPatternMatchStorage, EquationSides
 from datetime import datetime, timedelta
+from time import perf_counter
 from condition.Condition import RelopTypes
 
 
@@ -14,6 +17,7 @@ class Event:
         self.payload = payload
         self.event_type = event_type
         self.timestamp = time
+        self.timestamp_ns = datetime_to_nanoseconds(time)
 
     def __repr__(self):
         return "((type: {}), (payload: {}), (timestamp: {}))".format(
@@ -21,6 +25,54 @@ class Event:
         )
 
 
+class CountingKey:
+    """
+    A key function counting its invocations.
+    """
+    def __init__(self, key: callable):
+        self.key = key
+        self.calls = 0
+
+    def __call__(self, pm):
+        self.calls += 1
+        return self.key(pm)
+
+
+def create_expiring_partial_matches(dt: datetime, count: int):
+    """
+    Returns pattern matches with the same payload whose timestamps alternate between an early and a late one, such that
+    cleaning at dt + 1 day expires every other pattern match regardless of the order of the storage.
+    """
+    return [PatternMatch([Event(0, "type", dt + timedelta(2 * (i % 2)))]) for i in range(count)]
+
+
+def measure_cleanup_time(create_storage: callable, dt: datetime, count: int):
+    """
+    Returns the time it takes to remove half of the given number of pattern matches from a new storage.
+    """
+    storage = create_storage()
+    for pm in create_expiring_partial_matches(dt, count):
+        storage.add(pm)
+    start_time = perf_counter()
+    storage._clean_expired_partial_matches(datetime_to_nanoseconds(dt + timedelta(1)))
+    elapsed_time = perf_counter() - start_time
+    assert len(storage) == count // 2, "cleanup removed an incorrect number of pms"
+    return elapsed_time
+
+
+def check_cleanup_complexity(create_storage: callable, dt: datetime, storage_name: str):
+    """
+    Verifies that removing expired pattern matches takes quasi-linear time in their number rather than quadratic time.
+    """
+    small_count, large_count = 10000, 40000
+    small_time = min(measure_cleanup_time(create_storage, dt, small_count) for _ in range(3))
+    large_time = min(measure_cleanup_time(create_storage, dt, large_count) for _ in range(3))
+    # a quadratic cleanup would take about 16 times longer on the large storage
+    assert large_time < 8 * small_time + 0.01, \
+        "%s: cleanup time grows too fast with the storage size (%.3fs for %d pms, %.3fs for %d pms)" % \
+        (storage_name, small_time, small_count, large_time, large_count)
+
+
 """
 """
 
@@ -30,6 +82,10 @@ def run_storage_tests():
     unsorted_storage_test.run_tests()
     sorted_storage_test = TestSortedStorage()
     sorted_storage_test.run_tests()
+    blocked_sorted_storage_test = TestBlockedSortedStorage()
+    blocked_sorted_storage_test.run_tests()
+    hashed_storage_test = TestHashedStorage()
+    hashed_storage_test.run_tests()
     print("PatternMatchStorage unit tests executed successfully.")
 
 
@@ -71,13 +127,38 @@ class TestUnsortedStorage:
         u_s.add(self.pm2)
         u_s.add(self.pm3)
         u_s.add(self.pm4)
-        u_s._clean_expired_partial_matches(self.dt + timedelta(15))
+        u_s._clean_expired_partial_matches(datetime_to_nanoseconds(self.dt + timedelta(15)))
         assert u_s.get("nothing") == [self.pm3, self.pm4], "UnsortedPatternMatchStorage clean_expired_partial_matches failed"
 
+    def test_try_clean_expired_partial_matches(self):
+        u_s = UnsortedPatternMatchStorage(2)
+        u_s.add(self.pm3)
+        u_s.try_clean_expired_partial_matches(datetime_to_nanoseconds(self.dt + timedelta(15)))
+        assert len(u_s) == 1, "UnsortedPatternMatchStorage: cleanup was performed before the cleanup interval elapsed"
+        u_s.add(self.pm1)
+        u_s.add(self.pm4)
+        u_s.add(self.pm2)
+        u_s.try_clean_expired_partial_matches(datetime_to_nanoseconds(self.dt + timedelta(15)))
+        assert u_s.get("nothing") == [self.pm3, self.pm4], \
+            "UnsortedPatternMatchStorage try_clean_expired_partial_matches failed"
+        u_s.add(self.pm1)
+        u_s.add(self.pm2)
+        # only the expired pattern match is removed, regardless of its position in the storage
+        u_s.try_clean_expired_partial_matches(datetime_to_nanoseconds(self.dt + timedelta(1)))
+        assert u_s.get("nothing") == [self.pm3, self.pm4, self.pm2], \
+            "UnsortedPatternMatchStorage try_clean_expired_partial_matches failed"
+        assert len(u_s) == 3 and list(u_s) == [self.pm3, self.pm4, self.pm2] and self.pm1 not in u_s, \
+            "UnsortedPatternMatchStorage: an expired pm is still accessible"
+
+    def test_clean_expired_partial_matches_complexity(self):
+        check_cleanup_complexity(lambda: UnsortedPatternMatchStorage(1), self.dt, "UnsortedPatternMatchStorage")
+
     def run_tests(self):
         self.test_add()
         self.test_get()
         self.test_clean_expired_partial_matches()
+        self.test_try_clean_expired_partial_matches()
+        self.test_clean_expired_partial_matches_complexity()
 
 
 """
@@ -226,6 +307,173 @@ class TestSortedStorage:
                 result_pms[i].first_timestamp <= self.pm_list[2].first_timestamp
             ), "SortedPatternMatchStorage: get_smaller_or_equal returned incorrect pm[i]"
 
+    def test_clean_expired_partial_matches(self):
+        s = SortedPatternMatchStorage(lambda x: x.events[0].payload, RelopTypes.Greater, EquationSides.left, 1)
+        for pm in reversed(self.pm_list):
+            s.add(pm)
+        s._clean_expired_partial_matches(datetime_to_nanoseconds(self.dt + timedelta(75)))
+        assert len(s) == 2 and list(s) == self.pm_list[8:], \
+            "SortedPatternMatchStorage: clean_expired_partial_matches failed"
+        assert s.get(7) == self.pm_list[8:] and s.get(8) == [self.pm_list[9]], \
+            "SortedPatternMatchStorage: get after clean_expired_partial_matches failed"
+        assert self.pm_list[7] not in s and self.pm_list[8] in s, \
+            "SortedPatternMatchStorage: contains after clean_expired_partial_matches failed"
+
+    def test_clean_expired_partial_matches_complexity(self):
+        # all the pattern matches share the same key, which is the worst case for locating a pattern match by its key
+        count = 1000
+        key = CountingKey(lambda x: x.events[0].payload)
+        s = SortedPatternMatchStorage(key, RelopTypes.Equal, EquationSides.left, 1)
+        for pm in create_expiring_partial_matches(self.dt, count):
+            s.add(pm)
+        key.calls = 0
+        s._clean_expired_partial_matches(datetime_to_nanoseconds(self.dt + timedelta(1)))
+        assert len(s) == count // 2 and len(s.get(0)) == count // 2, \
+            "SortedPatternMatchStorage: clean_expired_partial_matches failed"
+        assert key.calls <= count, \
+            "SortedPatternMatchStorage: %d key calculations to remove %d pms" % (key.calls, count // 2)
+        check_cleanup_complexity(lambda: SortedPatternMatchStorage(lambda x: x.events[0].payload, RelopTypes.Equal,
+                                                                   EquationSides.left, 1),
+                                 self.dt, "SortedPatternMatchStorage")
+
     def run_tests(self):
         self.test_add()
         self.test_get()
+        self.test_clean_expired_partial_matches()
+        self.test_clean_expired_partial_matches_complexity()
+
+
+"""
+BLOCKED SORTED STORAGE
+"""
+
+
+class TestBlockedSortedStorage:
+    def __init__(self):
+        self.dt = datetime(2020, 1, 1)
+        self.pm_list = []
+        for i in range(10):
+            self.pm_list.append(PatternMatch([Event(i, "type", self.dt + timedelta(i * 10))]))
+
+    def create_storage(self, rel_op, in_leaf=False):
+        # small blocks are used in order to exercise block splitting
+        s = BlockedSortedPatternMatchStorage(lambda x: x.first_timestamp, rel_op, EquationSides.left, 1,
+                                             in_leaf=in_leaf, sort_by_first_timestamp=in_leaf, block_size=2)
+        for j in range(3):
+            for i in reversed(range(10)):
+                s.add(self.pm_list[i])
+        # 0,0,0,10,10,10,...,90,90,90
+        return s
+
+    def test_add(self):
+        s = self.create_storage(RelopTypes.Equal)
+        assert len(s) == 30, "BlockedSortedPatternMatchStorage: incorrect size"
+        for i in range(30):
+            assert s[i] == self.pm_list[i // 3], "BlockedSortedPatternMatchStorage: incorrect order"
+        assert list(s) == [self.pm_list[i // 3] for i in range(30)], "BlockedSortedPatternMatchStorage: incorrect order"
+        assert self.pm_list[4] in s, "BlockedSortedPatternMatchStorage: stored pm not found"
+
+    def test_get(self):
+        expected_results = {
+            RelopTypes.Equal: lambda i: i == 3,
+            RelopTypes.NotEqual: lambda i: i != 3,
+            RelopTypes.Greater: lambda i: i > 3,
+            RelopTypes.Smaller: lambda i: i < 3,
+            RelopTypes.GreaterEqual: lambda i: i >= 3,
+            RelopTypes.SmallerEqual: lambda i: i <= 3,
+        }
+        for rel_op, predicate in expected_results.items():
+            s = self.create_storage(rel_op)
+            result_pms = s.get(self.dt + timedelta(30))
+            expected_pms = [self.pm_list[i // 3] for i in range(30) if predicate(i // 3)]
+            assert len(result_pms) == len(expected_pms), \
+                "BlockedSortedPatternMatchStorage: get returned incorrect number of pms for %s" % (rel_op,)
+            assert list(result_pms) == expected_pms, \
+                "BlockedSortedPatternMatchStorage: get returned incorrect pms for %s" % (rel_op,)
+            assert result_pms[-1] == expected_pms[-1], "BlockedSortedPatternMatchStorage: incorrect view indexing"
+        s = self.create_storage(RelopTypes.Equal)
+        assert len(s.get(self.dt + timedelta(35))) == 0, "BlockedSortedPatternMatchStorage: get_equal returned pms"
+
+    def test_clean_expired_partial_matches(self):
+        s = self.create_storage(RelopTypes.Greater)
+        s._clean_expired_partial_matches(datetime_to_nanoseconds(self.dt + timedelta(75)))
+        assert list(s) == [self.pm_list[8]] * 3 + [self.pm_list[9]] * 3, \
+            "BlockedSortedPatternMatchStorage: clean_expired_partial_matches failed"
+        s = BlockedSortedPatternMatchStorage(lambda x: x.first_timestamp, RelopTypes.Greater, EquationSides.left, 1,
+                                             in_leaf=True, sort_by_first_timestamp=True, block_size=2)
+        for pm in self.pm_list:
+            s.add(pm)
+        s._clean_expired_partial_matches(datetime_to_nanoseconds(self.dt + timedelta(75)))
+        assert list(s) == self.pm_list[8:], "BlockedSortedPatternMatchStorage: clean_expired_partial_matches failed"
+        assert list(s.get(self.dt + timedelta(80))) == [self.pm_list[9]], \
+            "BlockedSortedPatternMatchStorage: get after clean_expired_partial_matches failed"
+
+    def run_tests(self):
+        self.test_add()
+        self.test_get()
+        self.test_clean_expired_partial_matches()
+
+
+"""
+HASHED STORAGE
+"""
+
+
+class TestHashedStorage:
+    def __init__(self):
+        self.dt = datetime(2020, 1, 1)
+        self.pm_list = []
+        for i in range(10):
+            self.pm_list.append(PatternMatch([Event(i % 3, "type", self.dt + timedelta(i * 10))]))
+
+    def test_add(self):
+        h_s = HashedPatternMatchStorage(lambda x: x.events[0].payload, 0)
+        for pm in self.pm_list:
+            h_s.add(pm)
+        assert len(h_s) == 10, "HashedPatternMatchStorage: incorrect size"
+        for i in range(10):
+            assert h_s[i] == self.pm_list[i], "HashedPatternMatchStorage: addition wasn't by order"
+            assert self.pm_list[i] in h_s, "HashedPatternMatchStorage: stored pm not found"
+
+    def test_get(self):
+        h_s = HashedPatternMatchStorage(lambda x: x.events[0].payload, 0)
+        for pm in self.pm_list:
+            h_s.add(pm)
+        for key in range(3):
+            expected = [pm for pm in self.pm_list if pm.events[0].payload == key]
+            assert list(h_s.get(key)) == expected, "HashedPatternMatchStorage: get returned incorrect pms"
+        assert list(h_s.get(3)) == [], "HashedPatternMatchStorage: get of a missing key returned pms"
+
+    def test_clean_expired_partial_matches(self):
+        for in_leaf in [True, False]:
+            h_s = HashedPatternMatchStorage(lambda x: x.events[0].payload, 0, in_leaf)
+            for pm in self.pm_list:
+                h_s.add(pm)
+            h_s._clean_expired_partial_matches(datetime_to_nanoseconds(self.dt + timedelta(75)))
+            assert h_s.get_internal_buffer() == self.pm_list[8:], \
+                "HashedPatternMatchStorage: clean_expired_partial_matches failed"
+            assert list(h_s.get(0)) == [self.pm_list[9]], "HashedPatternMatchStorage: bucket was not cleaned"
+            assert list(h_s.get(1)) == [], "HashedPatternMatchStorage: empty bucket was not removed"
+            assert list(h_s.get(2)) == [self.pm_list[8]], "HashedPatternMatchStorage: bucket was not cleaned"
+
+    def test_clean_expired_partial_matches_complexity(self):
+        # all the pattern matches share the same bucket
+        count = 1000
+        key = CountingKey(lambda x: x.events[0].payload)
+        h_s = HashedPatternMatchStorage(key, 1)
+        for pm in create_expiring_partial_matches(self.dt, count):
+            h_s.add(pm)
+        key.calls = 0
+        h_s._clean_expired_partial_matches(datetime_to_nanoseconds(self.dt + timedelta(1)))
+        assert len(h_s) == count // 2 and len(h_s.get(0)) == count // 2, \
+            "HashedPatternMatchStorage: clean_expired_partial_matches failed"
+        assert key.calls <= count, \
+            "HashedPatternMatchStorage: %d key calculations to remove %d pms" % (key.calls, count // 2)
+        check_cleanup_complexity(lambda: HashedPatternMatchStorage(lambda x: x.events[0].payload, 1), self.dt,
+                                 "HashedPatternMatchStorage")
+
+    def run_tests(self):
+        self.test_add()
+        self.test_get()
+        self.test_clean_expired_partial_matches()
+        self.test_clean_expired_partial_matches_complexity()
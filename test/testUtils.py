@@ -156,7 +156,8 @@ def createTest(testName, patterns, events=None, eventStream=nasdaqEventStream):
 
 def runTest(testName, patterns, createTestFile = False,
             eval_mechanism_params=DEFAULT_TESTING_EVALUATION_MECHANISM_SETTINGS,
-            events=None, eventStream=nasdaqEventStream, expected_file_name=None):
+            events=None, eventStream=nasdaqEventStream, expected_file_name=None, parallel_execution_params=None,
+            use_thread_safe_streams=True):
     if expected_file_name is None:
         expected_file_name = testName
 
@@ -182,13 +183,13 @@ def runTest(testName, patterns, createTestFile = False,
     elif expected_file_name == "NotEverywhere":
         events = custom3.duplicate()
 
-    cep = CEP(patterns, eval_mechanism_params)
+    cep = CEP(patterns, eval_mechanism_params, parallel_execution_params)
 
     base_matches_directory = os.path.join(absolutePath, 'test', 'Matches')
     output_file_name = "%sMatches.txt" % testName.split('|')[0]
     expected_output_file_name = "%sMatches.txt" % expected_file_name.split('|')[0]
     matches_stream = FileOutputStream(base_matches_directory, output_file_name)
-    running_time = cep.run(events, matches_stream, DEFAULT_TESTING_DATA_FORMATTER)
+    running_time = cep.run(events, matches_stream, DEFAULT_TESTING_DATA_FORMATTER, use_thread_safe_streams)
 
     expected_matches_path = os.path.join(absolutePath, 'test', 'TestsExpected', expected_output_file_name)
     actual_matches_path = os.path.join(base_matches_directory, output_file_name)
@@ -8,8 +8,19 @@ from test.MultiPattern_tests import *
 from test.StorageTests import *
 import test.EventProbabilityTests
 from test.NestedTests import *
+from test.ParallelTests import *
+from test.StreamTests import *
+from test.BenchmarkTests import *
 from test.UnitTests.test_storage import run_storage_tests
 from test.UnitTests.RuleTransformationTests import ruleTransformationTests
+from test.UnitTests.ConditionCompilationTests import conditionCompilationTests
+from test.UnitTests.TreePlanBuilderTests import treePlanBuilderTests
+from test.UnitTests.TreePlanCacheTests import treePlanCacheTests
+from test.UnitTests.MetastockDataFormatterTests import metastockDataFormatterTests
+from test.UnitTests.SelectivityStatisticsTests import selectivityStatisticsTests
+from test.UnitTests.ArrivalRatesStatisticsTests import arrivalRatesStatisticsTests
+from test.UnitTests.EventTimestampTests import eventTimestampTests
+from test.UnitTests.PatternMatchTests import patternMatchTests
 
 
 runTest.over_all_time = 0
@@ -45,6 +56,7 @@ iiRandomPatternSearchTest()
 iiRandom2PatternSearchTest()
 iiGreedyPatternSearchTest()
 iiGreedy2PatternSearchTest()
+iiSimulatedAnnealingPatternSearchTest()
 
 zStreamOrdPatternSearchTest()
 zStreamPatternSearchTest()
@@ -128,6 +140,8 @@ freezePolicy2PatternSearchTest()
 
 # storage tests
 sortedStorageTest()
+blockedSortedStorageTest()
+hashedStorageTest()
 run_storage_tests()
 
 # multi-pattern tests
@@ -161,6 +175,30 @@ test.EventProbabilityTests.threePatternsTest()
 # rule transformation unit tests
 ruleTransformationTests()
 
+# condition compilation unit tests
+conditionCompilationTests()
+
+# tree plan builder unit tests
+treePlanBuilderTests()
+
+# tree plan cache unit tests
+treePlanCacheTests()
+
+# selectivity statistics unit tests
+selectivityStatisticsTests()
+
+# arrival rates statistics unit tests
+arrivalRatesStatisticsTests()
+
+# metastock data formatter unit tests
+metastockDataFormatterTests()
+
+# event timestamp unit tests
+eventTimestampTests()
+
+# pattern match unit tests
+patternMatchTests()
+
 # nested operator tests
 basicNestedTest()
 nestedAscendingTest()
@@ -260,10 +298,64 @@ googleIncreasePatternSearchTest_8()
 amazonSpecificPatternSearchTest_8()
 googleAmazonLowPatternSearchTest_8()
 
+# partial match migration evaluation with trivial optimizer
+simple_9()
+googleAscendPatternSearchTest_9()
+amazonInstablePatternSearchTest_9()
+msftDrivRacePatternSearchTest_9()
+googleIncreasePatternSearchTest_9()
+amazonSpecificPatternSearchTest_9()
+googleAmazonLowPatternSearchTest_9()
+
+# partial match migration evaluation with zstream invariant optimizer
+simple_10()
+googleAscendPatternSearchTest_10()
+amazonInstablePatternSearchTest_10()
+msftDrivRacePatternSearchTest_10()
+googleIncreasePatternSearchTest_10()
+amazonSpecificPatternSearchTest_10()
+googleAmazonLowPatternSearchTest_10()
+
+# partial match migration evaluation with trivial optimizer running in the background
+simple_11()
+googleAscendPatternSearchTest_11()
+amazonInstablePatternSearchTest_11()
+msftDrivRacePatternSearchTest_11()
+googleIncreasePatternSearchTest_11()
+amazonSpecificPatternSearchTest_11()
+googleAmazonLowPatternSearchTest_11()
+
+# trivial evaluation with deviation aware optimizer and time-aware selectivity statistics
+amazonInstablePatternSearchTest_12()
+amazonInstablePatternSearchTest_13()
+
+# data parallel tests
+groupByKeySingleUnitTest()
+groupByKeyMultipleUnitsTest()
+groupByKeyMultiprocessingTest()
+ripSingleUnitTest()
+ripMultipleUnitsTest()
+ripAscendMultiprocessingTest()
+hyperCubeMultipleTypesTest()
+hyperCubeSameTypeMultiprocessingTest()
+ripMatchOrderTest()
+hyperCubeDuplicateEventsTest()
+liveStreamParallelTest()
+
+# input stream tests
+lazyFileStreamTest()
+mmapFileStreamTest()
+gzipFileStreamTest()
+unsynchronizedStreamTest()
+unsynchronizedStreamParallelTest()
+streamThreadSafetyRestoredTest()
+
 
 # benchmarks
 if INCLUDE_BENCHMARKS:
     sortedStorageBenchMarkTest()
+    partialMatchHandoffBenchMarkTest()
+    leftDeepPlanningBenchMarkTest()
 
 
 # Twitter tests
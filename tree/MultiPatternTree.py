@@ -1,5 +1,6 @@
 from typing import Dict
 
+from base.Event import timedelta_to_nanoseconds
 from base.Pattern import Pattern
 from plan.TreePlan import TreePlan
 from tree.PatternMatchStorage import TreeStorageParameters
@@ -49,7 +50,7 @@ class MultiPatternTree:
         Returns True if the given match satisfies the window/confidence constraints of the given pattern
         and False otherwise.
         """
-        if match.last_timestamp - match.first_timestamp > pattern.window:
+        if match.last_timestamp_ns - match.first_timestamp_ns > timedelta_to_nanoseconds(pattern.window):
             return False
         return pattern.confidence is None or match.probability is None or match.probability >= pattern.confidence
 
@@ -1,7 +1,10 @@
+from bisect import bisect_left, bisect_right
+from collections import deque
+from heapq import heappush, heappop
+from itertools import chain, count, islice
 from base.PatternMatch import PatternMatch
 from misc import DefaultConfig
 from misc.Utils import get_first_index, get_last_index
-from datetime import datetime
 from misc.Utils import find_partial_match_by_timestamp
 from condition.Condition import RelopTypes, EquationSides
 
@@ -23,6 +26,16 @@ class PatternMatchStorage:
         self._sorted_by_arrival_order = sorted_by_arrival_order
         self._clean_up_interval = clean_up_interval
         self._access_count = 0
+        # a min-heap of (earliest timestamp, insertion number, pattern match) handles, allowing to remove each expired
+        # pattern match individually - if the pattern matches are stored according to their arrival order, the
+        # expired ones form a prefix of the storage and the heap is not used
+        self.__expiration_index = []
+        # the (insertion number, pattern match) pairs added since the last cleanup, which are yet to enter the heap
+        self.__unindexed_partial_matches = []
+        self.__insertion_counter = count()
+        # the ids of the expired pattern matches that are still physically stored - they are skipped upon access and
+        # purged all at once when they make up half of the storage
+        self.__expired_match_ids = set()
 
     def get_key_function(self):
         """
@@ -34,18 +47,20 @@ class PatternMatchStorage:
         """
         Returns the number of the currently stored pattern matches.
         """
-        return len(self._partial_matches)
+        return len(self._partial_matches) - len(self.__expired_match_ids)
 
     def __setitem__(self, index, item):
         """
         Implements list-style "set item" semantics.
         """
+        self.__purge_expired_partial_matches_if_any()
         self._partial_matches[index] = item
 
     def __getitem__(self, index):
         """
         Implements list-style "get item" semantics.
         """
+        self.__purge_expired_partial_matches_if_any()
         # index can be a slice [:] so the return value can be a list
         return self._partial_matches[index]
 
@@ -53,45 +68,99 @@ class PatternMatchStorage:
         """
         Implements list-style "remove item" semantics.
         """
+        self.__purge_expired_partial_matches_if_any()
         del self._partial_matches[index]
 
     def __iter__(self):
         """
         Implements list-style iteration semantics.
         """
-        return iter(self._partial_matches)
+        return iter(self._filter_expired_partial_matches(self._partial_matches))
 
     def __contains__(self, item):
         """
         Returns True if the given item is stored and False otherwise.
         """
-        return item in self._partial_matches
+        return item in self._filter_expired_partial_matches(self._partial_matches)
 
-    def try_clean_expired_partial_matches(self, earliest_timestamp: datetime):
+    def try_clean_expired_partial_matches(self, earliest_timestamp: int):
         """
-        If the number of storage accesses exceeded a predefined threshold, perform a costly operation of removing
-        expired partial matches.
+        If the number of storage accesses exceeded a predefined threshold, removes the expired partial matches.
         """
         if self._access_count < self._clean_up_interval:
             return
         self._clean_expired_partial_matches(earliest_timestamp)
         self._access_count = 0
 
-    def _clean_expired_partial_matches(self, earliest_timestamp: datetime):
+    def _register_partial_match(self, pm: PatternMatch):
         """
-        Removes pattern matches whose earliest earliest_timestamp violates the time window constraint.
+        Counts an access to the storage and schedules the given new pattern match for insertion into the expiration
+        index upon the next cleanup.
+        """
+        self._access_count += 1
+        if not self._sorted_by_arrival_order:
+            self.__unindexed_partial_matches.append((next(self.__insertion_counter), pm))
+
+    def _clean_expired_partial_matches(self, earliest_timestamp: int):
+        """
+        Removes pattern matches whose earliest timestamp violates the time window constraint.
+        Each expired pattern match is popped from the expiration index in logarithmic time and removed exactly once. By
+        default, the removal only marks the pattern match as expired, and the marked pattern matches are purged in a
+        single linear pass once they make up half of the storage, making the removal amortized constant time.
         """
         if self._sorted_by_arrival_order:
-            count = find_partial_match_by_timestamp(self._partial_matches, earliest_timestamp)
-            self._partial_matches = self._partial_matches[count:]
-        else:
-            self._partial_matches = list(filter(lambda pm: pm.first_timestamp >= earliest_timestamp,
-                                                self._partial_matches))
+            self._remove_expired_prefix(find_partial_match_by_timestamp(self._partial_matches, earliest_timestamp))
+            return
+        index = self.__expiration_index
+        for insertion_number, pm in self.__unindexed_partial_matches:
+            heappush(index, (pm.first_timestamp_ns, insertion_number, pm))
+        self.__unindexed_partial_matches.clear()
+        while len(index) > 0 and index[0][0] < earliest_timestamp:
+            self._remove_partial_match(heappop(index)[2])
+        if len(self.__expired_match_ids) > 0 and 2 * len(self.__expired_match_ids) >= len(self._partial_matches):
+            self._purge_expired_partial_matches()
+
+    def _remove_expired_prefix(self, expired_count: int):
+        """
+        Removes the given number of pattern matches from the beginning of a storage sorted by arrival order.
+        """
+        del self._partial_matches[:expired_count]
+
+    def _remove_partial_match(self, pm: PatternMatch):
+        """
+        Marks the given expired pattern match as removed. It is skipped upon access until it is purged.
+        """
+        self.__expired_match_ids.add(id(pm))
+
+    def _filter_expired_partial_matches(self, partial_matches):
+        """
+        Returns the given pattern matches without the ones marked as expired. If no pattern match is currently marked,
+        the given collection is returned as is.
+        """
+        expired_match_ids = self.__expired_match_ids
+        if len(expired_match_ids) == 0:
+            return partial_matches
+        return [pm for pm in partial_matches if id(pm) not in expired_match_ids]
+
+    def _purge_expired_partial_matches(self):
+        """
+        Physically removes the pattern matches marked as expired from the storage.
+        """
+        self._partial_matches = self._filter_expired_partial_matches(self._partial_matches)
+        self.__expired_match_ids.clear()
+
+    def __purge_expired_partial_matches_if_any(self):
+        """
+        Purges the pattern matches marked as expired before an access by position, which must not count them.
+        """
+        if len(self.__expired_match_ids) > 0:
+            self._purge_expired_partial_matches()
 
     def get_internal_buffer(self):
         """
         Returns the internal buffer actually storing the pattern matches.
         """
+        self.__purge_expired_partial_matches_if_any()
         return self._partial_matches
 
     def add(self, pm: PatternMatch):
@@ -121,13 +190,13 @@ class SortedPatternMatchStorage(PatternMatchStorage):
         Returns True if the given item is stored and False otherwise.
         Performs an efficient search in the sorted buffer.
         """
-        return item in self.__get_equal(self._get_key(item))
+        return item in self._filter_expired_partial_matches(self.__get_equal(self._get_key(item)))
 
     def add(self, pm: PatternMatch):
         """
         Efficiently inserts the new pattern match to the storage according to its key.
         """
-        self._access_count += 1
+        self._register_partial_match(pm)
         if self._sorted_by_arrival_order:
             # no need for artificially sorting
             self._partial_matches.append(pm)
@@ -142,7 +211,7 @@ class SortedPatternMatchStorage(PatternMatchStorage):
         """
         if len(self._partial_matches) == 0:
             return []
-        return self.__get_function(value)
+        return self._filter_expired_partial_matches(self.__get_function(value))
 
     def __get_equal(self, value: int or float):
         """
@@ -220,6 +289,356 @@ class SortedPatternMatchStorage(PatternMatchStorage):
         """
         return self.__get_smaller_aux(value, True)
 
+    def __get_all(self, value: int or float):
+        """
+        Returns all pattern matches regardless of the specified value.
+        """
+        return self._partial_matches
+
+    def __generate_get_function(self, rel_op: RelopTypes, equation_side: EquationSides):
+        """
+        Initializes the function responsible for selecting pattern matches to be returned upon a get() access.
+        """
+        if rel_op is None:
+            # can only happen in an edge case where the entire tree is composed of a single leaf
+            return self.__get_all
+        if rel_op == RelopTypes.Equal:
+            return self.__get_equal
+        if rel_op == RelopTypes.NotEqual:
+            return self.__get_unequal
+
+        if rel_op == RelopTypes.Greater:
+            return self.__get_greater if equation_side == EquationSides.left else self.__get_smaller
+        if rel_op == RelopTypes.Smaller:
+            return self.__get_smaller if equation_side == EquationSides.left else self.__get_greater
+
+        if rel_op == RelopTypes.GreaterEqual:
+            return self.__get_greater_or_equal if equation_side == EquationSides.left else self.__get_smaller_or_equal
+        if rel_op == RelopTypes.SmallerEqual:
+            return self.__get_smaller_or_equal if equation_side == EquationSides.left else self.__get_greater_or_equal
+
+
+class PatternMatchStorageView:
+    """
+    A read-only view over a range (or several disjoint ranges) of the pattern matches stored in a
+    BlockedSortedPatternMatchStorage. The view is created in time proportional to the number of storage blocks it
+    spans rather than to the number of pattern matches it contains, as no pattern match is copied.
+    Each segment of the view is a triplet of the form (block, start, end) referring to block[start:end].
+    """
+    def __init__(self, segments: list):
+        self.__segments = segments
+        self.__length = sum(end - start for _, start, end in segments)
+
+    def __len__(self):
+        return self.__length
+
+    def __iter__(self):
+        return chain.from_iterable(block if start == 0 and end == len(block) else islice(block, start, end)
+                                   for block, start, end in self.__segments)
+
+    def __getitem__(self, index):
+        """
+        Implements list-style "get item" semantics. Slicing a view returns a list.
+        """
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += self.__length
+        if index < 0 or index >= self.__length:
+            raise IndexError("Pattern match storage view index out of range")
+        for block, start, end in self.__segments:
+            if index < end - start:
+                return block[start + index]
+            index -= end - start
+
+    def __contains__(self, item):
+        return any(item == pm for pm in self)
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+
+class BlockedSortedPatternMatchStorage(PatternMatchStorage):
+    """
+    An alternative to SortedPatternMatchStorage designed for nodes holding large numbers of partial matches.
+    The pattern matches are kept sorted in a list of bounded-size blocks, each accompanied by the sorted list of the
+    keys of its pattern matches. An insertion only shifts the contents of a single block, and range queries return
+    views over the blocks instead of copying the relevant pattern matches.
+    """
+    def __init__(self, get_match_key: callable, rel_op: RelopTypes, equation_side: EquationSides,
+                 clean_up_interval: int, sort_by_first_timestamp=False, in_leaf=False,
+                 block_size: int = DefaultConfig.SORTED_STORAGE_BLOCK_SIZE):
+        super().__init__(get_match_key, in_leaf and sort_by_first_timestamp, clean_up_interval)
+        if block_size <= 0:
+            raise Exception("Invalid storage block size: %s" % (block_size,))
+        self.__block_size = block_size
+        self.__blocks = []
+        self.__block_keys = []
+        # the maximal key of each block, used for locating the block in which a given key should reside
+        self.__max_keys = []
+        self.__length = 0
+        self.__get_function = self.__generate_get_function(rel_op, equation_side)
+
+    def __len__(self):
+        return self.__length
+
+    def __iter__(self):
+        return chain.from_iterable(self.__blocks)
+
+    def __locate(self, index: int):
+        """
+        Translates a list-style index into the block containing the respective pattern match and its offset there.
+        """
+        if index < 0:
+            index += self.__length
+        if index < 0 or index >= self.__length:
+            raise IndexError("Pattern match storage index out of range")
+        for block_index, block in enumerate(self.__blocks):
+            if index < len(block):
+                return block_index, index
+            index -= len(block)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        block_index, offset = self.__locate(index)
+        return self.__blocks[block_index][offset]
+
+    def __setitem__(self, index, item):
+        """
+        Replaces the pattern match at the given position. The key of the new item must preserve the sorting order.
+        """
+        block_index, offset = self.__locate(index)
+        self.__blocks[block_index][offset] = item
+        self.__block_keys[block_index][offset] = self._get_key(item)
+        self.__max_keys[block_index] = self.__block_keys[block_index][-1]
+
+    def __delitem__(self, index):
+        self.__remove_position(*self.__locate(index))
+
+    def __remove_position(self, block_index: int, offset: int):
+        """
+        Removes the pattern match at the given offset of the given block.
+        """
+        del self.__blocks[block_index][offset]
+        del self.__block_keys[block_index][offset]
+        self.__length -= 1
+        if len(self.__blocks[block_index]) == 0:
+            self.__remove_block(block_index)
+        else:
+            self.__max_keys[block_index] = self.__block_keys[block_index][-1]
+
+    def __contains__(self, item):
+        """
+        Returns True if the given item is stored and False otherwise.
+        Only searches the range of the pattern matches with the same key as the given item.
+        """
+        return item in self.__get_equal(self._get_key(item))
+
+    def get_internal_buffer(self):
+        """
+        Returns a view over the entire storage.
+        """
+        return self.__view(self.__begin(), self.__end())
+
+    def add(self, pm: PatternMatch):
+        """
+        Inserts the new pattern match to the block corresponding to its key, splitting the block if it becomes too
+        large.
+        """
+        self._register_partial_match(pm)
+        self.__length += 1
+        key = self._get_key(pm)
+        if len(self.__blocks) == 0:
+            self.__blocks.append([pm])
+            self.__block_keys.append([key])
+            self.__max_keys.append(key)
+            return
+        if self._sorted_by_arrival_order or key >= self.__max_keys[-1]:
+            # no need for artificially sorting - the new pattern match goes to the end of the storage
+            block_index = len(self.__blocks) - 1
+            self.__blocks[block_index].append(pm)
+            self.__block_keys[block_index].append(key)
+            self.__max_keys[block_index] = key
+        else:
+            block_index = bisect_right(self.__max_keys, key)
+            offset = bisect_right(self.__block_keys[block_index], key)
+            self.__blocks[block_index].insert(offset, pm)
+            self.__block_keys[block_index].insert(offset, key)
+        if len(self.__blocks[block_index]) > 2 * self.__block_size:
+            self.__split_block(block_index)
+
+    def get(self, value: int or float):
+        """
+        Applies the storage-specific get() function to extract a view over the required pattern matches.
+        """
+        if self.__length == 0:
+            return []
+        return self.__get_function(value)
+
+    def _clean_expired_partial_matches(self, earliest_timestamp: int):
+        """
+        Removes pattern matches whose earliest timestamp violates the time window constraint.
+        When the storage is sorted by arrival order, the expired pattern matches form a prefix of the storage and
+        entire blocks are dropped at once. Otherwise, the expired pattern matches are removed from their blocks one by
+        one, and the blocks are redistributed if many of them became underpopulated.
+        """
+        if not self._sorted_by_arrival_order:
+            super()._clean_expired_partial_matches(earliest_timestamp)
+            if len(self.__blocks) > 1 and self.__length < len(self.__blocks) * self.__block_size // 2:
+                self.__rebuild_blocks()
+            return
+        expired_blocks_number = 0
+        while expired_blocks_number < len(self.__blocks) and \
+                self.__blocks[expired_blocks_number][-1].first_timestamp_ns < earliest_timestamp:
+            self.__length -= len(self.__blocks[expired_blocks_number])
+            expired_blocks_number += 1
+        if expired_blocks_number > 0:
+            del self.__blocks[:expired_blocks_number]
+            del self.__block_keys[:expired_blocks_number]
+            del self.__max_keys[:expired_blocks_number]
+        if len(self.__blocks) > 0:
+            expired_count = find_partial_match_by_timestamp(self.__blocks[0], earliest_timestamp)
+            if expired_count > 0:
+                del self.__blocks[0][:expired_count]
+                del self.__block_keys[0][:expired_count]
+                self.__length -= expired_count
+
+    def _remove_partial_match(self, pm: PatternMatch):
+        """
+        Locates the given pattern match among the ones sharing its key using a binary search over the stored keys and
+        removes it, only shifting the contents of a single block.
+        """
+        key = self._get_key(pm)
+        block_index = bisect_left(self.__max_keys, key)
+        while block_index < len(self.__blocks):
+            block, keys = self.__blocks[block_index], self.__block_keys[block_index]
+            offset = bisect_left(keys, key)
+            while offset < len(block) and keys[offset] == key:
+                if block[offset] is pm:
+                    self.__remove_position(block_index, offset)
+                    return
+                offset += 1
+            if offset < len(block):
+                # the pattern matches sharing the key of the given one end inside this block
+                return
+            block_index += 1
+
+    def __split_block(self, block_index: int):
+        """
+        Splits an oversized block into two halves.
+        """
+        block, keys = self.__blocks[block_index], self.__block_keys[block_index]
+        half = len(block) // 2
+        self.__blocks[block_index:block_index + 1] = [block[:half], block[half:]]
+        self.__block_keys[block_index:block_index + 1] = [keys[:half], keys[half:]]
+        self.__max_keys[block_index:block_index + 1] = [keys[half - 1], keys[-1]]
+
+    def __rebuild_blocks(self):
+        """
+        Redistributes the stored pattern matches into full blocks after a cleanup left many blocks underpopulated.
+        """
+        pattern_matches, keys = list(chain.from_iterable(self.__blocks)), list(chain.from_iterable(self.__block_keys))
+        self.__blocks = [pattern_matches[i:i + self.__block_size]
+                         for i in range(0, len(pattern_matches), self.__block_size)]
+        self.__block_keys = [keys[i:i + self.__block_size] for i in range(0, len(keys), self.__block_size)]
+        self.__max_keys = [block_keys[-1] for block_keys in self.__block_keys]
+
+    def __remove_block(self, block_index: int):
+        """
+        Removes an empty block.
+        """
+        del self.__blocks[block_index]
+        del self.__block_keys[block_index]
+        del self.__max_keys[block_index]
+
+    def __begin(self):
+        """
+        Returns the position of the first stored pattern match as a (block index, offset) pair.
+        """
+        return 0, 0
+
+    def __end(self):
+        """
+        Returns the position following the last stored pattern match as a (block index, offset) pair.
+        """
+        return len(self.__blocks), 0
+
+    def __first_position(self, value: int or float):
+        """
+        Returns the position of the first pattern match whose key is greater than or equal to the given value.
+        """
+        block_index = bisect_left(self.__max_keys, value)
+        if block_index == len(self.__blocks):
+            return self.__end()
+        return block_index, bisect_left(self.__block_keys[block_index], value)
+
+    def __last_position(self, value: int or float):
+        """
+        Returns the position of the first pattern match whose key is greater than the given value.
+        """
+        block_index = bisect_right(self.__max_keys, value)
+        if block_index == len(self.__blocks):
+            return self.__end()
+        return block_index, bisect_right(self.__block_keys[block_index], value)
+
+    def __segments(self, start: tuple, end: tuple):
+        """
+        Returns the list of the (block, start, end) segments covering the pattern matches between the given positions.
+        """
+        (start_block, start_offset), (end_block, end_offset) = start, end
+        if start_block == end_block:
+            return [] if start_offset >= end_offset else [(self.__blocks[start_block], start_offset, end_offset)]
+        segments = [(self.__blocks[start_block], start_offset, len(self.__blocks[start_block]))]
+        for block in islice(self.__blocks, start_block + 1, end_block):
+            segments.append((block, 0, len(block)))
+        if end_offset > 0:
+            segments.append((self.__blocks[end_block], 0, end_offset))
+        return segments
+
+    def __view(self, start: tuple, end: tuple):
+        """
+        Returns a view over the pattern matches between the given positions.
+        """
+        return PatternMatchStorageView(self.__segments(start, end))
+
+    def __get_equal(self, value: int or float):
+        """
+        Returns the pattern matches whose keys are equal to the given value.
+        """
+        return self.__view(self.__first_position(value), self.__last_position(value))
+
+    def __get_unequal(self, value: int or float):
+        """
+        Returns the pattern matches whose keys are not equal to the given value.
+        """
+        return PatternMatchStorageView(self.__segments(self.__begin(), self.__first_position(value)) +
+                                       self.__segments(self.__last_position(value), self.__end()))
+
+    def __get_greater(self, value: int or float):
+        """
+        Returns the pattern matches whose keys are greater than the given value.
+        """
+        return self.__view(self.__last_position(value), self.__end())
+
+    def __get_greater_or_equal(self, value: int or float):
+        """
+        Returns the pattern matches whose keys are greater than or equal to the given value.
+        """
+        return self.__view(self.__first_position(value), self.__end())
+
+    def __get_smaller(self, value: int or float):
+        """
+        Returns the pattern matches whose keys are smaller than the given value.
+        """
+        return self.__view(self.__begin(), self.__first_position(value))
+
+    def __get_smaller_or_equal(self, value: int or float):
+        """
+        Returns the pattern matches whose keys are smaller than or equal to the given value.
+        """
+        return self.__view(self.__begin(), self.__last_position(value))
+
     def __get_all(self, value: int or float):
         """
         Returns all pattern matches regardless of the specified value.
@@ -261,14 +680,80 @@ class UnsortedPatternMatchStorage(PatternMatchStorage):
         """
         Appends the given pattern match to the match buffer.
         """
-        self._access_count += 1
+        self._register_partial_match(pm)
         self._partial_matches.append(pm)
 
     def get(self, value: int or float):
         """
         Unconditionally returns all the stored matches regardless of the given value.
         """
-        return self._partial_matches
+        return self._filter_expired_partial_matches(self._partial_matches)
+
+
+class HashedPatternMatchStorage(PatternMatchStorage):
+    """
+    This class stores the pattern matches in buckets according to the value of a predefined function (key). It is used
+    for equality conditions, allowing to insert a pattern match and to fetch the pattern matches whose keys are equal to
+    a given value in constant time.
+    Within each bucket, the pattern matches are kept in their arrival order. The buckets are double-ended queues, so that
+    the expired pattern matches of a storage sorted by arrival order, which are found at their heads, are removed in
+    constant time.
+    """
+    def __init__(self, get_match_key: callable, clean_up_interval: int, in_leaf=False):
+        super().__init__(get_match_key, in_leaf, clean_up_interval)
+        self.__buckets = {}
+
+    def __contains__(self, item):
+        """
+        Returns True if the given item is stored and False otherwise.
+        Only searches the bucket corresponding to the key of the item.
+        """
+        return item in self._filter_expired_partial_matches(self.__buckets.get(self._get_key(item), []))
+
+    def add(self, pm: PatternMatch):
+        """
+        Appends the new pattern match to the bucket corresponding to its key.
+        """
+        self._register_partial_match(pm)
+        self._partial_matches.append(pm)
+        key = self._get_key(pm)
+        bucket = self.__buckets.get(key)
+        if bucket is None:
+            self.__buckets[key] = deque((pm,))
+        else:
+            bucket.append(pm)
+
+    def get(self, value: int or float):
+        """
+        Returns the pattern matches whose keys are equal to the given value.
+        """
+        return self._filter_expired_partial_matches(self.__buckets.get(value, []))
+
+    def _remove_expired_prefix(self, expired_count: int):
+        """
+        In addition to the cleanup of the arrival-ordered buffer, pops the expired pattern matches from the heads of
+        their buckets and drops the buckets that became empty.
+        """
+        for pm in islice(self._partial_matches, expired_count):
+            key = self._get_key(pm)
+            bucket = self.__buckets[key]
+            bucket.popleft()
+            if len(bucket) == 0:
+                del self.__buckets[key]
+        super()._remove_expired_prefix(expired_count)
+
+    def _purge_expired_partial_matches(self):
+        """
+        In addition to the purge of the arrival-ordered buffer, purges the expired pattern matches from the buckets and
+        drops the buckets that became empty.
+        """
+        buckets = {}
+        for key, bucket in self.__buckets.items():
+            remaining_partial_matches = self._filter_expired_partial_matches(bucket)
+            if len(remaining_partial_matches) > 0:
+                buckets[key] = deque(remaining_partial_matches)
+        self.__buckets = buckets
+        super()._purge_expired_partial_matches()
 
 
 class TreeStorageParameters:
@@ -277,7 +762,8 @@ class TreeStorageParameters:
     """
     def __init__(self, sort_storage: bool = DefaultConfig.SHOULD_SORT_STORAGE, attributes_priorities: dict = None,
                  clean_up_interval: int = DefaultConfig.CLEANUP_INTERVAL,
-                 prioritize_sorting_by_timestamp: bool = DefaultConfig.PRIORITIZE_SORTING_BY_TIMESTAMP):
+                 prioritize_sorting_by_timestamp: bool = DefaultConfig.PRIORITIZE_SORTING_BY_TIMESTAMP,
+                 use_blocked_storage: bool = DefaultConfig.USE_BLOCKED_SORTED_STORAGE):
         if sort_storage is None:
             sort_storage = DefaultConfig.SHOULD_SORT_STORAGE
         if attributes_priorities is None:
@@ -286,6 +772,8 @@ class TreeStorageParameters:
             raise Exception('cleanup interval should be positive.')
         if prioritize_sorting_by_timestamp is None:
             prioritize_sorting_by_timestamp = DefaultConfig.PRIORITIZE_SORTING_BY_TIMESTAMP
+        if use_blocked_storage is None:
+            use_blocked_storage = DefaultConfig.USE_BLOCKED_SORTED_STORAGE
 
         # True if the user is willing to use non-default sorted storage and False otherwise
         self.sort_storage = sort_storage
@@ -296,3 +784,7 @@ class TreeStorageParameters:
         # The number of partial match additions after which a cleanup operation will be applied
         self.clean_up_interval = clean_up_interval
         self.prioritize_sorting_by_timestamp = prioritize_sorting_by_timestamp
+
+        # True if the sorted storage units should be implemented as blocked sorted lists, which is preferable for nodes
+        # holding large numbers of partial matches
+        self.use_blocked_storage = use_blocked_storage
@@ -0,0 +1,62 @@
+from datetime import datetime
+from typing import List
+
+from tree.Tree import Tree
+from tree.nodes.AndNode import AndNode
+from tree.nodes.BinaryNode import BinaryNode
+from tree.nodes.LeafNode import LeafNode
+from tree.nodes.Node import Node
+from tree.nodes.SeqNode import SeqNode
+from tree.evaluation.TrivialTreeBasedEvaluationMechnism import TrivialTreeBasedEvaluationMechanism
+
+
+class PartialMatchMigrationTreeBasedEvaluationMechanism(TrivialTreeBasedEvaluationMechanism):
+    """
+    Whenever a new tree is given, replaces the old tree with the new one while preserving the state of the evaluation.
+    A node of the new tree collecting the same set of events as a node of the old tree of the same type receives the
+    partial matches stored at the latter. The partial matches of the remaining nodes are reconstructed from the
+    partial matches of their children. Unlike the trivial mechanism, the events of the current window are not replayed.
+    The migration is only supported for trees consisting of leaves, AND nodes and SEQ nodes, and for patterns with no
+    consumption policy. Otherwise, the events are replayed on the new tree as in the trivial mechanism.
+    """
+    __SUPPORTED_NODE_TYPES = (LeafNode, AndNode, SeqNode)
+
+    def _tree_update(self, new_tree: Tree, tree_update_time: datetime):
+        """
+        Replaces the old tree with the new tree, migrating the partial matches of the former to the latter.
+        """
+        old_nodes = self.__get_nodes(self._tree.get_root())
+        new_nodes = self.__get_nodes(new_tree.get_root())
+        if self._pattern.consumption_policy is not None or \
+                any(type(node) not in self.__SUPPORTED_NODE_TYPES for node in old_nodes + new_nodes):
+            super()._tree_update(new_tree, tree_update_time)
+            return
+
+        event_names_to_old_nodes = {self.__get_event_names(node): node for node in old_nodes}
+        # the nodes are traversed bottom-up, such that the children of a node are ready before it is reconstructed
+        for node in new_nodes:
+            old_node = event_names_to_old_nodes.get(self.__get_event_names(node))
+            if old_node is not None and type(old_node) == type(node):
+                node.import_partial_matches(old_node)
+            else:
+                node.rebuild_partial_matches()
+
+        self._tree = new_tree
+        self._event_types_listeners = self._register_event_listeners(new_tree)
+
+    @staticmethod
+    def __get_nodes(root: Node) -> List[Node]:
+        """
+        Returns the nodes of the subtree rooted at the given node, such that each node appears after its descendants.
+        """
+        if isinstance(root, BinaryNode):
+            return PartialMatchMigrationTreeBasedEvaluationMechanism.__get_nodes(root.get_left_subtree()) + \
+                   PartialMatchMigrationTreeBasedEvaluationMechanism.__get_nodes(root.get_right_subtree()) + [root]
+        return [root]
+
+    @staticmethod
+    def __get_event_names(node: Node):
+        """
+        Returns the names of the events collected by the given node.
+        """
+        return frozenset(event_def.name for event_def in node.get_event_definitions())
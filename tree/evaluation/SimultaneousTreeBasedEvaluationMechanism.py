@@ -21,11 +21,13 @@ class SimultaneousTreeBasedEvaluationMechanism(TreeBasedEvaluationMechanism):
                  storage_params: TreeStorageParameters,
                  statistics_collector: StatisticsCollector = None,
                  optimizer: Optimizer = None,
-                 statistics_update_time_window: timedelta = None):
+                 statistics_update_time_window: timedelta = None,
+                 asynchronous_reoptimization: bool = False):
         super().__init__(pattern_to_tree_plan_map, storage_params,
                          statistics_collector,
                          optimizer,
-                         statistics_update_time_window)
+                         statistics_update_time_window,
+                         asynchronous_reoptimization)
         self.__new_tree = None
         self.__new_event_types_listeners = None
         self.__is_simultaneous_state = False
@@ -1,7 +1,8 @@
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
 from base.DataFormatter import DataFormatter
-from base.Event import Event
+from base.Event import Event, timedelta_to_nanoseconds
 from plan.TreePlan import TreePlan
 from stream.Stream import InputStream, OutputStream
 from misc.Utils import *
@@ -24,7 +25,8 @@ class TreeBasedEvaluationMechanism(EvaluationMechanism, ABC):
                  storage_params: TreeStorageParameters,
                  statistics_collector: StatisticsCollector = None,
                  optimizer: Optimizer = None,
-                 statistics_update_time_window: timedelta = None):
+                 statistics_update_time_window: timedelta = None,
+                 asynchronous_reoptimization: bool = False):
         self.__is_multi_pattern_mode = len(pattern_to_tree_plan_map) > 1
         if self.__is_multi_pattern_mode:
             # TODO: support statistic collection in the multi-pattern mode
@@ -42,6 +44,13 @@ class TreeBasedEvaluationMechanism(EvaluationMechanism, ABC):
         self._event_types_listeners = {}
         self.__statistics_update_time_window = statistics_update_time_window
 
+        # If asynchronous reoptimization is enabled, new trees are built by a background worker thread and replace the
+        # current tree once ready. A thread is used since patterns typically contain functions that cannot be passed
+        # to another process.
+        self.__reoptimization_executor = ThreadPoolExecutor(max_workers=1) \
+            if asynchronous_reoptimization and statistics_collector is not None else None
+        self.__pending_new_tree = None
+
         # The remainder of the initialization process is only relevant for the freeze map feature. This feature can
         # only be enabled in single-pattern mode.
         self._pattern = list(pattern_to_tree_plan_map)[0] if not self.__is_multi_pattern_mode else None
@@ -56,12 +65,14 @@ class TreeBasedEvaluationMechanism(EvaluationMechanism, ABC):
         """
         Activates the tree evaluation mechanism on the input event stream and reports all found pattern matches to the
         given output stream.
+        The input stream may contain either raw data items or events that were already parsed, e.g., by a data parallel
+        algorithm in order to route them to execution units.
         """
         self._event_types_listeners = self._register_event_listeners(self._tree)
         last_statistics_refresh_time = None
 
         for raw_event in events:
-            event = Event(raw_event, data_formatter)
+            event = raw_event if isinstance(raw_event, Event) else Event(raw_event, data_formatter)
             if event.type not in self._event_types_listeners.keys():
                 continue
             self.__remove_expired_freezers(event)
@@ -73,6 +84,10 @@ class TreeBasedEvaluationMechanism(EvaluationMechanism, ABC):
             self._play_new_event_on_tree(event, matches)
             self._get_matches(matches)
 
+        if self.__reoptimization_executor is not None:
+            # a new tree that is still being built is no longer needed
+            self.__reoptimization_executor.shutdown(wait=False)
+
         # Now that we finished the input stream, if there were some pending matches somewhere in the tree, we will
         # collect them now
         self._get_last_pending_matches(matches)
@@ -84,17 +99,44 @@ class TreeBasedEvaluationMechanism(EvaluationMechanism, ABC):
         input event stream.
         """
         self.__statistics_collector.handle_event(last_event)
+        if self.__reoptimization_executor is not None:
+            self.__try_apply_pending_new_tree(last_event)
         if not self._should_try_reoptimize(last_statistics_refresh_time, last_event):
             # it is not yet time to recalculate the statistics
             return last_statistics_refresh_time
         new_statistics = self.__statistics_collector.get_statistics()
-        if self.__optimizer.should_optimize(new_statistics, self._pattern):
-            new_tree_plan = self.__optimizer.build_new_plan(new_statistics, self._pattern)
-            new_tree = Tree(new_tree_plan, self._pattern, self.__storage_params)
-            self._tree_update(new_tree, last_event.timestamp)
+        if self.__reoptimization_executor is None:
+            new_tree = self.__build_new_tree(new_statistics)
+            if new_tree is not None:
+                self._tree_update(new_tree, last_event.timestamp)
+        elif self.__pending_new_tree is None:
+            # the statistics snapshot is handed to the background worker and the events keep being processed
+            self.__pending_new_tree = self.__reoptimization_executor.submit(self.__build_new_tree, new_statistics)
         # this is the new last statistic refresh time
         return last_event.timestamp
 
+    def __build_new_tree(self, new_statistics: dict):
+        """
+        Builds a new tree according to the given statistics if the optimizer decides that a reoptimization is needed.
+        Otherwise, returns None.
+        """
+        if not self.__optimizer.should_optimize(new_statistics, self._pattern):
+            return None
+        new_tree_plan = self.__optimizer.build_new_plan(new_statistics, self._pattern)
+        return Tree(new_tree_plan, self._pattern, self.__storage_params)
+
+    def __try_apply_pending_new_tree(self, last_event: Event):
+        """
+        If the background worker has finished building a new tree, replaces the current tree with it before the given
+        event is processed.
+        """
+        if self.__pending_new_tree is None or not self.__pending_new_tree.done():
+            return
+        new_tree = self.__pending_new_tree.result()
+        self.__pending_new_tree = None
+        if new_tree is not None:
+            self._tree_update(new_tree, last_event.timestamp)
+
     def _should_try_reoptimize(self, last_statistics_refresh_time: timedelta, last_event: Event):
         """
         Returns True if statistic recalculation and a reoptimization attempt can now be performed and False otherwise.
@@ -200,8 +242,9 @@ class TreeBasedEvaluationMechanism(EvaluationMechanism, ABC):
         if len(self.__freeze_map) == 0:
             # freeze option disabled
             return False
+        window = timedelta_to_nanoseconds(self._pattern.window)
         self.__active_freezers = [freezer for freezer in self.__active_freezers
-                                  if event.timestamp - freezer.timestamp <= self._pattern.window]
+                                  if event.timestamp_ns - freezer.timestamp_ns <= window]
 
     def get_structure_summary(self):
         return self._tree.get_structure_summary()
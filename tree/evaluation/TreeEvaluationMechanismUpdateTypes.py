@@ -11,3 +11,7 @@ class TreeEvaluationMechanismUpdateTypes(Enum):
 
     # maintains both the old and the new tree simultaneously until the current window expires
     SIMULTANEOUS_TREE_EVALUATION = 1,
+
+    # moves the partial matches of the old tree to the nodes of the new tree collecting the same events and only
+    # computes the partial matches of the remaining nodes of the new tree
+    PARTIAL_MATCH_MIGRATION_TREE_EVALUATION = 2,
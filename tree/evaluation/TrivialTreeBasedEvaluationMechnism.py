@@ -42,7 +42,7 @@ class TrivialTreeBasedEvaluationMechanism(TreeBasedEvaluationMechanism):
                 old_pattern_matches_events.append([pm.events[0] for pm in partial_matches])
 
         # using heap for fast sort of sorted lists
-        old_events = list(heapq.merge(*old_pattern_matches_events, key=lambda event: event.timestamp))
+        old_events = list(heapq.merge(*old_pattern_matches_events, key=lambda event: event.timestamp_ns))
         return old_events
 
     def __play_old_events_on_tree(self, events):
@@ -1,13 +1,15 @@
 from abc import ABC
 from datetime import timedelta
+from operator import itemgetter
 from typing import List, Set
 
 from base.Event import Event
-from misc.Utils import calculate_joint_probability
+from misc.Utils import calculate_joint_probability, get_merge_permutation, merge_according_to
 from condition.Condition import Condition, Variable, EquationSides
 from condition.BaseRelationCondition import BaseRelationCondition
 from base.PatternMatch import PatternMatch
 from tree.nodes.InternalNode import InternalNode
+from tree.nodes.KleeneClosureNode import KleeneClosureNode
 from tree.nodes.Node import Node, PrimitiveEventDefinition, PatternParameters
 
 
@@ -21,6 +23,15 @@ class BinaryNode(InternalNode, ABC):
         super().__init__(pattern_params, parents, pattern_ids, event_defs)
         self._left_subtree = left
         self._right_subtree = right
+        # the information required for validating joins of partial matches, calculated upon the first join
+        self.__is_join_validation_initialized = False
+        self.__left_first_event_index = None
+        self.__is_disjointness_guaranteed = False
+        self.__is_duplicate_free = False
+        # the event definitions of the subtrees and the permutations merging their events, see _merge_events_by_index
+        self.__merge_permutations = None
+        # whether this node accepts any pair of partial matches fitting the time window, see _compile_condition
+        self.__is_condition_trivial = False
 
     def create_parent_to_info_dict(self):
         if self._left_subtree is not None:
@@ -70,6 +81,8 @@ class BinaryNode(InternalNode, ABC):
         """
         self._left_subtree = left
         self._right_subtree = right
+        self.__is_join_validation_initialized = False
+        self.__merge_permutations = None
         # only the positive children definitions should be applied on this node
         self._set_event_definitions(self._left_subtree.get_positive_event_definitions(),
                                     self._right_subtree.get_positive_event_definitions())
@@ -97,7 +110,7 @@ class BinaryNode(InternalNode, ABC):
             raise Exception("old_node must contain one of this node's children")
         new_node.add_parent(self)
 
-    def handle_new_partial_match(self, partial_match_source: Node):
+    def handle_new_partial_match(self, partial_match_source: Node, new_partial_match: PatternMatch):
         """
         Internal node's update for a new partial match in one of the subtrees.
         """
@@ -108,19 +121,45 @@ class BinaryNode(InternalNode, ABC):
         else:
             raise Exception()  # should never happen
 
-        new_partial_match = partial_match_source.get_last_unhandled_partial_match_by_parent(self)
         new_pm_key = partial_match_source.get_storage_unit().get_key_function()
         first_event_defs = partial_match_source.get_event_definitions_by_parent(self)
-        other_subtree.clean_expired_partial_matches(new_partial_match.last_timestamp)
+        other_subtree.clean_expired_partial_matches(new_partial_match.last_timestamp_ns)
         partial_matches_to_compare = other_subtree.get_partial_matches(new_pm_key(new_partial_match))
         second_event_defs = other_subtree.get_event_definitions_by_parent(self)
 
-        self.clean_expired_partial_matches(new_partial_match.last_timestamp)
+        self.clean_expired_partial_matches(new_partial_match.last_timestamp_ns)
 
         # given a partial match from one subtree, for each partial match
         # in the other subtree we check for new partial matches in this node.
         self._try_create_new_matches(new_partial_match, partial_matches_to_compare, first_event_defs, second_event_defs)
 
+    def rebuild_partial_matches(self):
+        """
+        Replays the partial matches currently stored at the subtrees in their order of arrival, joining each of them
+        with the previously arrived partial matches of the other subtree. Partial matches of the left subtree arriving
+        together with partial matches of the right subtree are considered to precede them, so that each pair is only
+        joined once. The new partial matches are stored without being propagated to the parents.
+        """
+        arrival_key = Node._get_partial_match_arrival_key
+        partial_matches = [(arrival_key(pm), 0, pm) for pm in self._left_subtree.get_storage_unit()] + \
+                          [(arrival_key(pm), 1, pm) for pm in self._right_subtree.get_storage_unit()]
+        partial_matches.sort(key=lambda item: (item[0], item[1]))
+        for key, side, new_partial_match in partial_matches:
+            source, other_subtree = (self._left_subtree, self._right_subtree) if side == 0 \
+                else (self._right_subtree, self._left_subtree)
+            new_pm_key = source.get_storage_unit().get_key_function()
+            first_event_defs = source.get_event_definitions_by_parent(self)
+            second_event_defs = other_subtree.get_event_definitions_by_parent(self)
+            for partial_match in other_subtree.get_partial_matches(new_pm_key(new_partial_match)):
+                other_key = arrival_key(partial_match)
+                if other_key > key or (other_key == key and side == 0):
+                    # the partial match from the other subtree has not arrived yet
+                    continue
+                events_for_new_match = self._merge_events_for_new_match(first_event_defs, second_event_defs,
+                                                                        new_partial_match.events, partial_match.events)
+                probability = calculate_joint_probability(new_partial_match.probability, partial_match.probability)
+                self._store_partial_match(events_for_new_match, probability)
+
     def _try_create_new_matches(self, new_partial_match: PatternMatch, partial_matches_to_compare: List[PatternMatch],
                                 first_event_defs: List[PrimitiveEventDefinition],
                                 second_event_defs: List[PrimitiveEventDefinition]):
@@ -128,11 +167,65 @@ class BinaryNode(InternalNode, ABC):
         For each candidate pair of partial matches that can be joined to create a new one, verifies all the
         necessary conditions creates new partial matches if all constraints are satisfied.
         """
+        if not self.__is_join_validation_initialized:
+            self._init_join_validation()
+        is_new_partial_match_left = first_event_defs[0].index == self.__left_first_event_index
+        # the positions of the events of the joined partial matches in the new ones
+        event_positions = tuple(self._merge_events_for_new_match(first_event_defs, second_event_defs,
+                                                                 [(0, i) for i in range(len(first_event_defs))],
+                                                                 [(1, i) for i in range(len(second_event_defs))]))
         for partial_match in partial_matches_to_compare:
-            events_for_new_match = self._merge_events_for_new_match(first_event_defs, second_event_defs,
-                                                                    new_partial_match.events, partial_match.events)
+            if is_new_partial_match_left:
+                left_partial_match, right_partial_match = new_partial_match, partial_match
+            else:
+                left_partial_match, right_partial_match = partial_match, new_partial_match
+            if not self._validate_partial_matches_join(left_partial_match, right_partial_match):
+                continue
+            if not self.__is_condition_trivial:
+                # the merged events are only used for evaluating the condition and are not kept in the new partial match
+                events_for_new_match = self._merge_events_for_new_match(first_event_defs, second_event_defs,
+                                                                        new_partial_match.events, partial_match.events)
+                if not self._validate_condition(events_for_new_match):
+                    continue
             probability = calculate_joint_probability(new_partial_match.probability, partial_match.probability)
-            self._validate_and_propagate_partial_match(events_for_new_match, probability)
+            self._propagate_new_partial_match(PatternMatch.join(new_partial_match, partial_match, event_positions,
+                                                                probability))
+
+    def _compile_condition(self):
+        super()._compile_condition()
+        self.__is_condition_trivial = self._compiled_condition is not None and self._condition.get_num_conditions() == 0
+
+    def _init_join_validation(self):
+        """
+        Precalculates the information about the subtrees of this node used by _validate_partial_matches_join.
+        The events of two joined partial matches can only coincide if both subtrees accept events of a common type.
+        Partial matches of a Kleene closure node may contain repeated events, and hence are always scanned.
+        """
+        left_event_defs = self._left_subtree.get_positive_event_definitions()
+        right_event_defs = self._right_subtree.get_positive_event_definitions()
+        self.__left_first_event_index = left_event_defs[0].index
+        left_event_types = {event_def.type for event_def in left_event_defs}
+        self.__is_disjointness_guaranteed = all(event_def.type not in left_event_types
+                                                for event_def in right_event_defs)
+        self.__is_duplicate_free = not isinstance(self._left_subtree, KleeneClosureNode) and \
+            not isinstance(self._right_subtree, KleeneClosureNode)
+        self.__is_join_validation_initialized = True
+
+    def _validate_partial_matches_join(self, left_partial_match: PatternMatch, right_partial_match: PatternMatch):
+        """
+        Validates that the events of the given partial matches of the left and the right subtrees fit into the time
+        window and do not repeat. The time window is verified using the boundary timestamps of the partial matches.
+        """
+        max_timestamp = max(left_partial_match.last_timestamp_ns, right_partial_match.last_timestamp_ns)
+        min_timestamp = min(left_partial_match.first_timestamp_ns, right_partial_match.first_timestamp_ns)
+        if max_timestamp - min_timestamp > self._sliding_window:
+            return False
+        if self.__is_disjointness_guaranteed and self.__is_duplicate_free:
+            return True
+        if self.__is_duplicate_free:
+            return set(left_partial_match.events).isdisjoint(right_partial_match.events)
+        events = left_partial_match.events + right_partial_match.events
+        return len(events) == len(set(events))
 
     def _merge_events_for_new_match(self,
                                     first_event_defs: List[PrimitiveEventDefinition],
@@ -148,6 +241,42 @@ class BinaryNode(InternalNode, ABC):
             return second_event_list + first_event_list
         raise Exception()
 
+    def _init_merge_permutations(self):
+        """
+        Precalculates the permutations merging the events of the partial matches of the subtrees according to the
+        indices of their event definitions, for each of the two possible orders of the subtrees.
+        """
+        left_event_defs = self._left_subtree.get_event_definitions_by_parent(self)
+        right_event_defs = self._right_subtree.get_event_definitions_by_parent(self)
+        left_first_permutation = get_merge_permutation(left_event_defs, right_event_defs, key=lambda x: x.index)
+        right_first_permutation = get_merge_permutation(right_event_defs, left_event_defs, key=lambda x: x.index)
+        self.__merge_permutations = (left_event_defs, right_event_defs,
+                                     itemgetter(*left_first_permutation), itemgetter(*right_first_permutation))
+
+    def _merge_events_by_index(self,
+                               first_event_defs: List[PrimitiveEventDefinition],
+                               second_event_defs: List[PrimitiveEventDefinition],
+                               first_event_list: List[Event],
+                               second_event_list: List[Event]):
+        """
+        Merges the given event lists according to the indices of the respective event definitions. If the event
+        definitions are the ones of the subtrees of this node, a precalculated permutation is applied instead of
+        performing the merge.
+        """
+        if self.__merge_permutations is None:
+            self._init_merge_permutations()
+        left_event_defs, right_event_defs, left_first_permutation, right_first_permutation = self.__merge_permutations
+        if first_event_defs is left_event_defs and second_event_defs is right_event_defs:
+            permutation = left_first_permutation
+        elif first_event_defs is right_event_defs and second_event_defs is left_event_defs:
+            permutation = right_first_permutation
+        else:
+            return merge_according_to(first_event_defs, second_event_defs,
+                                      first_event_list, second_event_list, key=lambda x: x.index)
+        if len(first_event_list) != len(first_event_defs) or len(second_event_list) != len(second_event_defs):
+            raise Exception()
+        return list(permutation(first_event_list + second_event_list))
+
     def is_equivalent(self, other):
         """
         In addition to the checks performed by the base class, checks if:
@@ -244,13 +373,17 @@ class BinaryNode(InternalNode, ABC):
                                                left_event_names, right_event_names)
 
         # convert terms into sorting key fetching callbacks
+        # the keys are repeatedly calculated for stored partial matches, hence their events are fetched one by one
+        # rather than merged
+        left_positive_event_defs = self._left_subtree.get_positive_event_definitions()
+        right_positive_event_defs = self._right_subtree.get_positive_event_definitions()
         if left_term is not None:
             left_sorting_key = lambda pm: left_term.eval(
-                {left_event_defs[i].name: pm.events[i].payload for i in range(len(pm.events))}
+                {event_def.name: pm.get_event(i).payload for i, event_def in enumerate(left_positive_event_defs)}
             )
         if right_term is not None:
             right_sorting_key = lambda pm: right_term.eval(
-                {right_event_defs[i].name: pm.events[i].payload for i in range(len(pm.events))}
+                {event_def.name: pm.get_event(i).payload for i, event_def in enumerate(right_positive_event_defs)}
             )
 
         return left_sorting_key, left_rel_op, left_equation_size, right_sorting_key, right_rel_op, right_equation_size
@@ -2,9 +2,11 @@ from abc import ABC
 from typing import List, Set
 
 from base.Event import Event
+from base.PatternMatch import PatternMatch
 from condition.Condition import RelopTypes, EquationSides
 from tree.nodes.Node import Node, PrimitiveEventDefinition, PatternParameters
-from tree.PatternMatchStorage import TreeStorageParameters, UnsortedPatternMatchStorage, SortedPatternMatchStorage
+from tree.PatternMatchStorage import TreeStorageParameters, UnsortedPatternMatchStorage, SortedPatternMatchStorage, \
+    HashedPatternMatchStorage, BlockedSortedPatternMatchStorage
 
 
 class InternalNode(Node, ABC):
@@ -28,6 +30,14 @@ class InternalNode(Node, ABC):
         if len(events_for_new_match) != len(set(events_for_new_match)):
             # the list contains duplicate events which is not allowed
             return False
+        return self._validate_condition(events_for_new_match)
+
+    def _validate_condition(self, events_for_new_match: List[Event]):
+        """
+        Evaluates the condition stored in this node on the given set of events.
+        """
+        if self._compiled_condition is not None:
+            return self._compiled_condition(events_for_new_match)
         binding = {
             self._event_defs[i].name: events_for_new_match[i].payload for i in range(len(self._event_defs))
         }
@@ -50,15 +60,21 @@ class InternalNode(Node, ABC):
         """
         An auxiliary method for setting up the storage of an internal node.
         In the internal nodes, we only sort the storage if a storage key is explicitly provided by the user.
+        If the storage key is derived from an equality condition, a hashed storage is used instead of a sorted one.
+        A sorted storage is implemented as a blocked sorted list if requested by the storage parameters.
         """
         if not storage_params.sort_storage or sorting_key is None:
             self._partial_matches = UnsortedPatternMatchStorage(storage_params.clean_up_interval)
+        elif rel_op == RelopTypes.Equal:
+            self._partial_matches = HashedPatternMatchStorage(sorting_key, storage_params.clean_up_interval)
         else:
-            self._partial_matches = SortedPatternMatchStorage(sorting_key, rel_op, equation_side,
-                                                              storage_params.clean_up_interval, sort_by_first_timestamp)
+            storage_type = BlockedSortedPatternMatchStorage if storage_params.use_blocked_storage \
+                else SortedPatternMatchStorage
+            self._partial_matches = storage_type(sorting_key, rel_op, equation_side,
+                                                 storage_params.clean_up_interval, sort_by_first_timestamp)
 
-    def handle_new_partial_match(self, partial_match_source: Node):
+    def handle_new_partial_match(self, partial_match_source: Node, new_partial_match: PatternMatch):
         """
-        A handler for a notification regarding a new partial match generated at one of this node's children.
+        A handler for a new partial match generated at one of this node's children.
         """
         raise NotImplementedError()
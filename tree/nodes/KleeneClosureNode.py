@@ -21,7 +21,7 @@ class KleeneClosureNode(UnaryNode):
         self.__min_size = min_size
         self.__max_size = max_size
 
-    def handle_new_partial_match(self, partial_match_source: Node):
+    def handle_new_partial_match(self, partial_match_source: Node, new_partial_match: PatternMatch):
         """
         Reacts upon a notification of a new partial match available at the child by generating, validating, and
         propagating all sets of partial matches containing this new partial match.
@@ -31,8 +31,7 @@ class KleeneClosureNode(UnaryNode):
         if self._child is None:
             raise Exception()  # should never happen
 
-        new_partial_match = self._child.get_last_unhandled_partial_match_by_parent(self)
-        self._child.clean_expired_partial_matches(new_partial_match.last_timestamp)
+        self._child.clean_expired_partial_matches(new_partial_match.last_timestamp_ns)
 
         # create partial match sets containing the new partial match that triggered this method
         child_matches_powerset = self.__create_child_matches_powerset()
@@ -107,8 +106,10 @@ class KleeneClosureNode(UnaryNode):
         max_timestamp = None
         events = []
         for match in partial_match_set:
-            min_timestamp = match.first_timestamp if min_timestamp is None else min(min_timestamp, match.first_timestamp)
-            max_timestamp = match.last_timestamp if max_timestamp is None else max(max_timestamp, match.last_timestamp)
+            min_timestamp = match.first_timestamp_ns if min_timestamp is None \
+                else min(min_timestamp, match.first_timestamp_ns)
+            max_timestamp = match.last_timestamp_ns if max_timestamp is None \
+                else max(max_timestamp, match.last_timestamp_ns)
             events.extend(match.events)
 
         return events
@@ -6,7 +6,8 @@ from condition.Condition import Condition, RelopTypes, EquationSides
 from base.PatternStructure import PrimitiveEventStructure
 from tree.nodes.Node import Node
 from tree.nodes.Node import PrimitiveEventDefinition, PatternParameters
-from tree.PatternMatchStorage import TreeStorageParameters, SortedPatternMatchStorage
+from tree.PatternMatchStorage import TreeStorageParameters, SortedPatternMatchStorage, HashedPatternMatchStorage, \
+    BlockedSortedPatternMatchStorage
 
 
 class LeafNode(Node):
@@ -67,15 +68,20 @@ class LeafNode(Node):
         """
         Inserts the given event to this leaf.
         """
-        self.clean_expired_partial_matches(event.timestamp)
+        self.clean_expired_partial_matches(event.timestamp_ns)
         self._validate_and_propagate_partial_match([event], event.probability)
 
+    def is_sequence_ordered(self):
+        return True
+
     def _validate_new_match(self, events_for_new_match: List[Event]):
         """
         Validates the condition stored in this node on the given set of events.
         """
         if not super()._validate_new_match(events_for_new_match):
             return False
+        if self._compiled_condition is not None:
+            return self._compiled_condition(events_for_new_match)
         binding = {self.__event_name: events_for_new_match[0].payload}
         return self._condition.eval(binding)
 
@@ -89,13 +95,18 @@ class LeafNode(Node):
         For leaf nodes, we always want to create a sorted storage, since the events arrive in their natural order
         of occurrence anyway. Hence, a sorted storage is initialized either according to a user-specified key, or an
         arrival order if no storage parameters were explicitly specified.
+        A user-specified key derived from an equality condition results in a hashed storage instead.
         """
         should_use_default_storage_mode = not storage_params.sort_storage or sorting_key is None
-        actual_sorting_key = (lambda pm: pm.events[0].timestamp) if should_use_default_storage_mode else sorting_key
+        if not should_use_default_storage_mode and rel_op == RelopTypes.Equal:
+            self._partial_matches = HashedPatternMatchStorage(sorting_key, storage_params.clean_up_interval, True)
+            return
+        actual_sorting_key = (lambda pm: pm.events[0].timestamp_ns) if should_use_default_storage_mode else sorting_key
         actual_sort_by_first_timestamp = should_use_default_storage_mode or sort_by_first_timestamp
-        self._partial_matches = SortedPatternMatchStorage(actual_sorting_key, rel_op, equation_side,
-                                                          storage_params.clean_up_interval,
-                                                          actual_sort_by_first_timestamp, True)
+        storage_type = BlockedSortedPatternMatchStorage if storage_params.use_blocked_storage \
+            else SortedPatternMatchStorage
+        self._partial_matches = storage_type(actual_sorting_key, rel_op, equation_side,
+                                             storage_params.clean_up_interval, actual_sort_by_first_timestamp, True)
 
     def get_structure_summary(self):
         return self.__event_name
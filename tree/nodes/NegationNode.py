@@ -1,12 +1,11 @@
 from abc import ABC
-from datetime import datetime
 from typing import List, Set, Type
 from base.Event import Event
 from condition.Condition import RelopTypes, EquationSides
 from base.PatternMatch import PatternMatch
 from base.PatternStructure import AndOperator, SeqOperator
 from misc.Utils import find_partial_match_by_timestamp, merge, \
-    is_sorted, merge_according_to, calculate_joint_probability
+    is_sorted, calculate_joint_probability
 from tree.nodes.BinaryNode import BinaryNode
 from tree.nodes.Node import Node, PrimitiveEventDefinition, PatternParameters
 from tree.PatternMatchStorage import TreeStorageParameters
@@ -57,7 +56,7 @@ class NegationNode(BinaryNode, ABC):
         super()._set_event_definitions(positive_event_defs, negative_event_defs)
         self._positive_event_defs = positive_event_defs
 
-    def clean_expired_partial_matches(self, last_timestamp: datetime):
+    def clean_expired_partial_matches(self, last_timestamp: int):
         """
         In addition to the normal functionality of this method, attempt to flush pending matches that can already
         be propagated.
@@ -66,13 +65,13 @@ class NegationNode(BinaryNode, ABC):
         if self.__is_first_unbounded_negative_node():
             self.flush_pending_matches(last_timestamp)
 
-    def flush_pending_matches(self, last_timestamp: datetime = None):
+    def flush_pending_matches(self, last_timestamp: int = None):
         """
         Releases the partial matches in the pending matches buffer. If the timestamp is provided, only releases
         expired matches.
         """
         if last_timestamp is not None:
-            self.__pending_partial_matches = sorted(self.__pending_partial_matches, key=lambda x: x.first_timestamp)
+            self.__pending_partial_matches = sorted(self.__pending_partial_matches, key=lambda x: x.first_timestamp_ns)
             count = find_partial_match_by_timestamp(self.__pending_partial_matches,
                                                     last_timestamp - self._sliding_window)
             matches_to_flush = self.__pending_partial_matches[:count]
@@ -131,7 +130,7 @@ class NegationNode(BinaryNode, ABC):
         else:
             super()._add_partial_match(pm)
 
-    def handle_new_partial_match(self, partial_match_source: Node):
+    def handle_new_partial_match(self, partial_match_source: Node, new_partial_match: PatternMatch):
         """
         For positive partial matches, activates the flow of the superclass. For negative partial matches, does nothing
         for bounded events (as nothing should be done in this case), otherwise checks whether existing positive matches
@@ -139,7 +138,7 @@ class NegationNode(BinaryNode, ABC):
         """
         if partial_match_source == self._positive_subtree:
             # a new positive partial match has arrived
-            super().handle_new_partial_match(partial_match_source)
+            super().handle_new_partial_match(partial_match_source, new_partial_match)
             return
         # a new negative partial match has arrived
         if not self.__is_unbounded:
@@ -150,7 +149,6 @@ class NegationNode(BinaryNode, ABC):
         first_unbounded_node = self.get_first_unbounded_negative_node()
         positive_event_defs = first_unbounded_node.get_positive_event_definitions()
 
-        unbounded_negative_partial_match = partial_match_source.get_last_unhandled_partial_match_by_parent(self)
         negative_event_defs = partial_match_source.get_event_definitions_by_parent(self)
 
         matches_to_keep = []
@@ -158,7 +156,7 @@ class NegationNode(BinaryNode, ABC):
             combined_event_list = self._merge_events_for_new_match(positive_event_defs,
                                                                    negative_event_defs,
                                                                    positive_partial_match.events,
-                                                                   unbounded_negative_partial_match.events)
+                                                                   new_partial_match.events)
             if not self._validate_new_match(combined_event_list):
                 # this positive match should still be kept
                 matches_to_keep.append(positive_partial_match)
@@ -242,15 +240,22 @@ class NegativeSeqNode(NegationNode):
         self._event_defs = merge(positive_event_defs, negative_event_defs, key=lambda x: x.index)
         self._positive_event_defs = positive_event_defs
 
+    def is_sequence_ordered(self):
+        # the positive events are propagated unchanged, and are only validated against the negative ones if such exist
+        return self._positive_subtree.is_sequence_ordered()
+
     def _validate_new_match(self, events_for_new_match: List[Event]):
-        if not is_sorted(events_for_new_match, key=lambda x: x.timestamp):
+        if not is_sorted(events_for_new_match, key=lambda x: x.timestamp_ns):
             return False
         return super()._validate_new_match(events_for_new_match)
 
+    def create_parent_to_info_dict(self):
+        super().create_parent_to_info_dict()
+        self._init_merge_permutations()
+
     def _merge_events_for_new_match(self,
                                     first_event_defs: List[PrimitiveEventDefinition],
                                     second_event_defs: List[PrimitiveEventDefinition],
                                     first_event_list: List[Event],
                                     second_event_list: List[Event]):
-        return merge_according_to(first_event_defs, second_event_defs,
-                                  first_event_list, second_event_list, key=lambda x: x.index)
+        return self._merge_events_by_index(first_event_defs, second_event_defs, first_event_list, second_event_list)
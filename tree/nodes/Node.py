@@ -1,10 +1,12 @@
 from abc import ABC
-from datetime import timedelta, datetime
-from queue import Queue
+from datetime import timedelta
+from collections import deque
+from heapq import heappush, heappop
+from itertools import count
 from typing import List, Set, Optional
 from dataclasses import dataclass
 
-from base.Event import Event
+from base.Event import Event, timedelta_to_nanoseconds, nanoseconds_to_timedelta
 from condition.Condition import RelopTypes, EquationSides
 from condition.CompositeCondition import CompositeCondition, AndCondition
 from base.PatternMatch import PatternMatch
@@ -58,20 +60,27 @@ class Node(ABC):
     ###################################### Initialization
     def __init__(self, pattern_params: PatternParameters, parents, pattern_ids: int or Set[int] = None):
         self._parents = []
-        self._sliding_window = pattern_params.window
+        # the window is kept in nanoseconds to be compared with the timestamps of the events and the partial matches
+        self._sliding_window = timedelta_to_nanoseconds(pattern_params.window)
         self._confidence = pattern_params.confidence
         self._partial_matches = None
         self._condition = AndCondition()
+        # the condition of this node compiled into a function operating directly on the events of a partial match, or
+        # None if the condition could not be compiled
+        self._compiled_condition = None
 
         # Full pattern matches that were not yet reported. Only relevant for an output node, that is, for a node
         # corresponding to a full pattern definition.
-        self._unreported_matches = Queue()
+        self._unreported_matches = deque()
         self._is_output_node = False
 
         # set of event types that will only appear in a single full match
         self._single_event_types = set()
         # events that were added to a partial match and cannot be added again
         self._filtered_events = set()
+        # the filtered events ordered by their timestamps, allowing to remove the expired ones incrementally
+        self.__filtered_events_expiration_index = []
+        self.__filtered_events_counter = count()
 
         # set of pattern IDs with which this node is associated
         if pattern_ids is None:
@@ -83,8 +92,6 @@ class Node(ABC):
         # Maps parent to event definition. This field helps to pass the parents a partial match with
         # the right event definitions.
         self._parent_to_info_dict = {}
-        # matches that were not yet pushed to the parents for further processing
-        self._parent_to_unhandled_queue_dict = {}
 
         self.set_parents(parents, on_init=True)
 
@@ -94,16 +101,15 @@ class Node(ABC):
         Removes and returns an unreported match buffered at this node.
         Used in an output node to collect full pattern matches.
         """
-        ret = self._unreported_matches.get()
-        return ret
+        return self._unreported_matches.popleft()
 
     def has_unreported_matches(self):
         """
         Returns True if this node contains any matches we did not report yet and False otherwise.
         """
-        return self._unreported_matches.qsize() > 0
+        return len(self._unreported_matches) > 0
 
-    def clean_expired_partial_matches(self, last_timestamp: datetime):
+    def clean_expired_partial_matches(self, last_timestamp: int):
         """
         Removes partial matches whose earliest timestamp violates the time window constraint.
         Also removes the expired filtered events if the "single" consumption policy is enabled.
@@ -114,21 +120,26 @@ class Node(ABC):
         if len(self._single_event_types) == 0:
             # "single" consumption policy is disabled or no event types under the policy reach this node
             return
-        self._filtered_events = set([event for event in self._filtered_events
-                                    if event.timestamp >= last_timestamp - self._sliding_window])
+        expiration_timestamp = last_timestamp - self._sliding_window
+        expiration_index = self.__filtered_events_expiration_index
+        while len(expiration_index) > 0 and expiration_index[0][0] < expiration_timestamp:
+            _, _, event = heappop(expiration_index)
+            self._filtered_events.discard(event)
 
     def _add_partial_match(self, pm: PatternMatch):
         """
-        Registers a new partial match at this node.
+        Registers a new partial match at this node and hands it directly to the parents.
         In case of SortedPatternMatchStorage the insertion is by timestamp or condition, O(log n).
+        In case of BlockedSortedPatternMatchStorage the insertion only shifts a single block of the storage.
         In case of UnsortedPatternMatchStorage the insertion is directly at the end, O(1).
         """
         self._partial_matches.add(pm)
         for parent in self._parents:
-            self._parent_to_unhandled_queue_dict[parent].put(pm)
-            parent.handle_new_partial_match(self)
+            parent.handle_new_partial_match(self, pm)
         if self.is_output_node():
-            self._unreported_matches.put(pm)
+            # full pattern matches are handed to the user, hence their events are merged once and kept
+            pm.materialize_events()
+            self._unreported_matches.append(pm)
 
     def __can_add_partial_match(self, pm: PatternMatch) -> bool:
         """
@@ -156,7 +167,10 @@ class Node(ABC):
             else:
                 # this event was not yet passed but should only be passed once - remember it
                 new_filtered_events.add(event)
-        self._filtered_events |= new_filtered_events
+        for event in new_filtered_events:
+            self._filtered_events.add(event)
+            heappush(self.__filtered_events_expiration_index,
+                     (event.timestamp_ns, next(self.__filtered_events_counter), event))
         return True
 
     def _validate_and_propagate_partial_match(self, events: List[Event], match_probability: float = None):
@@ -173,10 +187,56 @@ class Node(ABC):
         Receives an already verified list of events for new partial match and propagates it up the tree.
         For probabilistic streams, receives the pre-calculated probability of the potential pattern match.
         """
-        new_partial_match = PatternMatch(events, match_probability)
+        self._propagate_new_partial_match(PatternMatch(events, match_probability))
+
+    def _propagate_new_partial_match(self, new_partial_match: PatternMatch):
+        """
+        Receives an already verified partial match and propagates it up the tree.
+        """
         if self.__can_add_partial_match(new_partial_match):
             self._add_partial_match(new_partial_match)
 
+    def _store_partial_match(self, events: List[Event], match_probability: float = None):
+        """
+        Creates a new partial match from the list of events and stores it at this node if it is valid. Unlike
+        _validate_and_propagate_partial_match, the new partial match is neither handed to the parents nor reported.
+        """
+        if not self._validate_new_match(events):
+            return
+        new_partial_match = PatternMatch(events, match_probability)
+        if self.__can_add_partial_match(new_partial_match):
+            self._partial_matches.add(new_partial_match)
+
+    def import_partial_matches(self, source_node):
+        """
+        Copies the partial matches stored at the given node into the storage of this node. The given node must collect
+        the same events as this node, possibly in a different order, in which case the events of each partial match are
+        reordered according to the event definitions of this node.
+        The partial matches are inserted by their order of arrival and are not propagated to the parents.
+        """
+        source_names = [event_def.name for event_def in source_node.get_event_definitions()]
+        target_names = [event_def.name for event_def in self.get_event_definitions()]
+        positions = [source_names.index(name) for name in target_names]
+        is_same_order = positions == list(range(len(positions)))
+        for pm in sorted(source_node.get_storage_unit(), key=Node._get_partial_match_arrival_key):
+            if not is_same_order:
+                pm = PatternMatch([pm.events[position] for position in positions], pm.probability)
+            self._partial_matches.add(pm)
+
+    def rebuild_partial_matches(self):
+        """
+        Reconstructs the partial matches of this node from the partial matches currently stored at its children.
+        To be implemented by subclasses supporting it.
+        """
+        raise NotImplementedError()
+
+    @staticmethod
+    def _get_partial_match_arrival_key(pm: PatternMatch):
+        """
+        Returns a key ordering the partial matches by their time of creation, which is the arrival of their latest event.
+        """
+        return max(event.index for event in pm.events)
+
     def get_partial_matches(self, filter_value: int or float = None):
         """
         Returns only partial matches that can be a good fit the partial match identified by the given filter value.
@@ -188,18 +248,12 @@ class Node(ABC):
         """
         Validates the condition stored in this node on the given set of events.
         """
-        min_timestamp = min([event.timestamp for event in events_for_new_match])
-        max_timestamp = max([event.timestamp for event in events_for_new_match])
+        min_timestamp = min(event.timestamp_ns for event in events_for_new_match)
+        max_timestamp = max(event.timestamp_ns for event in events_for_new_match)
         return max_timestamp - min_timestamp <= self._sliding_window
 
 
     ###################################### Parent- and topology-related methods
-    def get_last_unhandled_partial_match_by_parent(self, parent):
-        """
-        Returns the last partial match buffered at this node and not yet transferred to parent.
-        """
-        return self._parent_to_unhandled_queue_dict[parent].get(block=False)
-
     def set_parents(self, parents, on_init: bool = False):
         """
         Sets the parents of this node to the given list of nodes. Providing None as the parameter will render
@@ -211,7 +265,6 @@ class Node(ABC):
             # a single parent was specified
             parents = [parents]
         self._parents = []
-        self._parent_to_unhandled_queue_dict = {}
         self._parent_to_info_dict = {}
         for parent in parents:
             self.add_parent(parent, on_init)
@@ -230,7 +283,6 @@ class Node(ABC):
         if parent in self._parents:
             return
         self._parents.append(parent)
-        self._parent_to_unhandled_queue_dict[parent] = Queue()
         if not on_init:
             self._parent_to_info_dict[parent] = self.get_positive_event_definitions()
 
@@ -293,11 +345,18 @@ class Node(ABC):
         """
         return self.get_event_definitions()
 
+    def is_sequence_ordered(self):
+        """
+        Returns True if the events of each partial match of this node are sorted by their timestamps and correspond
+        one-to-one to the positive event definitions of this node, and False otherwise.
+        """
+        return False
+
     def get_basic_filtering_parameters(self):
         """
         Returns the basic filtering parameters (sliding window and confidence threshold as of now).
         """
-        return PatternParameters(self._sliding_window, self._confidence)
+        return PatternParameters(nanoseconds_to_timedelta(self._sliding_window), self._confidence)
 
 
     ###################################### Miscellaneous
@@ -320,6 +379,15 @@ class Node(ABC):
         names = {event_def.name for event_def in self.get_event_definitions()}
         self._condition = condition.get_condition_of(names, get_kleene_closure_conditions=False,
                                                      consume_returned_conditions=True)
+        self._compile_condition()
+
+    def _compile_condition(self):
+        """
+        Compiles the condition of this node according to the positions of the events in the partial matches of this
+        node. If the compilation fails, the condition will be evaluated using a binding of the event names instead.
+        """
+        event_positions = {event_def.name: i for i, event_def in enumerate(self.get_event_definitions())}
+        self._compiled_condition = self._condition.compile(event_positions)
 
     def get_first_unbounded_negative_node(self):
         """
@@ -337,9 +405,10 @@ class Node(ABC):
         Each parameter is only set if it is less restrictive than the currently defined one.
         """
         should_propagate = False
-        if pattern_params.window > self._sliding_window:
+        sliding_window = timedelta_to_nanoseconds(pattern_params.window)
+        if sliding_window > self._sliding_window:
             should_propagate = True
-            self._sliding_window = pattern_params.window
+            self._sliding_window = sliding_window
         if self._confidence is not None and \
                 (pattern_params.confidence is None or pattern_params.confidence > self._confidence):
             should_propagate = True
@@ -1,8 +1,9 @@
 from typing import List
 
 from base.Event import Event
+from base.PatternMatch import PatternMatch
 from condition.Condition import RelopTypes, EquationSides
-from misc.Utils import merge, merge_according_to, is_sorted
+from misc.Utils import merge, is_sorted
 from tree.nodes.BinaryNode import BinaryNode
 from tree.nodes.Node import PrimitiveEventDefinition
 from tree.PatternMatchStorage import TreeStorageParameters
@@ -19,19 +20,61 @@ class SeqNode(BinaryNode):
                                right_event_defs: List[PrimitiveEventDefinition]):
         self._event_defs = merge(left_event_defs, right_event_defs, key=lambda x: x.index)
 
+    def create_parent_to_info_dict(self):
+        super().create_parent_to_info_dict()
+        self._init_merge_permutations()
+
     def _merge_events_for_new_match(self,
                                     first_event_defs: List[PrimitiveEventDefinition],
                                     second_event_defs: List[PrimitiveEventDefinition],
                                     first_event_list: List[Event],
                                     second_event_list: List[Event]):
-        return merge_according_to(first_event_defs, second_event_defs,
-                                  first_event_list, second_event_list, key=lambda x: x.index)
+        return self._merge_events_by_index(first_event_defs, second_event_defs, first_event_list, second_event_list)
 
     def _validate_new_match(self, events_for_new_match: List[Event]):
-        if not is_sorted(events_for_new_match, key=lambda x: x.timestamp):
+        if not is_sorted(events_for_new_match, key=lambda x: x.timestamp_ns):
             return False
         return super()._validate_new_match(events_for_new_match)
 
+    def _init_join_validation(self):
+        """
+        In addition to the information calculated by the base class, locates the pairs of adjacent positions in a joined
+        partial match at which the events alternate between the left and the right partial matches. If the partial
+        matches of both subtrees are sorted, so is the joined partial match if and only if the events at these
+        positions are, which is verified without merging the events of the partial matches.
+        """
+        super()._init_join_validation()
+        self.__left_event_defs = self._left_subtree.get_event_definitions_by_parent(self)
+        self.__right_event_defs = self._right_subtree.get_event_definitions_by_parent(self)
+        if not self._left_subtree.is_sequence_ordered() or not self._right_subtree.is_sequence_ordered():
+            self.__order_boundaries = None
+            return
+        # each position is represented by the side of the partial match (0 for left, 1 for right) and the event index
+        positions = merge([(event_def.index, 0, i) for i, event_def in enumerate(self.__left_event_defs)],
+                          [(event_def.index, 1, i) for i, event_def in enumerate(self.__right_event_defs)],
+                          key=lambda x: x[0])
+        self.__order_boundaries = [(first_side, first_position, second_side, second_position)
+                                   for (_, first_side, first_position), (_, second_side, second_position)
+                                   in zip(positions, positions[1:]) if first_side != second_side]
+
+    def _validate_partial_matches_join(self, left_partial_match: PatternMatch, right_partial_match: PatternMatch):
+        if not super()._validate_partial_matches_join(left_partial_match, right_partial_match):
+            return False
+        if self.__order_boundaries is None:
+            events_for_new_match = self._merge_events_for_new_match(self.__left_event_defs, self.__right_event_defs,
+                                                                    left_partial_match.events,
+                                                                    right_partial_match.events)
+            return is_sorted(events_for_new_match, key=lambda x: x.timestamp_ns)
+        partial_matches = (left_partial_match, right_partial_match)
+        for first_side, first_position, second_side, second_position in self.__order_boundaries:
+            if partial_matches[first_side].get_event(first_position).timestamp_ns > \
+                    partial_matches[second_side].get_event(second_position).timestamp_ns:
+                return False
+        return True
+
+    def is_sequence_ordered(self):
+        return True
+
     def get_structure_summary(self):
         return ("Seq",
                 self._left_subtree.get_structure_summary(),
@@ -81,8 +124,8 @@ class SeqNode(BinaryNode):
             left_sort, right_sort, rel_op = 0, 0, RelopTypes.GreaterEqual
         if rel_op is None:
             raise Exception("rel_op is None, something bad has happened")
-        left_sorting_key = lambda pm: pm.events[left_sort].timestamp
-        right_sorting_key = lambda pm: pm.events[right_sort].timestamp
+        left_sorting_key = lambda pm: pm.get_event(left_sort).timestamp_ns
+        right_sorting_key = lambda pm: pm.get_event(right_sort).timestamp_ns
         # left/right_sort == 0 means that left/right subtree will be sorted by first timestamp
         return left_sorting_key, right_sorting_key, rel_op, (left_sort == 0), (right_sort == 0)
 